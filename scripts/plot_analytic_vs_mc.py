@@ -11,6 +11,10 @@ default grid), NOT the acceptance signal. Per-point ``within_ci`` is likewise
 diagnostic. The CLI prints PASS/FAIL from ``verified``.
 
 Run: PYTHONPATH=src:. python scripts/plot_analytic_vs_mc.py --out artifacts/analytic_vs_mc
+
+``--engine vector`` (NumPy) and ``--workers N`` give every grid point its own seed
+and run the points independently; the default (scalar, one worker) keeps the
+single-stream draws the recorded artifacts were made with.
 """
 from __future__ import annotations
 
@@ -37,19 +41,25 @@ def run(
     p_loss_values=P_LOSS_VALUES,
     n_trials=DEFAULT_N_TRIALS,
     seed=DEFAULT_SEED,
+    engine="scalar",
+    workers=1,
 ):
     """Run the dual verification grid and write JSON (+ optional plot). Returns the JSON path."""
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    rng = DeterministicRNG(seed)
-    points = dual_verification(
-        list(r_grid), list(w_grid), list(p_loss_values), n_trials=n_trials, rng=rng
-    )
+    grid = (list(r_grid), list(w_grid), list(p_loss_values))
+    if engine == "scalar" and workers == 1:
+        points = dual_verification(*grid, n_trials=n_trials, rng=DeterministicRNG(seed))
+    else:
+        points = dual_verification(
+            *grid, n_trials=n_trials, seed=seed, engine=engine, workers=workers
+        )
     n_within = sum(1 for p in points if p.within_ci)
     n_points = len(points)
     payload = {
         "n_trials": n_trials,
         "seed": seed,
+        "engine": engine,
         "r_grid": list(r_grid),
         "w_grid": list(w_grid),
         "p_loss_values": list(p_loss_values),
@@ -117,8 +127,16 @@ def main() -> None:
     parser.add_argument("--out", default="artifacts/analytic_vs_mc", help="output directory")
     parser.add_argument("--n-trials", type=int, default=DEFAULT_N_TRIALS)
     parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--engine", choices=["scalar", "vector"], default="scalar")
+    parser.add_argument("--workers", type=int, default=1, help="process-pool size over grid points")
     args = parser.parse_args()
-    json_path = run(args.out, n_trials=args.n_trials, seed=args.seed)
+    json_path = run(
+        args.out,
+        n_trials=args.n_trials,
+        seed=args.seed,
+        engine=args.engine,
+        workers=args.workers,
+    )
     payload = json.loads(json_path.read_text())
     status = "PASS" if payload["verified"] else "FAIL"
     print(
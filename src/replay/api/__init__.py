@@ -1,4 +1,5 @@
 """FastAPI application package."""
 from .app import app, create_app, run_simulation
+from .jobs import JobLimits, JobManager
 
-__all__ = ["app", "create_app", "run_simulation"]
+__all__ = ["app", "create_app", "JobLimits", "JobManager", "run_simulation"]
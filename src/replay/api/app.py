@@ -3,21 +3,39 @@ from __future__ import annotations
 
 import os
 import subprocess
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, TypeVar
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
-from replay.contracts import LabValidationSpec, SimulationSpec, SweepSpec
+from replay.contracts import JobStatus, LabValidationSpec, SimulationSpec, SweepPoint, SweepSpec
+from replay.contracts.models import JobKind
+from replay.core import ProgressReporter
 from replay.services import (
+    ProfileKind,
+    ResultCache,
+    ResultStore,
     build_demo_artifacts,
     compare_sim_vs_hardware,
     load_artifact_manifest,
     load_experiment_artifact,
+    profile_batch,
     run_sweep,
     simulate_batch,
+    sweep_event_stream,
     validate_lab_run,
 )
 from replay.services.lab import LabValidationPathError
+from replay.services.profiling import DEFAULT_TOP
+
+from .jobs import DEFAULT_LIMITS, JobFn, JobLimits, JobManager, JobQueueFull
+
+_T = TypeVar("_T")
 
 
 def _as_bool(value: str | None, default: bool = True) -> bool:
@@ -44,8 +62,59 @@ def _parse_cors_allow_origins() -> list[str]:
     ]
 
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="Replay Research Platform", version="0.1.0")
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    return int(raw) if raw else default
+
+
+def _job_limits_from_env() -> dict[str, JobLimits]:
+    """Per-lane limits from ``REPLAY_{SIMULATION,SWEEP}_JOB_{WORKERS,MAX_PENDING}``."""
+    limits = {}
+    for kind, default in DEFAULT_LIMITS.items():
+        prefix = f"REPLAY_{kind.upper()}_JOB"
+        limits[kind] = JobLimits(
+            workers=_env_int(f"{prefix}_WORKERS", default.workers),
+            max_pending=_env_int(f"{prefix}_MAX_PENDING", default.max_pending),
+        )
+    return limits
+
+
+def _sweep_payload(spec: SweepSpec, points: list[SweepPoint]) -> dict[str, object]:
+    return {
+        "schema_version": spec.schema_version,
+        "generated_at": None,
+        "points": [point.model_dump(mode="json") for point in points],
+    }
+
+
+def _progress_total(spec: SimulationSpec) -> int:
+    """Units a batch's progress reports count up to (traces for hybrid/paired batches,
+    per-mode rounds for sequential stopping)."""
+    if spec.target_ci_half_width is not None:
+        return spec.max_runs
+    return spec.runs if spec.paired or spec.estimator == "hybrid" else spec.runs * len(spec.modes)
+
+
+def _default_result_cache() -> ResultCache | None:
+    """On-disk result store when ``REPLAY_RESULT_CACHE`` is enabled (off by default)."""
+    if not _as_bool(os.getenv("REPLAY_RESULT_CACHE"), default=False):
+        return None
+    return ResultStore()
+
+
+def create_app(
+    result_cache: ResultCache | None = None, job_manager: JobManager | None = None
+) -> FastAPI:
+    if result_cache is None:
+        result_cache = _default_result_cache()
+    jobs = job_manager if job_manager is not None else JobManager(_job_limits_from_env())
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        yield
+        jobs.shutdown()
+
+    app = FastAPI(title="Replay Research Platform", version="0.1.0", lifespan=lifespan)
 
     cors_allow_origins = _parse_cors_allow_origins()
     cors_allow_credentials = _as_bool(os.getenv("CORS_ALLOW_CREDENTIALS"), default=True)
@@ -66,11 +135,13 @@ def create_app() -> FastAPI:
 
     @app.post("/api/v1/simulations")
     def post_simulations(spec: SimulationSpec) -> dict[str, object]:
-        return simulate_batch(spec, show_progress=False).model_dump(mode="json")
+        return simulate_batch(spec, show_progress=False, result_cache=result_cache).model_dump(
+            mode="json"
+        )
 
     @app.post("/simulate")
     def legacy_post_simulations(spec: SimulationSpec) -> dict[str, object]:
-        batch = simulate_batch(spec, show_progress=False)
+        batch = simulate_batch(spec, show_progress=False, result_cache=result_cache)
         return {
             "config": batch.config.model_dump(mode="json"),
             "results": [entry.model_dump(mode="json") for entry in batch.results],
@@ -79,14 +150,85 @@ def create_app() -> FastAPI:
 
     @app.post("/api/v1/sweeps")
     def post_sweeps(spec: SweepSpec) -> dict[str, object]:
-        return {
-            "schema_version": spec.schema_version,
-            "generated_at": None,
-            "points": [
-                point.model_dump(mode="json")
-                for point in run_sweep(spec, show_progress=False)
-            ],
-        }
+        return _sweep_payload(
+            spec, run_sweep(spec, show_progress=False, result_cache=result_cache)
+        )
+
+    def _admitted(call: Callable[[], _T]) -> _T:
+        try:
+            return call()
+        except JobQueueFull as exc:
+            raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+    @app.post("/api/v1/sweeps/stream")
+    def post_sweeps_stream(spec: SweepSpec, request: Request) -> StreamingResponse:
+        sse = "text/event-stream" in request.headers.get("accept", "")
+        # 流式 sweep 在请求线程上跑，但占用 sweep lane 的一个名额，满了同样 429
+        release = _admitted(partial(jobs.reserve, "sweep"))
+
+        def stream() -> Iterator[str]:
+            try:
+                yield from sweep_event_stream(spec, result_cache=result_cache, sse=sse)
+            finally:
+                release()
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream" if sse else "application/x-ndjson",
+            # the generator's finally does not run if it is never started
+            background=BackgroundTask(release),
+        )
+
+    def _submit(kind: JobKind, fn: JobFn, total: int) -> JobStatus:
+        return _admitted(partial(jobs.submit, kind, fn, total=total))
+
+    @app.post("/api/v1/jobs/simulations", status_code=202)
+    def post_simulation_job(
+        spec: SimulationSpec, profile: ProfileKind | None = None, profile_top: int = DEFAULT_TOP
+    ) -> JobStatus:
+        if profile_top < 1:
+            raise HTTPException(status_code=422, detail="profile_top must be >= 1")
+
+        def run(progress: ProgressReporter) -> dict[str, Any]:
+            if profile is not None:
+                # the raw profile stays on the server under REPLAY_PROFILE_DIR, trimmed to
+                # REPLAY_PROFILE_MAX_BYTES per kind
+                batch = profile_batch(spec, profile, top=profile_top, progress=progress)
+            else:
+                batch = simulate_batch(
+                    spec, show_progress=False, result_cache=result_cache, progress=progress
+                )
+            return batch.model_dump(mode="json")
+
+        return _submit("simulation", run, total=_progress_total(spec))
+
+    @app.post("/api/v1/jobs/sweeps", status_code=202)
+    def post_sweep_job(spec: SweepSpec) -> JobStatus:
+        def run(progress: ProgressReporter) -> dict[str, Any]:
+            points = run_sweep(
+                spec, show_progress=False, result_cache=result_cache, progress=progress
+            )
+            return _sweep_payload(spec, points)
+
+        return _submit("sweep", run, total=len(spec.values) * len(spec.simulation.modes))
+
+    @app.get("/api/v1/jobs")
+    def get_jobs() -> list[JobStatus]:
+        return jobs.jobs()
+
+    @app.get("/api/v1/jobs/{job_id}")
+    def get_job(job_id: str) -> JobStatus:
+        try:
+            return jobs.get(job_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=f"unknown job {job_id}") from exc
+
+    @app.delete("/api/v1/jobs/{job_id}")
+    def delete_job(job_id: str) -> JobStatus:
+        try:
+            return jobs.cancel(job_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=f"unknown job {job_id}") from exc
 
     @app.post("/api/v1/lab/validations")
     def post_lab_validations(spec: LabValidationSpec) -> dict[str, object]:
@@ -0,0 +1,228 @@
+"""Background job execution for long simulation and sweep requests.
+
+Each job kind runs on its own bounded thread pool ("lane") with its own
+admission limit, so a few heavy sweeps queue behind each other instead of
+occupying the workers that serve interactive simulations. Submissions beyond a
+lane's ``max_pending`` (queued + running) are rejected with ``JobQueueFull``,
+which the app maps to HTTP 429. Work served inline on a request thread (a
+streamed sweep) takes a slot of its lane through ``reserve`` for as long as it
+runs, so it is admitted against the same limit.
+
+Cancelling a queued job drops it. A running job is marked
+``cancel_requested`` and stops at its next progress report, where its reporter
+raises ``JobCancelled``: a sweep after its next completed cell, a simulation
+batch after its next run, worker shard or sequential-stopping round. Shards
+still queued on the batch's process pool are cancelled rather than awaited.
+"""
+from __future__ import annotations
+
+import threading
+import uuid
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+from replay.contracts import JobStatus
+from replay.contracts.models import JobKind
+from replay.core import ProgressReporter, ProgressUpdate
+
+JobFn = Callable[[ProgressReporter], dict[str, Any]]
+
+_FINISHED = frozenset({"succeeded", "failed", "cancelled"})
+
+
+class JobQueueFull(RuntimeError):
+    """The lane for this job kind already holds ``max_pending`` jobs."""
+
+
+class JobCancelled(Exception):
+    """Raised from a job's progress reporter once cancellation was requested."""
+
+
+@dataclass(frozen=True)
+class JobLimits:
+    """Worker threads and admission limit (queued + running jobs) of one lane."""
+
+    workers: int = 1
+    max_pending: int = 8
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError(f"workers must be >= 1, got {self.workers!r}")
+        if self.max_pending < self.workers:
+            raise ValueError(
+                f"max_pending must be >= workers, got {self.max_pending!r} < {self.workers!r}"
+            )
+
+
+DEFAULT_LIMITS: dict[str, JobLimits] = {
+    "simulation": JobLimits(workers=2, max_pending=16),
+    "sweep": JobLimits(workers=1, max_pending=4),
+}
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _JobProgress:
+    """``ProgressReporter`` that mirrors updates into a job's ``completed``/``total``
+    (summed over labels, e.g. one per mode) and raises ``JobCancelled`` once the
+    job's cancellation has been requested."""
+
+    min_interval = 0.2
+
+    def __init__(self, lock: threading.Lock, job: JobStatus) -> None:
+        self._lock = lock
+        self._job = job
+        self._latest: dict[str, ProgressUpdate] = {}
+
+    def start(self, title: str) -> None:
+        self._check()
+
+    def update(self, update: ProgressUpdate) -> None:
+        self._latest[update.label] = update
+        with self._lock:
+            self._job.completed = sum(entry.completed for entry in self._latest.values())
+            self._job.total = max(
+                self._job.total, sum(entry.total for entry in self._latest.values())
+            )
+        self._check()
+
+    def finish(self) -> None:
+        pass
+
+    def _check(self) -> None:
+        with self._lock:
+            if self._job.cancel_requested:
+                raise JobCancelled(self._job.job_id)
+
+
+class JobManager:
+    """Job registry plus one ``ThreadPoolExecutor`` per job kind.
+
+    Finished jobs stay pollable until more than ``max_retained`` have
+    accumulated; the oldest are then forgotten."""
+
+    def __init__(
+        self, limits: Mapping[str, JobLimits] | None = None, *, max_retained: int = 256
+    ) -> None:
+        self._limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self._executors = {
+            kind: ThreadPoolExecutor(max_workers=lane.workers, thread_name_prefix=f"replay-{kind}")
+            for kind, lane in self._limits.items()
+        }
+        self._max_retained = max_retained
+        self._lock = threading.Lock()
+        self._jobs: dict[str, JobStatus] = {}
+        self._futures: dict[str, Future[None]] = {}
+        self._inline = {kind: 0 for kind in self._limits}
+
+    def submit(self, kind: JobKind, fn: JobFn, *, total: int = 0) -> JobStatus:
+        """Queue ``fn(progress)``; its return value becomes the job's ``result``."""
+        with self._lock:
+            self._admit(kind)
+            status = JobStatus(job_id=uuid.uuid4().hex, kind=kind, total=total)
+            self._jobs[status.job_id] = status
+            self._forget_finished()
+            self._futures[status.job_id] = self._executors[kind].submit(
+                self._run, status.job_id, fn
+            )
+            return status.model_copy()
+
+    def reserve(self, kind: JobKind) -> Callable[[], None]:
+        """Hold one slot of ``kind``'s lane for work run outside the lane.
+
+        Raises ``JobQueueFull`` like ``submit``. The slot counts towards
+        ``max_pending`` until the returned callable is called (calling it again
+        is a no-op)."""
+        with self._lock:
+            self._admit(kind)
+            self._inline[kind] += 1
+        released = threading.Event()
+
+        def release() -> None:
+            with self._lock:
+                if not released.is_set():
+                    released.set()
+                    self._inline[kind] -= 1
+
+        return release
+
+    def get(self, job_id: str) -> JobStatus:
+        """Snapshot of the job; raises ``KeyError`` for unknown (or forgotten) ids."""
+        with self._lock:
+            return self._jobs[job_id].model_copy()
+
+    def jobs(self) -> list[JobStatus]:
+        """Snapshots of every retained job without their results, oldest first."""
+        with self._lock:
+            return [job.model_copy(update={"result": None}) for job in self._jobs.values()]
+
+    def cancel(self, job_id: str) -> JobStatus:
+        with self._lock:
+            job = self._jobs[job_id]
+            if job.state not in _FINISHED:
+                job.cancel_requested = True
+                if self._futures[job_id].cancel():
+                    self._finish(job, "cancelled")
+            return job.model_copy()
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Cancel queued jobs and stop the lanes (running jobs finish in the background)."""
+        with self._lock:
+            for job_id, job in self._jobs.items():
+                if job.state == "queued" and self._futures[job_id].cancel():
+                    job.cancel_requested = True
+                    self._finish(job, "cancelled")
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+
+    def _admit(self, kind: JobKind) -> None:
+        if kind not in self._executors:
+            raise ValueError(f"unknown job kind {kind!r}")
+        pending = self._inline[kind] + sum(
+            1 for job in self._jobs.values() if job.kind == kind and job.state not in _FINISHED
+        )
+        if pending >= self._limits[kind].max_pending:
+            raise JobQueueFull(
+                f"{kind} queue is full ({pending}/{self._limits[kind].max_pending} jobs)"
+            )
+
+    def _run(self, job_id: str, fn: JobFn) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.state = "running"
+            job.started_at = _utc_now()
+
+        try:
+            result = fn(_JobProgress(self._lock, job))
+        except JobCancelled:
+            with self._lock:
+                self._finish(job, "cancelled")
+        except Exception as exc:  # noqa: BLE001 - surfaced to the client as job.error
+            with self._lock:
+                job.error = f"{type(exc).__name__}: {exc}"
+                self._finish(job, "failed")
+        else:
+            with self._lock:
+                if job.cancel_requested:
+                    self._finish(job, "cancelled")
+                else:
+                    job.result = result
+                    job.completed = job.total
+                    self._finish(job, "succeeded")
+
+    def _finish(
+        self, job: JobStatus, state: Literal["succeeded", "failed", "cancelled"]
+    ) -> None:
+        job.state = state
+        job.finished_at = _utc_now()
+        self._futures.pop(job.job_id, None)
+
+    def _forget_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.state in _FINISHED]
+        for job_id in finished[: max(0, len(finished) - self._max_retained)]:
+            del self._jobs[job_id]
@@ -0,0 +1,56 @@
+"""Benchmark suites for the simulator (``replay bench`` / ``replay bench --micro``)."""
+from __future__ import annotations
+
+from .macro import (
+    DEFAULT_BASELINE,
+    DEFAULT_THRESHOLD,
+    CaseComparison,
+    MacroCase,
+    MacroResult,
+    build_baseline,
+    compare_results,
+    format_report,
+    has_failures,
+    load_baseline,
+    macro_cases,
+    run_case,
+    run_macro_suite,
+    select_cases,
+    write_baseline,
+)
+from .micro import (
+    MicroCase,
+    MicroResult,
+    format_micro_table,
+    micro_cases,
+    run_micro_suite,
+    select_micro_cases,
+    suite_payload,
+    time_case,
+)
+
+__all__ = [
+    "build_baseline",
+    "CaseComparison",
+    "compare_results",
+    "DEFAULT_BASELINE",
+    "DEFAULT_THRESHOLD",
+    "format_micro_table",
+    "format_report",
+    "has_failures",
+    "load_baseline",
+    "macro_cases",
+    "MacroCase",
+    "MacroResult",
+    "micro_cases",
+    "MicroCase",
+    "MicroResult",
+    "run_case",
+    "run_macro_suite",
+    "run_micro_suite",
+    "select_cases",
+    "select_micro_cases",
+    "suite_payload",
+    "time_case",
+    "write_baseline",
+]
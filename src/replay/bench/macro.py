@@ -0,0 +1,294 @@
+"""End-to-end macro benchmarks: whole ``simulate_batch`` calls per scenario.
+
+The suite covers every ``Mode`` under both attack modes, live vs paired
+engines, the three channel models, and large ``num_legit`` / window sizes.
+Each case reports its best runs/sec over ``repeat`` timings and its peak RSS.
+By default every case runs in a fresh process, so RSS is per case rather than
+the high-water mark of the whole suite.
+
+Results are written to a versioned JSON baseline (``SCHEMA_VERSION`` plus
+``ENGINE_VERSION`` and the host) and compared with the previous one. A case
+regresses when its throughput drops, or its peak RSS grows, by more than
+``threshold``.
+"""
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from replay.contracts import SimulationSpec
+from replay.core import ENGINE_VERSION, AttackMode, Mode
+from replay.core.disk_cache import atomic_write
+from replay.services.simulation import simulate_batch
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+# Bump whenever case definitions or the baseline layout change.
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_BASELINE = Path("benchmarks") / "macro_baseline.json"
+
+
+@dataclass(frozen=True)
+class MacroCase:
+    """One named scenario; ``spec`` holds a single mode."""
+
+    name: str
+    spec: SimulationSpec
+
+    @property
+    def runs(self) -> int:
+        return self.spec.runs * len(self.spec.modes)
+
+
+@dataclass(frozen=True)
+class MacroResult:
+    name: str
+    runs: int
+    seconds: float
+    runs_per_sec: float
+    peak_rss_kib: int | None
+
+
+@dataclass(frozen=True)
+class CaseComparison:
+    name: str
+    current: MacroResult | None
+    baseline: MacroResult | None
+    throughput_change: float | None
+    rss_change: float | None
+    status: str  # "ok" | "regression" | "new" | "missing" | "skipped"
+
+
+def _trace_pattern(length: int = 97) -> list[bool]:
+    # deterministic bursty loss: three lost frames every 97
+    return [index % 97 in (11, 12, 13) for index in range(length)]
+
+
+def macro_cases(scale: float = 1.0) -> list[MacroCase]:
+    """The suite; ``scale`` multiplies every case's run count (min 1)."""
+    if scale <= 0:
+        raise ValueError(f"scale must be > 0, got {scale!r}")
+
+    def case(name: str, runs: int, **fields: Any) -> MacroCase:
+        fields.setdefault("modes", [Mode.WINDOW])
+        spec = SimulationSpec(runs=max(1, round(runs * scale)), seed=20260601, **fields)
+        return MacroCase(name, spec)
+
+    cases = [
+        case(f"mode/{mode.value}/{attack.value}", 200, modes=[mode], attack_mode=attack)
+        for mode in Mode
+        for attack in AttackMode
+    ]
+    cases += [
+        case("engine/live", 200, p_loss=0.1, p_reorder=0.1),
+        case("engine/paired", 200, p_loss=0.1, p_reorder=0.1, paired=True),
+        case("channel/iid", 200, p_loss=0.1, channel_model="iid"),
+        case("channel/gilbert_elliott", 200, channel_model="gilbert_elliott"),
+        case("channel/trace", 200, channel_model="trace", loss_trace=_trace_pattern()),
+        case("large/num_legit_2000", 10, num_legit=2000, num_replay=200),
+        case("large/window_1024", 10, num_legit=2000, num_replay=200, window_size=1024),
+        case(
+            "large/hsw_cr_window_1024",
+            10,
+            modes=[Mode.HSW_CR],
+            num_legit=2000,
+            num_replay=200,
+            window_size=1024,
+        ),
+    ]
+    return cases
+
+
+def select_cases(cases: Iterable[MacroCase], patterns: Sequence[str] | None) -> list[MacroCase]:
+    """Cases whose name matches any of the ``fnmatch`` ``patterns`` (all when empty)."""
+    if not patterns:
+        return list(cases)
+    return [case for case in cases if any(fnmatch.fnmatch(case.name, p) for p in patterns)]
+
+
+def _peak_rss_kib() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS
+
+
+def _measure(spec: SimulationSpec, repeat: int) -> tuple[float, int | None]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        simulate_batch(spec)
+        best = min(best, time.perf_counter() - start)
+    return best, _peak_rss_kib()
+
+
+def run_case(case: MacroCase, *, repeat: int = 3, isolate: bool = True) -> MacroResult:
+    """Best-of-``repeat`` timing of ``case``; ``isolate`` runs it in a fresh process."""
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1, got {repeat!r}")
+    if isolate:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            seconds, rss = executor.submit(_measure, case.spec, repeat).result()
+    else:
+        seconds, rss = _measure(case.spec, repeat)
+    return MacroResult(
+        name=case.name,
+        runs=case.runs,
+        seconds=seconds,
+        runs_per_sec=case.runs / seconds if seconds > 0 else 0.0,
+        peak_rss_kib=rss,
+    )
+
+
+def run_macro_suite(
+    cases: Iterable[MacroCase],
+    *,
+    repeat: int = 3,
+    isolate: bool = True,
+    on_result: Callable[[MacroResult], None] | None = None,
+) -> list[MacroResult]:
+    results = []
+    for case in cases:
+        result = run_case(case, repeat=repeat, isolate=isolate)
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    return results
+
+
+def build_baseline(results: Iterable[MacroResult], *, scale: float, repeat: int) -> dict[str, Any]:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "engine_version": ENGINE_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "host": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "scale": scale,
+        "repeat": repeat,
+        "cases": {result.name: asdict(result) for result in results},
+    }
+
+
+def write_baseline(path: str | Path, baseline: dict[str, Any]) -> Path:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(baseline, indent=2, sort_keys=True) + "\n"
+    atomic_write(target, payload.encode("utf-8"))
+    return target
+
+
+def load_baseline(path: str | Path) -> dict[str, Any] | None:
+    """The baseline at ``path``; ``None`` if absent. Raises ``ValueError`` for
+    files written under another ``SCHEMA_VERSION``."""
+    target = Path(path)
+    if not target.is_file():
+        return None
+    baseline = json.loads(target.read_text(encoding="utf-8"))
+    if baseline.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(
+            f"{target} has schema_version {baseline.get('schema_version')!r}, "
+            f"expected {SCHEMA_VERSION}; re-record it with --update-baseline"
+        )
+    return baseline
+
+
+def _relative(current: float | None, previous: float | None) -> float | None:
+    if current is None or not previous:
+        return None
+    return current / previous - 1.0
+
+
+def compare_results(
+    results: Iterable[MacroResult],
+    baseline: dict[str, Any] | None,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    full_suite: bool = False,
+) -> list[CaseComparison]:
+    """Per-case comparison against ``baseline`` (all ``new`` when it is ``None``).
+
+    Baseline cases not measured this time are ``missing`` when ``full_suite``
+    ran, which ``has_failures`` counts, and merely ``skipped`` after a subset."""
+    if threshold < 0:
+        raise ValueError(f"threshold must be >= 0, got {threshold!r}")
+    previous = {
+        name: MacroResult(**entry) for name, entry in (baseline or {}).get("cases", {}).items()
+    }
+    comparisons = []
+    for result in results:
+        old = previous.pop(result.name, None)
+        if old is None:
+            comparisons.append(CaseComparison(result.name, result, None, None, None, "new"))
+            continue
+        throughput = _relative(result.runs_per_sec, old.runs_per_sec)
+        rss = _relative(
+            None if result.peak_rss_kib is None else float(result.peak_rss_kib),
+            None if old.peak_rss_kib is None else float(old.peak_rss_kib),
+        )
+        regressed = (throughput is not None and throughput < -threshold) or (
+            rss is not None and rss > threshold
+        )
+        comparisons.append(
+            CaseComparison(
+                result.name, result, old, throughput, rss, "regression" if regressed else "ok"
+            )
+        )
+    absent = "missing" if full_suite else "skipped"
+    comparisons.extend(
+        CaseComparison(name, None, old, None, None, absent) for name, old in previous.items()
+    )
+    return comparisons
+
+
+def has_failures(comparisons: Iterable[CaseComparison]) -> bool:
+    """Whether any case regressed or went missing from a full-suite run."""
+    return any(row.status in ("regression", "missing") for row in comparisons)
+
+
+def _percent(value: float | None) -> str:
+    return "-" if value is None else f"{value:+.1%}"
+
+
+def format_report(comparisons: Sequence[CaseComparison], *, threshold: float) -> str:
+    header = (
+        f"{'case':<34}{'runs/s':>10}{'base':>10}{'change':>9}"
+        f"{'rss MiB':>9}{'change':>9}  status"
+    )
+    lines = [header, "-" * len(header)]
+    for row in comparisons:
+        current, old = row.current, row.baseline
+        rps = f"{current.runs_per_sec:.1f}" if current else "-"
+        base = f"{old.runs_per_sec:.1f}" if old else "-"
+        rss = (
+            f"{current.peak_rss_kib / 1024:.1f}"
+            if current and current.peak_rss_kib is not None
+            else "-"
+        )
+        lines.append(
+            f"{row.name:<34}{rps:>10}{base:>10}{_percent(row.throughput_change):>9}"
+            f"{rss:>9}{_percent(row.rss_change):>9}  {row.status}"
+        )
+    regressions = sum(1 for row in comparisons if row.status == "regression")
+    missing = sum(1 for row in comparisons if row.status == "missing")
+    lines.append(f"\n{regressions} regression(s) beyond {threshold:.0%}, {missing} missing case(s)")
+    return "\n".join(lines)
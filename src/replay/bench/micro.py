@@ -0,0 +1,344 @@
+"""Micro-benchmarks of the simulator's hot primitives, one case per parameter point.
+
+Covered: ``classify`` / ``window_commit`` / ``resync_commit_same_epoch`` over
+window sizes 1..4096; ``hmac96``, ``crit_confirm_tag``, ``compute_mac_bits``
+and a cached ``HmacAuthenticator.verify`` over tag sizes;
+``DeterministicRNG.random/randint/getrandbits``; an ``EventScheduler``
+submit + ``pop_due`` cycle over queue depths; and ``Frame.clone``.
+
+Each case's setup returns a zero-argument operation. The loop count is
+calibrated so that one sample takes at least ``min_time``; the best and
+median ns/op over ``repeat`` samples are reported. ``suite_payload`` is the
+machine-readable form, so two payloads taken before/after an optimization
+can be diffed per case.
+"""
+from __future__ import annotations
+
+import fnmatch
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
+
+from replay.core import ENGINE_VERSION, DeterministicRNG, Frame, HmacAuthenticator, TagTable
+from replay.core.kernel.acceptance import classify
+from replay.core.kernel.mac_domains import crit_confirm_tag, hmac96
+from replay.core.kernel.resync_commit import resync_commit_same_epoch
+from replay.core.kernel.window_commit import window_commit
+from replay.core.scheduler import EventScheduler
+from replay.core.security import compute_mac_bits
+
+SCHEMA_VERSION = 1
+WINDOW_SIZES = (1, 8, 64, 512, 4096)
+TAG_BITS = (32, 64, 96, 128, 256)
+QUEUE_DEPTHS = (0, 16, 256, 4096)
+RANDBITS = (1, 32, 64, 128)
+DEFAULT_MIN_TIME = 0.05
+
+_KEY = "bench-shared-key"
+Op = Callable[[], object]
+
+
+@dataclass(frozen=True)
+class MicroCase:
+    """``setup()`` builds fresh state and returns the operation to time."""
+
+    name: str
+    primitive: str
+    params: dict[str, Any]
+    setup: Callable[[], Op] = field(compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class MicroResult:
+    name: str
+    primitive: str
+    params: dict[str, Any]
+    loops: int
+    repeat: int
+    ns_per_op_best: float
+    ns_per_op_median: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1e9 / self.ns_per_op_best if self.ns_per_op_best > 0 else 0.0
+
+
+def _window_state(w: int) -> tuple[int, int]:
+    # high-water mark 10_000, every in-window counter accepted except the oldest
+    return 10_000, ((1 << w) - 1) & ~(1 << (w - 1))
+
+
+def _window_cases() -> list[MicroCase]:
+    cases = []
+    for w in WINDOW_SIZES:
+        h, mask = _window_state(w)
+        points = {"forward": h + 1, "in_window": h - (w - 1), "old": h - w - 5}
+        for label, n in points.items():
+            params = {"w": w, "n": label}
+            cases.append(
+                MicroCase(
+                    f"classify/w={w}/{label}",
+                    "classify",
+                    params,
+                    _pure(partial(classify, n, h, mask, w)),
+                )
+            )
+            if label != "old":
+                cases.append(
+                    MicroCase(
+                        f"window_commit/w={w}/{label}",
+                        "window_commit",
+                        params,
+                        _pure(partial(window_commit, n, h, mask, w)),
+                    )
+                )
+        cases.append(
+            MicroCase(
+                f"resync_commit_same_epoch/w={w}",
+                "resync_commit_same_epoch",
+                {"w": w},
+                _pure(partial(resync_commit_same_epoch, h + 100, w)),
+            )
+        )
+    return cases
+
+
+def _mac_cases() -> list[MicroCase]:
+    payload_hash = bytes(range(32))
+    cases = [
+        MicroCase(
+            "hmac96",
+            "hmac96",
+            {"tag_bits": 96},
+            _pure(partial(hmac96, _KEY, 1, 0, 0, 42, "UNLOCK", b"\x01\x02", 0)),
+        ),
+        MicroCase(
+            "crit_confirm_tag",
+            "crit_confirm_tag",
+            {"tag_bits": 96},
+            _pure(
+                partial(
+                    crit_confirm_tag,
+                    _KEY, 1, 0, 0, 42, "UNLOCK", payload_hash, 7, 3, "a1b2c3d4", 16, 2,
+                )
+            ),
+        ),
+    ]
+    for bits in TAG_BITS:
+        cases.append(
+            MicroCase(
+                f"compute_mac_bits/bits={bits}",
+                "compute_mac_bits",
+                {"tag_bits": bits},
+                _pure(partial(compute_mac_bits, 42, "UNLOCK", key=_KEY, tag_bits=bits)),
+            )
+        )
+        cases.append(
+            MicroCase(
+                f"authenticator_verify_cached/bits={bits}",
+                "HmacAuthenticator.verify",
+                {"tag_bits": bits, "table": True},
+                partial(_cached_verify, bits),
+            )
+        )
+    return cases
+
+
+def _cached_verify(bits: int) -> Op:
+    authenticator = HmacAuthenticator(_KEY, tag_bits=bits, table=TagTable())
+    tag = authenticator.tag(42, "UNLOCK")
+    return lambda: authenticator.verify(42, "UNLOCK", tag)
+
+
+def _rng_cases() -> list[MicroCase]:
+    cases = [
+        MicroCase("rng.random", "DeterministicRNG.random", {}, partial(_rng_op, "random")),
+        MicroCase(
+            "rng.randint",
+            "DeterministicRNG.randint",
+            {"a": 0, "b": 2**31 - 1},
+            partial(_rng_op, "randint", 0, 2**31 - 1),
+        ),
+    ]
+    cases += [
+        MicroCase(
+            f"rng.getrandbits/k={k}",
+            "DeterministicRNG.getrandbits",
+            {"k": k},
+            partial(_rng_op, "getrandbits", k),
+        )
+        for k in RANDBITS
+    ]
+    return cases
+
+
+def _noop() -> None:
+    return None
+
+
+def _pure(op: Op) -> Callable[[], Op]:
+    """Setup for stateless operations: always the same callable."""
+    return lambda: op
+
+
+def _rng_op(method: str, *args: int) -> Op:
+    """A fresh seeded RNG's ``method`` bound to ``args``."""
+    return partial(getattr(DeterministicRNG(1), method), *args)
+
+
+def _scheduler_cycle(depth: int) -> Op:
+    """One ``tick`` + ``submit`` of a due frame + ``pop_due`` above ``depth`` parked
+    (far-future) events, so the heap size stays constant across iterations."""
+    scheduler = EventScheduler()
+    frame = Frame(command="UNLOCK", counter=1)
+    for index in range(depth):
+        scheduler.submit(frame, delivery_tick=10**12 + index)
+
+    def cycle() -> object:
+        tick = scheduler.tick()
+        scheduler.submit(frame, delivery_tick=tick)
+        return scheduler.pop_due()
+
+    return cycle
+
+
+def _scheduler_cases() -> list[MicroCase]:
+    return [
+        MicroCase(
+            f"scheduler.submit+pop_due/depth={depth}",
+            "EventScheduler.submit+pop_due",
+            {"depth": depth},
+            partial(_scheduler_cycle, depth),
+        )
+        for depth in QUEUE_DEPTHS
+    ]
+
+
+def _clone_cases() -> list[MicroCase]:
+    normal = Frame(command="UNLOCK", counter=42, mac="ab" * 12)
+    critical = Frame(
+        command="UNLOCK",
+        counter=42,
+        mac="ab" * 12,
+        flags=Frame.FLAG_CRIT_PREPARE,
+        payload=b"x" * 64,
+        pid=7,
+        payload_hash=bytes(32),
+    )
+    return [
+        MicroCase("frame.clone/normal", "Frame.clone", {"kind": "normal"}, _pure(normal.clone)),
+        MicroCase(
+            "frame.clone/critical", "Frame.clone", {"kind": "critical"}, _pure(critical.clone)
+        ),
+    ]
+
+
+def micro_cases() -> list[MicroCase]:
+    # "overhead/noop" times an empty call: the loop + call cost included in every case
+    return [
+        MicroCase("overhead/noop", "noop", {}, _pure(_noop)),
+        *_window_cases(),
+        *_mac_cases(),
+        *_rng_cases(),
+        *_scheduler_cases(),
+        *_clone_cases(),
+    ]
+
+
+def select_micro_cases(
+    cases: Iterable[MicroCase], patterns: Sequence[str] | None
+) -> list[MicroCase]:
+    """Cases whose name matches any of the ``fnmatch`` ``patterns`` (all when empty)."""
+    if not patterns:
+        return list(cases)
+    return [case for case in cases if any(fnmatch.fnmatch(case.name, p) for p in patterns)]
+
+
+def _time_loops(op: Op, loops: int) -> float:
+    clock = time.perf_counter_ns
+    start = clock()
+    for _ in range(loops):
+        op()
+    return float(clock() - start)
+
+
+def time_case(
+    case: MicroCase, *, repeat: int = 5, min_time: float = DEFAULT_MIN_TIME
+) -> MicroResult:
+    """Calibrate loops so one sample lasts ``min_time`` seconds, then take ``repeat``
+    samples (each on fresh ``setup()`` state)."""
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1, got {repeat!r}")
+    if min_time <= 0:
+        raise ValueError(f"min_time must be > 0, got {min_time!r}")
+    target_ns = min_time * 1e9
+    loops = 1
+    while True:
+        elapsed = _time_loops(case.setup(), loops)
+        if elapsed >= target_ns or loops >= 1 << 30:
+            break
+        # jump close to the target, at most 10x per step
+        loops = min(loops * 10, max(loops * 2, int(loops * target_ns / max(elapsed, 1.0))))
+    samples = [_time_loops(case.setup(), loops) / loops for _ in range(repeat)]
+    return MicroResult(
+        name=case.name,
+        primitive=case.primitive,
+        params=dict(case.params),
+        loops=loops,
+        repeat=repeat,
+        ns_per_op_best=min(samples),
+        ns_per_op_median=statistics.median(samples),
+    )
+
+
+def run_micro_suite(
+    cases: Iterable[MicroCase],
+    *,
+    repeat: int = 5,
+    min_time: float = DEFAULT_MIN_TIME,
+    on_result: Callable[[MicroResult], None] | None = None,
+) -> list[MicroResult]:
+    results = []
+    for case in cases:
+        result = time_case(case, repeat=repeat, min_time=min_time)
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    return results
+
+
+def suite_payload(
+    results: Iterable[MicroResult], *, repeat: int, min_time: float
+) -> dict[str, Any]:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "engine_version": ENGINE_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "host": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "repeat": repeat,
+        "min_time": min_time,
+        "results": [
+            {**asdict(result), "ops_per_sec": result.ops_per_sec} for result in results
+        ],
+    }
+
+
+def format_micro_table(results: Sequence[MicroResult]) -> str:
+    header = f"{'case':<44}{'best ns/op':>12}{'median':>12}{'Mops/s':>9}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.name:<44}{result.ns_per_op_best:>12.1f}{result.ns_per_op_median:>12.1f}"
+            f"{result.ops_per_sec / 1e6:>9.2f}"
+        )
+    return "\n".join(lines)
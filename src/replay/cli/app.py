@@ -3,23 +3,48 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from dataclasses import asdict
 from pathlib import Path
 
 import yaml
 
+from replay.bench import (
+    DEFAULT_BASELINE,
+    DEFAULT_THRESHOLD,
+    build_baseline,
+    compare_results,
+    format_micro_table,
+    format_report,
+    has_failures,
+    load_baseline,
+    macro_cases,
+    micro_cases,
+    run_macro_suite,
+    run_micro_suite,
+    select_cases,
+    select_micro_cases,
+    suite_payload,
+    write_baseline,
+)
+from replay.bench.micro import DEFAULT_MIN_TIME
 from replay.contracts import LabValidationSpec, SimulationSpec, SweepSpec
-from replay.core import AttackMode, Mode
+from replay.core import AttackMode, Mode, TraceCache
 from replay.core.presets import load_preset
 from replay.services import (
+    PROFILE_KINDS,
     DeviceProfile,
+    ResultStore,
     build_demo_artifacts,
     compare_sim_vs_hardware,
+    profile_batch,
     recommend,
     run_sweep,
     simulate_batch,
+    sweep_event_stream,
     validate_lab_run,
 )
+from replay.services.profiling import DEFAULT_TOP
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -32,6 +57,23 @@ def build_parser() -> argparse.ArgumentParser:
     run_parser = sim_subparsers.add_parser("run", help="Run a simulation batch")
     _add_simulation_arguments(run_parser)
     run_parser.add_argument("--output-json", type=str, help="Optional path to dump aggregate stats")
+    diagnostics = run_parser.add_mutually_exclusive_group()
+    diagnostics.add_argument(
+        "--instrument",
+        action="store_true",
+        help="Time hot-path stages and count operations (unpaired runs; summary on stderr)",
+    )
+    diagnostics.add_argument(
+        "--profile",
+        choices=PROFILE_KINDS,
+        help="Run under cProfile (cpu) or tracemalloc (mem); summary on stderr",
+    )
+    run_parser.add_argument(
+        "--profile-output", type=str, help="Where to write the pstats/tracemalloc file"
+    )
+    run_parser.add_argument(
+        "--profile-top", type=int, default=DEFAULT_TOP, help="Hot functions/sites to summarise"
+    )
 
     sweep_parser = sim_subparsers.add_parser("sweep", help="Run a parameter sweep")
     _add_simulation_arguments(sweep_parser)
@@ -44,6 +86,11 @@ def build_parser() -> argparse.ArgumentParser:
     sweep_parser.add_argument("--fixed-p-loss", type=float)
     sweep_parser.add_argument("--fixed-p-reorder", type=float)
     sweep_parser.add_argument("--output-json", type=str, help="Optional path to dump sweep results")
+    sweep_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print one JSON line per point as it completes (NDJSON; --output-json gets the same)",
+    )
 
     artifact_parser = subparsers.add_parser("artifacts", help="Static artifact commands")
     artifact_subparsers = artifact_parser.add_subparsers(dest="artifact_command", required=True)
@@ -57,6 +104,70 @@ def build_parser() -> argparse.ArgumentParser:
 
     advise_parser = subparsers.add_parser("advise", help="Recommend defense parameters")
     advise_parser.add_argument("--profile", required=True, help="Preset/profile YAML path")
+    _add_trace_cache_argument(advise_parser)
+    _add_result_cache_argument(advise_parser)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Run the macro benchmark suite and compare with a stored baseline"
+    )
+    bench_parser.add_argument(
+        "--micro",
+        action="store_true",
+        help="Time kernel primitives instead (classify, window_commit, MACs, RNG, scheduler)",
+    )
+    bench_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help="Seconds per micro-benchmark sample (loop count is calibrated to it)",
+    )
+    bench_parser.add_argument(
+        "--json", action="store_true", help="Print the micro-benchmark payload as JSON"
+    )
+    bench_parser.add_argument(
+        "--cases", nargs="+", metavar="PATTERN", help="Only cases matching these glob patterns"
+    )
+    bench_parser.add_argument("--list", action="store_true", help="List case names and exit")
+    bench_parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply every case's run count"
+    )
+    bench_parser.add_argument("--repeat", type=int, default=3, help="Timings per case (best wins)")
+    bench_parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run cases in this process (faster; peak RSS becomes cumulative)",
+    )
+    bench_parser.add_argument(
+        "--baseline", type=str, default=str(DEFAULT_BASELINE), help="Baseline JSON path"
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative throughput drop / RSS growth counted as a regression",
+    )
+    bench_parser.add_argument(
+        "--update-baseline", action="store_true", help="Write these results as the new baseline"
+    )
+    bench_parser.add_argument("--output-json", type=str, help="Optional path to dump results")
+
+    cache_parser = subparsers.add_parser("cache", help="On-disk trace/result cache commands")
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command", required=True)
+    for name, help_text in [
+        ("info", "Show cache location, entry count and size"),
+        ("clear", "Delete every cached entry"),
+        ("prune", "Evict least-recently-used entries down to --max-bytes"),
+    ]:
+        command_parser = cache_subparsers.add_parser(name, help=help_text)
+        command_parser.add_argument("--dir", type=str, help="Cache directory")
+        command_parser.add_argument(
+            "--kind",
+            choices=["traces", "results"],
+            default="traces",
+            help="Which cache to operate on",
+        )
+        if name == "prune":
+            command_parser.add_argument("--max-bytes", type=int, required=True)
 
     return parser
 
@@ -88,6 +199,82 @@ def _add_simulation_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--loss-bad", type=float)
     parser.add_argument("--risk-high", type=float)
     parser.add_argument("--paired", action="store_true")
+    parser.add_argument(
+        "--estimator",
+        choices=["mc", "hybrid"],
+        help="hybrid: analytic LAR / a_W control-variate MC estimate of ASR where modelled",
+    )
+    parser.add_argument("--workers", type=int, help="Process-pool size for Monte Carlo runs")
+    _add_trace_cache_argument(parser)
+    _add_result_cache_argument(parser)
+
+
+def _add_trace_cache_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--trace-cache",
+        action="store_true",
+        help="Reuse paired traces from the on-disk trace cache (seeded runs only)",
+    )
+
+
+def _trace_cache_from_args(args: argparse.Namespace) -> TraceCache | None:
+    return TraceCache() if getattr(args, "trace_cache", False) else None
+
+
+def _add_result_cache_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--result-cache",
+        action="store_true",
+        help="Reuse results from the on-disk result cache (seeded runs only)",
+    )
+
+
+def _result_cache_from_args(args: argparse.Namespace) -> ResultStore | None:
+    return ResultStore() if getattr(args, "result_cache", False) else None
+
+
+def _print_instrumentation(results: list[dict]) -> None:
+    for result in results:
+        summary = result["metadata"].get("instrumentation")
+        if summary is None:
+            continue
+        print(f"\n[{result['mode']}] {summary['runs']} instrumented runs", file=sys.stderr)
+        print(f"  {'stage':<10}{'seconds':>10}{'calls':>12}{'us/call':>10}{'share':>8}",
+              file=sys.stderr)
+        for stage, row in summary["stages"].items():
+            print(
+                f"  {stage:<10}{row['seconds']:>10.4f}{row['calls']:>12}"
+                f"{row['us_per_call']:>10.2f}{row['share']:>8.1%}",
+                file=sys.stderr,
+            )
+        ops = ", ".join(f"{name}={value:.1f}" for name, value in summary["ops_per_run"].items())
+        print(f"  per run: {ops}", file=sys.stderr)
+
+
+def _print_profile(summary: dict) -> None:
+    print(
+        f"\n{summary['kind']} profile ({summary['wall_seconds']:.3f}s) written to "
+        f"{summary['output']}",
+        file=sys.stderr,
+    )
+    if summary["workers"] > 1:
+        print("  note: only the parent process was profiled (--workers > 1)", file=sys.stderr)
+    if summary["kind"] == "cpu":
+        print(f"  {'tottime':>9}{'cumtime':>9}{'calls':>10}  function", file=sys.stderr)
+        for row in summary["top"]:
+            print(
+                f"  {row['tottime']:>9.4f}{row['cumtime']:>9.4f}{row['calls']:>10}  "
+                f"{row['function']}",
+                file=sys.stderr,
+            )
+    else:
+        print(f"  peak {summary['peak_bytes'] / 1024:.1f} KiB", file=sys.stderr)
+        print(f"  {'KiB':>9}{'blocks':>9}  site", file=sys.stderr)
+        for row in summary["top"]:
+            print(
+                f"  {row['size_bytes'] / 1024:>9.1f}{row['count']:>9}  {row['site']}",
+                file=sys.stderr,
+            )
 
 
 def _add_lab_arguments(parser: argparse.ArgumentParser) -> None:
@@ -124,6 +311,8 @@ def _simulation_spec_from_args(args: argparse.Namespace) -> SimulationSpec:
         ("loss_good", "loss_good"),
         ("loss_bad", "loss_bad"),
         ("risk_high", "risk_high"),
+        ("workers", "workers"),
+        ("estimator", "estimator"),
     ]:
         value = getattr(args, arg_name, None)
         if value is not None:
@@ -142,12 +331,37 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.group == "sim" and args.sim_command == "run":
-        payload = simulate_batch(
-            _simulation_spec_from_args(args),
-            show_progress=True,
-        ).model_dump(mode="json")
+        sim_spec = _simulation_spec_from_args(args)
+        if args.instrument and (
+            sim_spec.paired
+            or sim_spec.target_ci_half_width is not None
+            or sim_spec.estimator != "mc"
+        ):
+            parser.error("--instrument is only available for unpaired, fixed-run MC batches")
+        if args.profile:
+            batch = profile_batch(
+                sim_spec,
+                args.profile,
+                output=args.profile_output,
+                top=args.profile_top,
+                show_progress=True,
+                trace_cache=_trace_cache_from_args(args),
+            )
+        else:
+            batch = simulate_batch(
+                sim_spec,
+                show_progress=True,
+                trace_cache=_trace_cache_from_args(args),
+                result_cache=_result_cache_from_args(args),
+                instrument=args.instrument,
+            )
+        payload = batch.model_dump(mode="json")
         _maybe_write_json(args.output_json, payload)
         print(json.dumps(payload, indent=2, ensure_ascii=False))
+        if args.instrument:
+            _print_instrumentation(payload["results"])
+        if args.profile:
+            _print_profile(payload["metadata"]["profile"])
         return 0
 
     if args.group == "sim" and args.sim_command == "sweep":
@@ -155,17 +369,22 @@ def main(argv: list[str] | None = None) -> int:
             int(value) if args.sweep_type in {"window", "mac_tag_bits"} else float(value)
             for value in args.values
         ]
+        sweep_spec = SweepSpec(
+            sweep_type=args.sweep_type,
+            values=values,
+            simulation=_simulation_spec_from_args(args),
+            fixed_p_loss=args.fixed_p_loss,
+            fixed_p_reorder=args.fixed_p_reorder,
+        )
+        if args.stream:
+            return _stream_sweep(sweep_spec, args)
         payload_points = [
             point.model_dump(mode="json")
             for point in run_sweep(
-                SweepSpec(
-                    sweep_type=args.sweep_type,
-                    values=values,
-                    simulation=_simulation_spec_from_args(args),
-                    fixed_p_loss=args.fixed_p_loss,
-                    fixed_p_reorder=args.fixed_p_reorder,
-                ),
+                sweep_spec,
                 show_progress=True,
+                trace_cache=_trace_cache_from_args(args),
+                result_cache=_result_cache_from_args(args),
             )
         ]
         _maybe_write_json(args.output_json, payload_points)
@@ -207,13 +426,128 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.group == "advise":
         profile = _device_profile_from_yaml(args.profile)
-        print(json.dumps(asdict(recommend(profile)), indent=2, ensure_ascii=False))
+        recommendation = recommend(
+            profile,
+            trace_cache=_trace_cache_from_args(args),
+            result_cache=_result_cache_from_args(args),
+        )
+        print(json.dumps(asdict(recommendation), indent=2, ensure_ascii=False))
+        return 0
+
+    if args.group == "bench":
+        if args.micro and args.update_baseline:
+            parser.error("--update-baseline applies to the macro suite only")
+        return _run_bench(args)
+
+    if args.group == "cache":
+        cache_type = ResultStore if args.kind == "results" else TraceCache
+        cache = cache_type(Path(args.dir)) if args.dir else cache_type()
+        removed = 0
+        if args.cache_command == "clear":
+            removed = cache.clear()
+        elif args.cache_command == "prune":
+            removed = cache.evict(max_bytes=args.max_bytes)
+        entries = cache.entries()
+        payload = {
+            "kind": args.kind,
+            "path": str(cache.root),
+            "entries": len(entries),
+            "size_bytes": sum(size for _, size, _ in entries),
+            "max_bytes": cache.max_bytes,
+        }
+        if args.cache_command != "info":
+            payload["removed"] = removed
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
         return 0
 
     parser.error("Unsupported command")
     return 2
 
 
+def _run_micro_bench(args: argparse.Namespace) -> int:
+    cases = select_micro_cases(micro_cases(), args.cases)
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+    if not cases:
+        print("no benchmark case matches --cases", file=sys.stderr)
+        return 2
+    results = run_micro_suite(cases, repeat=args.repeat, min_time=args.min_time)
+    payload = suite_payload(results, repeat=args.repeat, min_time=args.min_time)
+    _maybe_write_json(args.output_json, payload)
+    if args.json:
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+    else:
+        print(format_micro_table(results))
+    return 0
+
+
+def _run_bench(args: argparse.Namespace) -> int:
+    """Exit status 1 when any case regressed beyond ``--threshold`` or, without
+    ``--cases``, a baseline case was not measured."""
+    if args.micro:
+        return _run_micro_bench(args)
+    cases = select_cases(macro_cases(args.scale), args.cases)
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+    if not cases:
+        print("no benchmark case matches --cases", file=sys.stderr)
+        return 2
+    try:
+        previous = load_baseline(args.baseline)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+    results = run_macro_suite(
+        cases,
+        repeat=args.repeat,
+        isolate=not args.no_isolate,
+        on_result=lambda result: print(
+            f"  {result.name}: {result.runs_per_sec:.1f} runs/s", file=sys.stderr
+        ),
+    )
+    baseline = build_baseline(results, scale=args.scale, repeat=args.repeat)
+    comparisons = compare_results(
+        results, previous, threshold=args.threshold, full_suite=not args.cases
+    )
+    if previous is None:
+        print(f"no baseline at {args.baseline}; nothing to compare", file=sys.stderr)
+    print(format_report(comparisons, threshold=args.threshold))
+    _maybe_write_json(args.output_json, baseline)
+    if args.update_baseline:
+        print(f"baseline written to {write_baseline(args.baseline, baseline)}", file=sys.stderr)
+    return 1 if has_failures(comparisons) else 0
+
+
+def _stream_sweep(spec: SweepSpec, args: argparse.Namespace) -> int:
+    """Print one NDJSON event per point as it completes (progress bars stay off so
+    stdout remains valid NDJSON); ``--output-json`` receives the same lines."""
+    output = None
+    if args.output_json:
+        output_path = Path(args.output_json)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output = output_path.open("w", encoding="utf-8")
+    line = ""
+    try:
+        for line in sweep_event_stream(
+            spec,
+            trace_cache=_trace_cache_from_args(args),
+            result_cache=_result_cache_from_args(args),
+        ):
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            if output is not None:
+                output.write(line)
+                output.flush()
+    finally:
+        if output is not None:
+            output.close()
+    return 1 if line and json.loads(line)["event"] == "error" else 0
+
+
 def _maybe_write_json(path: str | None, payload: object) -> None:
     if not path:
         return
@@ -6,6 +6,7 @@ from .models import (
     ArtifactManifest,
     ArtifactSummary,
     ExperimentArtifact,
+    JobStatus,
     LabValidationArtifact,
     LabValidationSpec,
     SimulationBatchResult,
@@ -24,6 +25,7 @@ __all__ = [
     "ArtifactManifest",
     "ArtifactSummary",
     "ExperimentArtifact",
+    "JobStatus",
     "LabValidationArtifact",
     "LabValidationSpec",
     "SimulationBatchResult",
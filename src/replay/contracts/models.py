@@ -82,6 +82,7 @@ class SimulationSpec(ReplayBaseModel):
     target_ci_half_width: float | None = Field(default=None, gt=0.0, le=1.0)
     max_runs: int = Field(default=2000, ge=1, le=20_000)
     paired: bool = False
+    workers: int = Field(default=1, ge=1, le=64)
     channel_model: Literal["iid", "gilbert_elliott", "trace"] = "iid"
     burst_p_good_to_bad: float = Field(default=0.05, ge=0.0, le=1.0)
     burst_p_bad_to_good: float = Field(default=0.30, ge=0.0, le=1.0)
@@ -90,10 +91,12 @@ class SimulationSpec(ReplayBaseModel):
     loss_trace: list[bool] | None = None
     command_risk: dict[str, float] | None = None
     risk_high: float = Field(default=0.8, ge=0.0, le=1.0)
-    auth_profile: Literal["hmac", "ascon"] = "hmac"
+    auth_profile: Literal["hmac", "ascon", "symbolic"] = "hmac"
     # G5/G9：命令风险分类策略（Web 不收 custom——无 command_impact，fail-fast）
     policy_source: Literal["legacy", "default_table"] = "legacy"
     profile: Literal["strict", "standard", "permissive"] = "standard"
+    # hybrid：a_W 覆盖的配置走解析/控制变量估计，其余回退 paired MC（见 core.hybrid）
+    estimator: Literal["mc", "hybrid"] = "mc"
 
     @model_validator(mode="after")
     def _validate_window_size(self) -> SimulationSpec:
@@ -107,6 +110,8 @@ class SimulationSpec(ReplayBaseModel):
         work_units = run_bound * max(1, len(self.modes)) * (self.num_legit + self.num_replay)
         if work_units > MAX_WORK_UNITS:
             raise ValueError(f"simulation too large: work_units={work_units} > {MAX_WORK_UNITS}")
+        if self.estimator == "hybrid" and self.workers > 1:
+            raise ValueError("estimator='hybrid' runs in-process; workers must be 1")
         return self
 
     def to_runtime_config(self) -> SimulationConfig:
@@ -181,6 +186,7 @@ class SimulationSpecPublic(ReplayBaseModel):
     target_ci_half_width: float | None = None
     max_runs: int
     paired: bool
+    workers: int = 1
     channel_model: str
     burst_p_good_to_bad: float
     burst_p_bad_to_good: float
@@ -192,6 +198,7 @@ class SimulationSpecPublic(ReplayBaseModel):
     auth_profile: str
     policy_source: Literal["legacy", "default_table"] = "legacy"
     profile: Literal["strict", "standard", "permissive"] = "standard"
+    estimator: Literal["mc", "hybrid"] = "mc"
 
     @classmethod
     def from_spec(cls, spec: SimulationSpec) -> SimulationSpecPublic:
@@ -310,6 +317,27 @@ class SweepPoint(ReplayBaseModel):
     result: SimulationResultRecord
 
 
+JobKind = Literal["simulation", "sweep"]
+JobState = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class JobStatus(ReplayBaseModel):
+    """State of an asynchronous simulation/sweep job; ``result`` is set once it succeeds."""
+
+    schema_version: SchemaVersion = "2026-03-16"
+    job_id: str
+    kind: JobKind
+    state: JobState = "queued"
+    submitted_at: datetime = Field(default_factory=_utc_now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    completed: int = 0
+    total: int = 0
+    cancel_requested: bool = False
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+
 class ArtifactSummary(ReplayBaseModel):
     artifact_id: str
     title: str
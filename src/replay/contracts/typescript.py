@@ -8,6 +8,7 @@ from .models import (
     SCHEMA_VERSION,
     ArtifactManifest,
     ExperimentArtifact,
+    JobStatus,
     LabValidationArtifact,
     SimulationBatchResult,
     SimulationSpec,
@@ -24,6 +25,7 @@ def _schema_bundle() -> dict[str, object]:
         "SimulationSpecPublic": SimulationSpecPublic.model_json_schema(),
         "SimulationBatchResult": SimulationBatchResult.model_json_schema(),
         "SweepSpec": SweepSpec.model_json_schema(),
+        "JobStatus": JobStatus.model_json_schema(),
         "ExperimentArtifact": ExperimentArtifact.model_json_schema(),
         "LabValidationArtifact": LabValidationArtifact.model_json_schema(),
         "SimVsHardwareArtifact": SimVsHardwareArtifact.model_json_schema(),
@@ -48,7 +50,7 @@ export type Mode =
   | 'oscore_like';
 export type AttackMode = 'post' | 'inline';
 export type ChannelModel = 'iid' | 'gilbert_elliott' | 'trace';
-export type AuthProfile = 'hmac' | 'ascon';
+export type AuthProfile = 'hmac' | 'ascon' | 'symbolic';
 export type AttackerPosition = 'ind' | 'tx' | 'rx';
 export type AttackerStrength = 'strong' | 'weak';
 export type AttackerStrategy =
@@ -56,6 +58,7 @@ export type AttackerStrategy =
   | 'adaptive_lostframe'
   | 'adaptive_resync'
   | 'adaptive_critical';
+export type Estimator = 'mc' | 'hybrid';
 
 export interface SimulationSpec {{
   schema_version: typeof SCHEMA_VERSION;
@@ -85,6 +88,7 @@ export interface SimulationSpec {{
   target_ci_half_width?: number | null;
   max_runs: number;
   paired: boolean;
+  workers: number;
   channel_model: ChannelModel;
   burst_p_good_to_bad: number;
   burst_p_bad_to_good: number;
@@ -96,6 +100,7 @@ export interface SimulationSpec {{
   auth_profile: AuthProfile;
   policy_source: 'legacy' | 'default_table';
   profile: 'strict' | 'standard' | 'permissive';
+  estimator: Estimator;
 }}
 
 export interface SimulationSpecPublic {{
@@ -125,6 +130,7 @@ export interface SimulationSpecPublic {{
   target_ci_half_width?: number | null;
   max_runs: number;
   paired: boolean;
+  workers: number;
   channel_model: ChannelModel;
   burst_p_good_to_bad: number;
   burst_p_bad_to_good: number;
@@ -136,6 +142,7 @@ export interface SimulationSpecPublic {{
   auth_profile: AuthProfile;
   policy_source: 'legacy' | 'default_table';
   profile: 'strict' | 'standard' | 'permissive';
+  estimator: Estimator;
 }}
 
 export interface SimulationResultRecord {{
@@ -198,6 +205,23 @@ export interface SweepSpec {{
   fixed_p_reorder?: number | null;
 }}
 
+export type JobState = 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled';
+
+export interface JobStatus {{
+  schema_version: typeof SCHEMA_VERSION;
+  job_id: string;
+  kind: 'simulation' | 'sweep';
+  state: JobState;
+  submitted_at: string;
+  started_at?: string | null;
+  finished_at?: string | null;
+  completed: number;
+  total: number;
+  cancel_requested: boolean;
+  result?: Record<string, unknown> | null;
+  error?: string | null;
+}}
+
 export interface ExperimentArtifact {{
   schema_version: typeof SCHEMA_VERSION;
   artifact_id: string;
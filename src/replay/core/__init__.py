@@ -1,8 +1,14 @@
 """Simulation core copied into the new package boundary."""
 from __future__ import annotations
 
+from .accumulator import RunAccumulator
 from .attacker import Attacker
-from .auth import AsconAeadAuthenticator, Authenticator, HmacAuthenticator
+from .auth import (
+    AsconAeadAuthenticator,
+    Authenticator,
+    HmacAuthenticator,
+    SymbolicAuthenticator,
+)
 from .channel import Channel, should_drop
 from .channel_models import GilbertElliottLoss, IidLoss, ReorderDelay, TraceLoss
 from .commands import DEFAULT_COMMANDS, load_command_sequence
@@ -27,17 +33,33 @@ from .defaults import (
     DEFAULT_WINDOW_SIZE,
 )
 from .experiment import (
+    ENGINE_VERSION,
+    RunPlan,
+    compile_run_plan,
     run_many_experiments,
+    run_modes_until_precision,
     run_paired_experiments,
     run_until_precision,
+    simulate_fused_with_trace,
     simulate_one_run,
     simulate_one_run_with_trace,
 )
+from .hybrid import ESTIMATOR_PATHS, run_hybrid_experiments
+from .instrument import INSTRUMENT_KEYS, RunProbe, summarize_instrumentation
+from .progress import (
+    ConsoleProgress,
+    LoggingProgress,
+    ProgressReporter,
+    ProgressTracker,
+    ProgressUpdate,
+    QueueProgress,
+)
 from .receiver import Receiver, VerificationResult
 from .rng import DeterministicRNG, RandomLike
-from .security import compute_mac, compute_mac_bits, constant_time_compare
+from .security import TagTable, compute_mac, compute_mac_bits, constant_time_compare
 from .sender import Sender
-from .trace import ScenarioTrace, generate_trace
+from .trace import ScenarioTrace, generate_trace, iter_traces
+from .trace_cache import TraceCache
 from .types import (
     WINDOW_SIZED_MODES,
     WINDOW_VERIFY_MODES,
@@ -57,6 +79,7 @@ __all__ = [
     "Attacker",
     "Authenticator",
     "Channel",
+    "ConsoleProgress",
     "CostModel",
     "CostStats",
     "DEFAULT_ATTACK_MODE",
@@ -78,33 +101,53 @@ __all__ = [
     "DEFAULT_SHARED_KEY",
     "DEFAULT_WINDOW_SIZE",
     "DeterministicRNG",
+    "ENGINE_VERSION",
+    "ESTIMATOR_PATHS",
     "Frame",
     "GilbertElliottLoss",
     "HmacAuthenticator",
+    "INSTRUMENT_KEYS",
     "IidLoss",
+    "LoggingProgress",
     "Mode",
+    "ProgressReporter",
+    "ProgressTracker",
+    "ProgressUpdate",
+    "QueueProgress",
     "RandomLike",
     "Receiver",
     "ReceiverState",
     "ReorderDelay",
+    "RunAccumulator",
+    "RunPlan",
+    "RunProbe",
     "Sender",
     "ScenarioTrace",
     "SimulationConfig",
     "SimulationRunResult",
+    "SymbolicAuthenticator",
+    "TagTable",
+    "TraceCache",
     "VerificationResult",
     "WINDOW_SIZED_MODES",
     "WINDOW_VERIFY_MODES",
+    "compile_run_plan",
     "compute_mac",
     "compute_mac_bits",
     "constant_time_compare",
     "estimate_energy",
     "load_command_sequence",
+    "run_hybrid_experiments",
     "run_many_experiments",
     "run_paired_experiments",
+    "run_modes_until_precision",
     "run_until_precision",
     "should_drop",
+    "simulate_fused_with_trace",
     "simulate_one_run",
     "simulate_one_run_with_trace",
+    "summarize_instrumentation",
     "generate_trace",
+    "iter_traces",
     "TraceLoss",
 ]
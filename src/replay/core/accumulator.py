@@ -0,0 +1,165 @@
+"""Streaming, mergeable aggregation of ``SimulationRunResult`` values.
+
+Runs are folded in as they complete, so a batch never has to hold its per-run
+results. Float fields are summed exactly: every finite double is an integer
+multiple of 2**-1074, so the running sums are plain ints. Merging two
+accumulators is therefore exact and order-independent. Serial and sharded
+batches produce bit-identical aggregates. Means round the same way as
+``statistics.fmean``. Standard deviations are the correctly rounded square root
+of the exact sample variance, which is what ``statistics.stdev`` returns from
+Python 3.11 on (earlier versions may differ in the last bits). Mean and
+variance are computed exactly rather than by a Welford recurrence, whose
+rounding depends on the merge order.
+"""
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from .stats import BinomialCI, wilson_ci
+from .types import SimulationRunResult
+
+_SCALE_BITS = 1074  # 2**-1074 is the smallest positive subnormal double
+_SQRT_BITS = 2 * sys.float_info.mant_dig + 3
+
+# SimulationRunResult float fields reported as means.
+MEAN_FIELDS = (
+    "legit_accept_rate",
+    "attack_success_rate",
+    "frr",
+    "energy_proxy",
+    "bytes_overhead",
+    "state_bytes",
+    "latency_ticks",
+    "crypto_ops",
+    "challenge_round_trips",
+)
+# Rates whose sample standard deviation is reported as well.
+SPREAD_FIELDS = ("legit_accept_rate", "attack_success_rate")
+# SimulationRunResult integer fields reported as totals.
+COUNT_FIELDS = (
+    "legit_accepted",
+    "legit_sent",
+    "attack_success",
+    "attack_attempts",
+    "resync_initiated",
+    "resync_completed",
+    "resync_timeout",
+    "crit_prepared",
+    "crit_committed",
+    "crit_rejected",
+    "reboots",
+    "locked_safe_rejects",
+    "epoch_recoveries",
+    "critical_command_count",
+)
+
+
+def _scaled(value: float) -> int:
+    """``value * 2**1074`` as an exact int (finite doubles only)."""
+    numerator, denominator = float(value).as_integer_ratio()
+    return numerator << (_SCALE_BITS - denominator.bit_length() + 1)
+
+
+def _sqrt_rto(n: int, m: int) -> int:
+    """``isqrt(n / m)`` rounded to odd (sticky low bit for inexact results)."""
+    a = math.isqrt(n // m)
+    return a | (a * a * m != n)
+
+
+def _float_sqrt_of_frac(n: int, m: int) -> float:
+    """Correctly rounded ``sqrt(n / m)`` for non-negative ints, ``m > 0``."""
+    if n <= 0:
+        return 0.0
+    q = (n.bit_length() - m.bit_length() - _SQRT_BITS) // 2
+    if q >= 0:
+        return float(_sqrt_rto(n, m << 2 * q) << q)
+    return _sqrt_rto(n << -2 * q, m) / (1 << -q)
+
+
+@dataclass
+class RunAccumulator:
+    """Running totals for one mode. Call ``add`` per run and ``merge`` across workers.
+
+    ``keep_runs=True`` additionally retains each result in ``results`` for
+    callers that need per-run detail. By default nothing per-run is kept."""
+
+    keep_runs: bool = False
+    runs: int = 0
+    sums: dict[str, int] = field(default_factory=lambda: dict.fromkeys(MEAN_FIELDS, 0))
+    squares: dict[str, int] = field(default_factory=lambda: dict.fromkeys(SPREAD_FIELDS, 0))
+    counts: dict[str, int] = field(default_factory=lambda: dict.fromkeys(COUNT_FIELDS, 0))
+    # Integer per-run metadata counters (e.g. instrumentation), summed by key.
+    metadata_counts: dict[str, int] = field(default_factory=dict)
+    # Per-run ``diagnostics`` (e.g. tag-cache hits), always summed.
+    diagnostics: dict[str, int] = field(default_factory=dict)
+    results: list[SimulationRunResult] | None = None
+
+    def __post_init__(self) -> None:
+        if self.keep_runs and self.results is None:
+            self.results = []
+
+    def add(self, result: SimulationRunResult, *, counted_metadata: Iterable[str] = ()) -> None:
+        self.runs += 1
+        sums = self.sums
+        for name in MEAN_FIELDS:
+            sums[name] += _scaled(getattr(result, name))
+        for name in SPREAD_FIELDS:
+            scaled = _scaled(getattr(result, name))
+            self.squares[name] += scaled * scaled
+        counts = self.counts
+        for name in COUNT_FIELDS:
+            counts[name] += getattr(result, name)
+        for key in counted_metadata:
+            value = result.metadata.get(key)
+            if isinstance(value, int):
+                self.metadata_counts[key] = self.metadata_counts.get(key, 0) + value
+        for key, value in result.diagnostics.items():
+            self.diagnostics[key] = self.diagnostics.get(key, 0) + value
+        if self.results is not None:
+            self.results.append(result)
+
+    def extend(
+        self, results: Iterable[SimulationRunResult], *, counted_metadata: Iterable[str] = ()
+    ) -> None:
+        keys = tuple(counted_metadata)
+        for result in results:
+            self.add(result, counted_metadata=keys)
+
+    def merge(self, other: RunAccumulator) -> None:
+        """Fold ``other`` in. Merging shards in seed order keeps ``results`` ordered."""
+        self.runs += other.runs
+        for name, value in other.sums.items():
+            self.sums[name] += value
+        for name, value in other.squares.items():
+            self.squares[name] += value
+        for name, value in other.counts.items():
+            self.counts[name] += value
+        for key, value in other.metadata_counts.items():
+            self.metadata_counts[key] = self.metadata_counts.get(key, 0) + value
+        for key, value in other.diagnostics.items():
+            self.diagnostics[key] = self.diagnostics.get(key, 0) + value
+        if self.results is not None and other.results is not None:
+            self.results.extend(other.results)
+
+    def mean(self, name: str) -> float:
+        if not self.runs:
+            return 0.0
+        return (self.sums[name] / (1 << _SCALE_BITS)) / self.runs
+
+    def std(self, name: str) -> float:
+        """Sample standard deviation (``n - 1``), 0.0 for fewer than two runs."""
+        n = self.runs
+        if n <= 1:
+            return 0.0
+        total = self.sums[name]
+        spread = n * self.squares[name] - total * total
+        return _float_sqrt_of_frac(spread, n * (n - 1) << (2 * _SCALE_BITS))
+
+    def lar_ci(self) -> BinomialCI:
+        return wilson_ci(self.counts["legit_accepted"], self.counts["legit_sent"])
+
+    def asr_ci(self) -> BinomialCI:
+        return wilson_ci(self.counts["attack_success"], self.counts["attack_attempts"])
@@ -10,19 +10,33 @@ each of the ``r`` subsequent frames ``c+1..c+r`` is delivered with probability
 ``1 - p_loss`` and advances the window; finally frame ``c`` is replayed. By the
 window kernel the replay is accepted iff none of ``{c+W .. c+r}`` were delivered,
 i.e. ``p_loss**(r-w+1)`` for ``r >= w`` and ``1.0`` for ``r < w``.
+
+``estimate_accept_rate_vector`` (optional NumPy) draws the ``n_trials x r`` loss
+matrix in blocks and applies that closed form per row; for any loss matrix each
+row's decision equals the kernel walk's (``_replay_accepted``). Its random stream
+is NumPy's, so it agrees with the scalar estimator in distribution only.
 """
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from typing import Any
 
 from ..kernel.acceptance import SwDecision, classify
 from ..kernel.window_commit import window_commit
-from ..rng import RandomLike
+from ..rng import DeterministicRNG, RandomLike
 from ..stats import wilson_ci
 from .models import a_W
 
+try:  # optional dependency: pip install replay[fast]
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
 _ACCEPTED = (SwDecision.ACCEPT_FORWARD, SwDecision.ACCEPT_IN_WINDOW)
+_BLOCK_CELLS = 1 << 22  # trials x offsets per loss-matrix block (4 MiB of bools)
+ENGINES = ("scalar", "vector")
 
 
 def validate_params(r: int, p_loss: float, w: int) -> None:
@@ -40,24 +54,61 @@ def estimate_accept_rate(
 ) -> tuple[int, int]:
     """Estimate ``P(accept | offset=r, window=w, p_loss)`` via the real receiver
     window kernel. Returns ``(accepts, n_trials)`` for downstream Wilson CI."""
+    _validate_trials(r, p_loss, w, n_trials)
+    accepts = 0
+    for _ in range(n_trials):
+        # one draw per subsequent frame, in order, consumed lazily by the kernel walk
+        if _replay_accepted((rng.random() < p_loss for _ in range(r)), w):
+            accepts += 1
+    return accepts, n_trials
+
+
+def _validate_trials(r: int, p_loss: float, w: int, n_trials: int) -> None:
     validate_params(r, p_loss, w)
     if n_trials <= 0:
         raise ValueError(f"n_trials must be > 0, got {n_trials!r}")
+
+
+def _replay_accepted(lost: Iterable[bool], w: int) -> bool:
+    """One trial through the window kernel; ``lost[i-1]`` drops frame ``c+i``."""
     c = w  # base counter; c-1 = w-1 >= 0 keeps every counter non-negative
+    h = c - 1
+    mask = 1  # receiver accepted counter c-1 (window top); c itself is lost
+    for i, dropped in enumerate(lost, start=1):
+        if dropped:
+            continue  # subsequent legit frame c+i lost on the channel
+        n = c + i
+        if classify(n, h, mask, w) is SwDecision.ACCEPT_FORWARD:
+            h, mask = window_commit(n, h, mask, w)
+    # replay the original (lost) frame c through the same window kernel
+    return classify(c, h, mask, w) in _ACCEPTED
+
+
+def accepts_from_losses(lost: Any, w: int) -> Any:
+    """Closed vector form of ``_replay_accepted`` over a ``(trials, r)`` bool matrix.
+
+    Frame ``c`` is never accepted, so its slot stays free and the replay passes
+    iff ``c`` is still inside the window (``H - c < w``) or ``H`` never moved,
+    i.e. iff every one of ``c+w .. c+r`` (columns ``w-1 ..``) was lost."""
+    return lost[:, w - 1 :].all(axis=1)
+
+
+def estimate_accept_rate_vector(
+    r: int, p_loss: float, w: int, *, n_trials: int, seed: Any = None
+) -> tuple[int, int]:
+    """NumPy ``estimate_accept_rate``: the loss matrix is drawn in blocks of at
+    most ``_BLOCK_CELLS`` cells from ``numpy.random.default_rng(seed)``."""
+    if np is None:
+        raise RuntimeError("engine='vector' needs numpy: pip install replay[fast]")
+    _validate_trials(r, p_loss, w, n_trials)
+    if r < w:
+        return n_trials, n_trials  # nothing can push c out of the window
+    rng = np.random.default_rng(seed)
+    rows = max(1, _BLOCK_CELLS // r)
     accepts = 0
-    for _ in range(n_trials):
-        h = c - 1
-        mask = [0] * w
-        mask[0] = 1  # receiver accepted counter c-1 (window top); c itself is lost
-        for i in range(1, r + 1):
-            if rng.random() < p_loss:
-                continue  # subsequent legit frame c+i lost on the channel
-            n = c + i
-            if classify(n, h, mask, w) is SwDecision.ACCEPT_FORWARD:
-                h, mask = window_commit(n, h, mask, w)
-        # replay the original (lost) frame c through the same window kernel
-        if classify(c, h, mask, w) in _ACCEPTED:
-            accepts += 1
+    for start in range(0, n_trials, rows):
+        lost = rng.random((min(rows, n_trials - start), r)) < p_loss
+        accepts += int(np.count_nonzero(accepts_from_losses(lost, w)))
     return accepts, n_trials
 
 
@@ -81,6 +132,10 @@ def verify_point(
 ) -> VerifyPoint:
     """Compare analytic ``a_W`` to a controlled MC estimate at one grid point."""
     accepts, n = estimate_accept_rate(r, p_loss, w, n_trials=n_trials, rng=rng)
+    return _verify_counts(r, p_loss, w, accepts, n)
+
+
+def _verify_counts(r: int, p_loss: float, w: int, accepts: int, n: int) -> VerifyPoint:
     ci = wilson_ci(accepts, n)
     analytic = a_W(r, p_loss, w)
     mc_mean = accepts / n
@@ -101,18 +156,48 @@ def verify_point(
     )
 
 
+def _verify_task(args: tuple[tuple[int, float, int], int, int, str]) -> VerifyPoint:
+    """One grid point on its own seed (process-pool entry point)."""
+    (r, p_loss, w), n_trials, seed, engine = args
+    if engine == "vector":
+        accepts, n = estimate_accept_rate_vector(r, p_loss, w, n_trials=n_trials, seed=seed)
+        return _verify_counts(r, p_loss, w, accepts, n)
+    return verify_point(r, p_loss, w, n_trials=n_trials, rng=DeterministicRNG(seed))
+
+
 def dual_verification(
     r_grid: Iterable[int],
     w_grid: Iterable[int],
     p_loss_values: Iterable[float],
     *,
     n_trials: int,
-    rng: RandomLike,
+    rng: RandomLike | None = None,
+    seed: int | None = None,
+    engine: str = "scalar",
+    workers: int = 1,
 ) -> list[VerifyPoint]:
-    """Run ``verify_point`` over the full ``(w, p_loss, r)`` grid."""
-    results: list[VerifyPoint] = []
-    for w in w_grid:
-        for p_loss in p_loss_values:
-            for r in r_grid:
-                results.append(verify_point(r, p_loss, w, n_trials=n_trials, rng=rng))
-    return results
+    """Run ``verify_point`` over the full ``(w, p_loss, r)`` grid.
+
+    With ``rng`` the grid is walked serially on that one stream. With ``seed``
+    each point draws its own seed from ``DeterministicRNG(seed)`` in grid order,
+    so points are independent: ``workers > 1`` spreads them over a process pool
+    with identical results, and ``engine="vector"`` (NumPy) is available.
+    Exactly one of ``rng`` and ``seed`` must be given."""
+    if (rng is None) == (seed is None):
+        raise ValueError("pass exactly one of rng and seed")
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be 'scalar' or 'vector', got {engine!r}")
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers!r}")
+    grid = [(r, p_loss, w) for w in w_grid for p_loss in p_loss_values for r in r_grid]
+    if rng is not None:
+        if engine != "scalar" or workers > 1:
+            raise ValueError("engine='vector' and workers > 1 need seed instead of rng")
+        return [verify_point(r, p, w, n_trials=n_trials, rng=rng) for r, p, w in grid]
+    point_rng = DeterministicRNG(seed)
+    tasks = [(task, n_trials, point_rng.randint(0, 2**31 - 1), engine) for task in grid]
+    if workers == 1:
+        return [_verify_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        return list(executor.map(_verify_task, tasks, chunksize=chunksize))
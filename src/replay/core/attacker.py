@@ -32,7 +32,7 @@ class AttackContext:
     window_size: int = 0
     g_hard: int = 0
     last_counter: int = -1
-    received_mask: tuple[int, ...] = ()
+    received_mask: int = 0  # ReceiverState 同款位图：bit d ↔ counter last_counter-d
     policy_table: CriticalPolicy | None = None
 
 
@@ -165,9 +165,7 @@ class AdaptiveReplay(RandomReplay):
         offset = ctx.last_counter - frame.counter
         if not (0 <= offset < ctx.window_size):
             return False
-        if offset >= len(ctx.received_mask):
-            return False
-        return ctx.received_mask[offset] == 0
+        return not (ctx.received_mask >> offset) & 1
 
     @staticmethod
     def _is_resync_candidate(frame: Frame, ctx: AttackContext) -> bool:
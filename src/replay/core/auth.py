@@ -1,10 +1,10 @@
 """Authenticator profiles for replay-defense modes."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol
 
-from .security import compute_mac_bits, constant_time_compare
+from .security import TagTable, compute_mac_bits, constant_time_compare
 
 
 class Authenticator(Protocol):
@@ -24,14 +24,43 @@ class HmacAuthenticator:
     key: str
     tag_bits: int = 80
     profile: str = "hmac"
+    table: TagTable | None = field(default=None, compare=False, repr=False)
 
     def tag(self, token: int | str, command: str) -> str:
+        if self.table is not None:
+            return self.table.tag(token, command, key=self.key, tag_bits=self.tag_bits)
         return compute_mac_bits(token, command, key=self.key, tag_bits=self.tag_bits)
 
     def verify(self, token: int | str, command: str, tag: str | None) -> bool:
         return constant_time_compare(self.tag(token, command), tag)
 
 
+@dataclass(frozen=True)
+class SymbolicAuthenticator:
+    """Hash-free stand-in for ``HmacAuthenticator`` in large simulation sweeps.
+
+    The simulated attacker replays recorded frames and never forges, so a MAC check
+    reduces to "did the sender tag exactly this (key, tag_bits, token, command)?".
+    The tag is that tuple rendered as a string and ``verify`` is equality; the
+    engine still books one HMAC per tag/verify, so ``crypto_ops`` and energy match
+    the ``hmac`` profile. See ``replay.core.auth_check`` for the equivalence check.
+    """
+
+    key: str
+    tag_bits: int = 80
+    profile: str = "symbolic"
+
+    def __post_init__(self) -> None:
+        if self.tag_bits % 4 != 0:
+            raise ValueError("tag_bits must be divisible by 4 for hex encoding")
+
+    def tag(self, token: int | str, command: str) -> str:
+        return f"{self.key}|{self.tag_bits}|{token}|{command}"
+
+    def verify(self, token: int | str, command: str, tag: str | None) -> bool:
+        return tag is not None and tag == self.tag(token, command)
+
+
 class AsconAeadAuthenticator:
     profile = "ascon"
 
@@ -0,0 +1,84 @@
+"""Equivalence check between the ``symbolic`` and ``hmac`` auth profiles.
+
+``auth_profile="symbolic"`` skips SHA-256 on the assumption that the simulated
+attacker never forges. This harness backs that assumption empirically: every
+sampled config runs under both profiles on identical scenario seeds and every
+per-run counter must match exactly.
+"""
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from .experiment import simulate_one_run
+from .rng import DeterministicRNG
+from .types import AttackMode, Mode, SimulationConfig, SimulationRunResult
+
+
+@dataclass(frozen=True)
+class ProfileMismatch:
+    """One per-run counter that differs between ``hmac`` and ``symbolic``."""
+
+    config_index: int
+    run_index: int
+    field: str
+    hmac: object
+    symbolic: object
+
+
+def sample_configs() -> list[SimulationConfig]:
+    """A small spread over modes, attack modes and channel conditions."""
+    return [
+        SimulationConfig(
+            mode=mode,
+            attack_mode=attack_mode,
+            p_loss=p_loss,
+            p_reorder=0.2,
+            num_legit=15,
+            num_replay=15,
+            window_size=4,
+            g_hard=3,
+            command_set=["UNLOCK", "LOCK", "PING"],
+            command_risk={"UNLOCK": 1.0},
+            risk_high=0.8,
+        )
+        for mode in Mode
+        for attack_mode in AttackMode
+        for p_loss in (0.0, 0.25)
+    ]
+
+
+def check_symbolic_equivalence(
+    configs: Iterable[SimulationConfig], *, runs: int, seed: int | None = 0
+) -> list[ProfileMismatch]:
+    """Run each config under ``hmac`` and ``symbolic`` and diff the per-run counters.
+
+    Returns every mismatch (empty list = equivalent on this sample)."""
+    mismatches: list[ProfileMismatch] = []
+    for config_index, config in enumerate(configs):
+        seed_rng = DeterministicRNG(seed)
+        scenario_seeds = [seed_rng.randint(0, 2**31 - 1) for _ in range(runs)]
+        hmac_cfg = dataclasses.replace(config, auth_profile="hmac")
+        symbolic_cfg = dataclasses.replace(config, auth_profile="symbolic")
+        for run_index, scenario_seed in enumerate(scenario_seeds):
+            expected = simulate_one_run(hmac_cfg, rng=DeterministicRNG(scenario_seed))
+            got = simulate_one_run(symbolic_cfg, rng=DeterministicRNG(scenario_seed))
+            mismatches.extend(
+                ProfileMismatch(config_index, run_index, name, a, b)
+                for name, a, b in _counter_diffs(expected, got)
+            )
+    return mismatches
+
+
+def _counter_diffs(
+    expected: SimulationRunResult, got: SimulationRunResult
+) -> Sequence[tuple[str, object, object]]:
+    diffs = []
+    for f in dataclasses.fields(expected):
+        if f.name == "metadata":
+            continue
+        a, b = getattr(expected, f.name), getattr(got, f.name)
+        if a != b:
+            diffs.append((f.name, a, b))
+    return diffs
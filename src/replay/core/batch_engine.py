@@ -0,0 +1,339 @@
+"""NumPy batch engine: many independent live runs of a window-family mode at once.
+
+``simulate_one_run`` walks one run frame by frame through ``Channel`` / ``Receiver``.
+For the counter-window modes the only per-frame state is ``(H, M_W)``, so N runs can
+advance in lockstep: loss, reorder delays, record drops and attacker picks are array
+draws, the delivery order is an argsort of ``(phase, delivery_tick, seq)`` (exactly
+the ``EventScheduler`` heap order), and ``classify`` / ``window_commit`` are applied
+to all N runs per delivery step.
+
+The window bitmap is carried as a per-counter ``seen`` matrix plus a ``sealed``
+watermark (resync H2 seal). For ``h - w < n <= h`` the kernel mask bit ``mask[h - n]``
+equals ``seen[n] or n <= sealed``, so the decisions are the kernel's; the cost per
+step is O(N) independent of ``W``.
+
+The random stream is NumPy's, not ``DeterministicRNG``, so results agree with the
+scalar engine in distribution (CI parity), not run by run.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from .cost import CostModel, CostStats, estimate_energy
+from .types import Mode, SimulationConfig, SimulationRunResult
+
+try:  # optional dependency: pip install replay[fast]
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+VECTOR_MODES = frozenset({Mode.WINDOW, Mode.SW_RESYNC, Mode.OSCORE_LIKE, Mode.ROLLING_MAC})
+
+_COUNTER_BYTES = 4
+_BLOCK_RUNS = 4096   # most runs per block
+# (runs x event slots) cells per block: each of the seven per-event arrays stays
+# under 8 MiB however large num_legit / num_replay get
+_BLOCK_CELLS = 1 << 20
+
+
+def vector_supported(config: SimulationConfig) -> bool:
+    """True when the batch engine models ``config`` with scalar-engine semantics.
+
+    Out of scope (use the scalar engine): non-window modes, bursty/trace channels
+    (per-run sequential state), rx capture (records depend on delivery order) and
+    adaptive attackers (picks depend on receiver state)."""
+    return (
+        config.mode in VECTOR_MODES
+        and config.channel_model == "iid"
+        and config.attacker_strategy == "random"
+        and config.attacker_position in ("ind", "tx")
+    )
+
+
+def simulate_runs_vector(
+    config: SimulationConfig,
+    runs: int,
+    *,
+    seed: int | Any = None,
+    cost_model: CostModel | None = None,
+) -> list[SimulationRunResult]:
+    """Simulate ``runs`` independent live runs of ``config`` in NumPy blocks.
+
+    Energy is priced by ``estimate_energy`` under ``cost_model`` (default
+    ``CostModel()``, as in the scalar engine's run plans)."""
+    if np is None:
+        raise RuntimeError("engine='vector' needs numpy: pip install replay[fast]")
+    if not vector_supported(config):
+        raise ValueError(
+            f"engine='vector' does not support mode={config.mode.value!r}, "
+            f"channel_model={config.channel_model!r}, "
+            f"attacker_position={config.attacker_position!r}, "
+            f"attacker_strategy={config.attacker_strategy!r}"
+        )
+    rng = np.random.default_rng(seed)
+    cost_model = cost_model if cost_model is not None else CostModel()
+    block = min(_BLOCK_RUNS, max(1, _BLOCK_CELLS // _event_slots(config)))
+    results: list[SimulationRunResult] = []
+    for start in range(0, runs, block):
+        results.extend(_simulate_block(config, min(block, runs - start), rng, cost_model))
+    return results
+
+
+def _event_slots(config: SimulationConfig) -> int:
+    """Sends per run: every legit frame plus the most replays that can go out."""
+    if config.attack_mode.value == "inline":
+        max_attacks = min(config.num_replay, config.num_legit * max(1, config.inline_attack_burst))
+    else:
+        max_attacks = config.num_replay
+    return config.num_legit + max_attacks
+
+
+def _simulate_block(
+    config: SimulationConfig, n: int, rng: Any, cost_model: CostModel
+) -> list[SimulationRunResult]:
+    num_legit = config.num_legit
+    rows_all = np.arange(n)
+    tag_bits = config.mac_tag_bits or config.mac_length * 4
+    frame_overhead = _COUNTER_BYTES + max(1, (tag_bits + 7) // 8)
+
+    if config.command_sequence:
+        space = list(config.command_sequence)
+        cmd_idx = np.tile(np.arange(num_legit) % len(space), (n, 1))
+    else:
+        space = list(config.effective_command_set())
+        if not space:
+            raise ValueError("Command set is empty")
+        cmd_idx = rng.integers(0, len(space), size=(n, num_legit))
+    frame_bytes = np.array([len(c.encode("utf-8")) + frame_overhead for c in space])
+    targets = set(config.target_commands or ())
+    target_ok = np.array([not targets or c in targets for c in space])
+
+    # Attacker recording at send time (ind: record_loss draw; tx: always records).
+    record_loss = 0.0 if config.attacker_position == "tx" else config.attacker_record_loss
+    recorded = np.ones((n, num_legit), dtype=bool)
+    if record_loss > 0:
+        recorded = rng.random((n, num_legit)) >= record_loss
+    eligible = recorded & target_ok[cmd_idx]
+    # Stable argsort puts each run's eligible legit indices first, ascending, so the
+    # first K entries are exactly the frames recorded up to the K-th eligible one.
+    eligible_order = np.argsort(~eligible, axis=1, kind="stable")
+    eligible_prefix = np.cumsum(eligible, axis=1)
+
+    inline = config.attack_mode.value == "inline"
+    burst = max(1, config.inline_attack_burst)
+    slots = _event_slots(config)
+    ev_counter = np.zeros((n, slots), dtype=np.int64)
+    ev_attack = np.zeros((n, slots), dtype=bool)
+    ev_cmd = np.zeros((n, slots), dtype=np.int64)
+    ev_delivered = np.zeros((n, slots), dtype=bool)
+    ev_deliv_tick = np.zeros((n, slots), dtype=np.int64)
+    ev_phase = np.zeros((n, slots), dtype=np.int64)
+    ev_legit_sent = np.zeros((n, slots), dtype=np.int64)
+
+    tick = np.zeros(n, dtype=np.int64)          # == events pushed (one tick per send)
+    legit_sent = np.zeros(n, dtype=np.int64)
+    tx_bytes = np.zeros(n, dtype=np.int64)
+    tx_macs = np.zeros(n, dtype=np.int64)
+    attack_attempts = np.zeros(n, dtype=np.int64)
+
+    def channel_send(rows: Any, counter: Any, cmd: Any, *, attack: bool, phase: int) -> None:
+        pos = tick[rows]
+        tick[rows] += 1
+        dropped = np.zeros(rows.size, dtype=bool)
+        if config.p_loss > 0:
+            dropped = rng.random(rows.size) < config.p_loss
+        delay = np.zeros(rows.size, dtype=np.int64)
+        if config.p_reorder > 0:
+            reordered = rng.random(rows.size) < config.p_reorder
+            delay = np.where(reordered, rng.integers(1, 4, size=rows.size), 0)
+        ev_counter[rows, pos] = counter
+        ev_attack[rows, pos] = attack
+        ev_cmd[rows, pos] = cmd
+        ev_delivered[rows, pos] = ~dropped
+        ev_deliv_tick[rows, pos] = pos + 1 + delay
+        ev_phase[rows, pos] = phase
+        ev_legit_sent[rows, pos] = legit_sent[rows]
+
+    def attack(rows: Any, available: Any, *, phase: int) -> None:
+        pick = np.minimum(
+            (rng.random(rows.size) * available).astype(np.int64), available - 1
+        )
+        legit_index = eligible_order[rows, pick]
+        cmd = cmd_idx[rows, legit_index]
+        attack_attempts[rows] += 1
+        tx_bytes[rows] += frame_bytes[cmd]
+        tx_macs[rows] += 1
+        sent = np.ones(rows.size, dtype=bool)
+        if config.attacker_inject_strength == "weak":
+            sent = rng.random(rows.size) >= 0.5   # attack-only drop: transmitted, no tick
+        channel_send(rows[sent], legit_index[sent] + 1, cmd[sent], attack=True, phase=phase)
+
+    remaining = np.full(n, config.num_replay, dtype=np.int64)
+    for index in range(num_legit):
+        cmd = cmd_idx[:, index]
+        legit_sent += 1
+        tx_bytes += frame_bytes[cmd]
+        tx_macs += 1
+        channel_send(rows_all, index + 1, cmd, attack=False, phase=0)
+        if not inline:
+            continue
+        active = np.ones(n, dtype=bool)
+        for _ in range(burst):
+            active &= remaining > 0
+            active &= rng.random(n) < config.inline_attack_probability
+            active &= eligible_prefix[:, index] > 0
+            if not active.any():
+                break
+            rows = rows_all[active]
+            remaining[rows] -= 1
+            attack(rows, eligible_prefix[rows, index], phase=0)
+
+    if not inline and num_legit > 0:
+        # POST_RUN: channel.flush() delivers every legit frame before the first replay.
+        available = eligible_prefix[:, -1]
+        rows = rows_all[available > 0]
+        for _ in range(config.num_replay):
+            attack(rows, available[rows], phase=1)
+
+    # EventScheduler order: (phase, delivery_tick, seq); seq == send position.
+    sort_key = (ev_phase * (2 * slots + 8) + ev_deliv_tick) * slots + np.arange(slots)
+    sort_key = np.where(ev_delivered, sort_key, np.iinfo(np.int64).max)
+    order = np.argsort(sort_key, axis=1, kind="stable")
+    counters = np.take_along_axis(ev_counter, order, axis=1)
+    attacks = np.take_along_axis(ev_attack, order, axis=1)
+    delivered = np.take_along_axis(ev_delivered, order, axis=1)
+    # Sender tx_counter when the frame is popped: at its delivery tick, or at the flush
+    # that ends its phase (ticks run 1..tick[row]; POST_RUN legit phase ends at num_legit).
+    phase = np.take_along_axis(ev_phase, order, axis=1)
+    pop_tick = np.take_along_axis(ev_deliv_tick, order, axis=1)
+    phase_end = np.where(phase == 0, num_legit if not inline else tick[:, None], tick[:, None])
+    pop_tick = np.clip(np.minimum(pop_tick, phase_end), 1, max(1, slots))
+    tx_counter = np.where(
+        phase == 1,
+        num_legit,
+        np.take_along_axis(ev_legit_sent, pop_tick - 1, axis=1),
+    )
+    rx_bytes = np.where(
+        delivered, frame_bytes[np.take_along_axis(ev_cmd, order, axis=1)], 0
+    ).sum(axis=1)
+    rx_macs = delivered.sum(axis=1)
+
+    outcome = _window_kernel(config, counters, attacks, delivered, tx_counter, rng)
+    legit_accepted, attack_success, resync_initiated, resync_completed = outcome
+
+    tx_bytes_total = tx_bytes
+    macs = tx_macs + rx_macs
+    window_bytes = max(1, (max(config.window_size, 1) + 7) // 8)
+    state_peak = np.where(tx_macs > 0, window_bytes, 0)
+    profile = config.auth_profile
+    # scalar RunPlan: ascon MACs are billed as ascon_ops, every other profile as hmac_ops
+    mac_field = "ascon_ops" if profile == "ascon" else "hmac_ops"
+
+    results: list[SimulationRunResult] = []
+    for run in range(n):
+        sent = int(legit_sent[run])
+        accepted = int(legit_accepted[run])
+        cost_stats = CostStats(
+            tx_bytes=int(tx_bytes_total[run]),
+            rx_bytes=int(rx_bytes[run]),
+            state_bytes_peak=int(state_peak[run]),
+            **{mac_field: int(macs[run])},
+        )
+        results.append(
+            SimulationRunResult(
+                legit_sent=sent,
+                legit_accepted=accepted,
+                attack_attempts=int(attack_attempts[run]),
+                attack_success=int(attack_success[run]),
+                mode=config.mode,
+                frr=1.0 - (accepted / sent if sent else 0.0),
+                energy_proxy=estimate_energy(cost_stats, cost_model),
+                bytes_overhead=float(tx_bytes_total[run] + rx_bytes[run]),
+                state_bytes=float(state_peak[run]),
+                latency_ticks=0.0,
+                crypto_ops=float(macs[run]),
+                challenge_round_trips=0.0,
+                resync_initiated=int(resync_initiated[run]),
+                resync_completed=int(resync_completed[run]),
+                resync_timeout=int(resync_initiated[run] - resync_completed[run]),
+                metadata={
+                    "p_loss": config.p_loss,
+                    "p_reorder": config.p_reorder,
+                    "window_size": config.window_size,
+                    "attack_mode": config.attack_mode.value,
+                    "auth_profile": profile,
+                    "engine": "vector",
+                },
+            )
+        )
+    return results
+
+
+def _window_kernel(
+    config: SimulationConfig,
+    counters: Any,
+    attacks: Any,
+    delivered: Any,
+    tx_counter: Any,
+    rng: Any,
+) -> tuple[Any, Any, Any, Any]:
+    """Apply classify/window_commit (and the SW_RESYNC gate) to every run per step."""
+    n, steps = counters.shape
+    w = max(1, config.window_size or 1)
+    rolling = config.mode is Mode.ROLLING_MAC
+    gated = config.mode is Mode.SW_RESYNC
+    h = np.full(n, -1, dtype=np.int64)
+    sealed = np.full(n, -1, dtype=np.int64)
+    seen = np.zeros((n, config.num_legit + 1), dtype=bool)
+    legit_accepted = np.zeros(n, dtype=np.int64)
+    attack_success = np.zeros(n, dtype=np.int64)
+    resync_initiated = np.zeros(n, dtype=np.int64)
+    resync_completed = np.zeros(n, dtype=np.int64)
+
+    for step in range(steps):
+        rows = np.flatnonzero(delivered[:, step])
+        if rows.size == 0:
+            break   # delivered frames are sorted first; nothing left in any run
+        ctr = counters[rows, step]
+        top = h[rows]
+        forward = ctr > top
+        if rolling:
+            accept = forward
+            resync = np.zeros(rows.size, dtype=bool)
+        else:
+            resync = (
+                forward & (top >= 0) & (ctr - top > config.g_hard)
+                if gated
+                else np.zeros(rows.size, dtype=bool)
+            )
+            in_window = (~forward) & (ctr > top - w)
+            dup = seen[rows, ctr] | (ctr <= sealed[rows])
+            accept = (forward & ~resync) | (in_window & ~dup)
+        h[rows[accept & forward]] = ctr[accept & forward]
+        seen[rows[accept], ctr[accept]] = True
+        is_attack = attacks[rows, step]
+        attack_success[rows[accept & is_attack]] += 1
+        legit_accepted[rows[accept & ~is_attack]] += 1
+
+        if resync.any():
+            resync_rows = rows[resync]
+            resync_initiated[resync_rows] += 1
+            ok = _resync_round_trip(config, resync_rows.size, rng)
+            done = resync_rows[ok]
+            resync_completed[done] += 1
+            h[done] = tx_counter[done, step]
+            sealed[done] = h[done]   # H2: seal the whole window at new_h
+    return legit_accepted, attack_success, resync_initiated, resync_completed
+
+
+def _resync_round_trip(config: SimulationConfig, count: int, rng: Any) -> Any:
+    """Vector ``_resolve_resync``: challenge and confirm both delivered within TTL."""
+    ok = np.ones(count, dtype=bool)
+    rtt = np.full(count, config.resync_rtt_ticks, dtype=np.int64)
+    for _ in range(2):   # challenge, then confirm
+        if config.p_loss > 0:
+            ok &= rng.random(count) >= config.p_loss
+        if config.p_reorder > 0:
+            reordered = rng.random(count) < config.p_reorder
+            rtt += np.where(reordered, rng.integers(1, 4, size=count), 0)
+    return ok & (rtt <= config.resync_ttl_ticks)
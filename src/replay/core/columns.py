@@ -0,0 +1,246 @@
+"""Compact columnar storage for ``ScenarioTrace`` (packed bits / small-int arrays).
+
+Each column is an immutable, indexable view over a buffer: O(1) ``col[i]``,
+zero-copy ``col[a:b]`` (a new view on the same buffer) and raw-buffer access
+for hashing. Buffers may be ``bytes``/``array`` built in memory or memoryviews
+over an mmap'd file. Columns compare equal to plain lists with the same items.
+"""
+from __future__ import annotations
+
+import json
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain
+from typing import Any, Union, overload
+
+_U32 = "I" if array("I").itemsize >= 4 else "L"
+
+# byte -> JSON fragment of its 8 bits (LSB first), for the legacy digest payload
+_BYTE_JSON = [
+    ",".join("true" if (value >> bit) & 1 else "false" for bit in range(8))
+    for value in range(256)
+]
+# byte -> its 8 bits as bools (LSB first), for bulk decoding
+_BYTE_BOOLS = [tuple(bool((value >> bit) & 1) for bit in range(8)) for value in range(256)]
+
+
+def _view_bounds(length: int, index: slice) -> tuple[int, int]:
+    start, stop, step = index.indices(length)
+    if step != 1:
+        raise ValueError("columns only support contiguous slices")
+    return start, max(start, stop)
+
+
+def _sequence_eq(left: Sequence[Any], right: object) -> bool:
+    if not isinstance(right, Sequence) or isinstance(right, (str, bytes)):
+        return NotImplemented
+    return len(left) == len(right) and all(a == b for a, b in zip(left, right))
+
+
+class BitColumn(Sequence[bool]):
+    """Packed booleans: bit ``i`` of the view is bit ``(start+i) % 8`` of byte
+    ``(start+i) // 8`` (LSB first)."""
+
+    __slots__ = ("_buf", "_start", "_len")
+
+    def __init__(self, buf: Any = b"", start: int = 0, length: int | None = None) -> None:
+        self._buf = buf
+        self._start = start
+        self._len = len(buf) * 8 - start if length is None else length
+
+    @classmethod
+    def from_bools(cls, values: Iterable[bool]) -> BitColumn:
+        bits = list(values)
+        packed = bytearray((len(bits) + 7) // 8)
+        for index, value in enumerate(bits):
+            if value:
+                packed[index >> 3] |= 1 << (index & 7)
+        return cls(bytes(packed), 0, len(bits))
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> bool: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> BitColumn: ...
+
+    def __getitem__(self, index: int | slice) -> bool | BitColumn:
+        if isinstance(index, slice):
+            start, stop = _view_bounds(self._len, index)
+            return BitColumn(self._buf, self._start + start, stop - start)
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("BitColumn index out of range")
+        pos = self._start + index
+        return bool((self._buf[pos >> 3] >> (pos & 7)) & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        buf, pos = self._buf, self._start
+        for offset in range(pos, pos + self._len):
+            yield bool((buf[offset >> 3] >> (offset & 7)) & 1)
+
+    def __eq__(self, other: object) -> bool:
+        return _sequence_eq(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BitColumn({self.tolist()!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (BitColumn.from_bools, (self.tolist(),))
+
+    def tolist(self) -> list[bool]:
+        table = _BYTE_BOOLS
+        return list(chain.from_iterable(table[value] for value in self.raw()))[: self._len]
+
+    def count_true(self) -> int:
+        if self._start % 8 == 0:
+            first = self._start >> 3
+            packed = bytes(self._buf[first : first + (self._len + 7) // 8])
+            value = int.from_bytes(packed, "little") & ((1 << self._len) - 1)
+            return bin(value).count("1")
+        return sum(self)
+
+    def raw(self) -> bytes:
+        """Packed bytes of exactly this view (re-packed when not byte-aligned)."""
+        if self._start % 8 == 0:
+            first = self._start >> 3
+            packed = bytearray(self._buf[first : first + (self._len + 7) // 8])
+            if self._len % 8:
+                packed[-1] &= (1 << (self._len % 8)) - 1
+            return bytes(packed)
+        return BitColumn.from_bools(self).raw()
+
+    def json_bytes(self) -> bytes:
+        """``json.dumps(list(self), separators=(",", ":"))`` without boxing every bit."""
+        if not self._len:
+            return b"[]"
+        packed = self.raw()
+        full, tail = divmod(self._len, 8)
+        parts = [_BYTE_JSON[value] for value in packed[:full]]
+        if tail:
+            parts.append(",".join(_BYTE_JSON[packed[full]].split(",")[:tail]))
+        return ("[" + ",".join(parts) + "]").encode("ascii")
+
+
+class IntColumn(Sequence[int]):
+    """Non-negative small ints backed by an ``array`` (or a memoryview cast to one)."""
+
+    __slots__ = ("_data", "_start", "_len")
+
+    def __init__(self, data: Any = None, start: int = 0, length: int | None = None) -> None:
+        self._data = array("B") if data is None else data
+        self._start = start
+        self._len = len(self._data) - start if length is None else length
+
+    @classmethod
+    def from_ints(cls, values: Iterable[int], typecode: str = "B") -> IntColumn:
+        return cls(array(typecode, values))
+
+    @property
+    def typecode(self) -> str:
+        data = self._data
+        return data.typecode if isinstance(data, array) else data.format
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> IntColumn: ...
+
+    def __getitem__(self, index: int | slice) -> int | IntColumn:
+        if isinstance(index, slice):
+            start, stop = _view_bounds(self._len, index)
+            return IntColumn(self._data, self._start + start, stop - start)
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("IntColumn index out of range")
+        return int(self._data[self._start + index])
+
+    def __iter__(self) -> Iterator[int]:
+        data = self._data
+        for offset in range(self._start, self._start + self._len):
+            yield int(data[offset])
+
+    def __eq__(self, other: object) -> bool:
+        return _sequence_eq(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"IntColumn({self.tolist()!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (IntColumn.from_ints, (self.tolist(), self.typecode))
+
+    def tolist(self) -> list[int]:
+        return [int(value) for value in self._data[self._start : self._start + self._len]]
+
+    def raw(self) -> bytes:
+        itemsize = array(self.typecode).itemsize
+        view = memoryview(self._data).cast("B")
+        return bytes(view[self._start * itemsize : (self._start + self._len) * itemsize])
+
+    def json_bytes(self) -> bytes:
+        return ("[" + ",".join(map(str, self)) + "]").encode("ascii")
+
+
+class CommandColumn(Sequence[str]):
+    """Commands as indices into a small vocabulary (``IntColumn`` of codes)."""
+
+    __slots__ = ("vocab", "codes")
+
+    def __init__(self, vocab: Sequence[str] = (), codes: IntColumn | None = None) -> None:
+        self.vocab = tuple(vocab)
+        self.codes = IntColumn() if codes is None else codes
+
+    @classmethod
+    def from_commands(cls, commands: Iterable[str]) -> CommandColumn:
+        index: dict[str, int] = {}
+        codes = [index.setdefault(command, len(index)) for command in commands]
+        typecode = "B" if len(index) <= 256 else "H"
+        return cls(tuple(index), IntColumn.from_ints(codes, typecode))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CommandColumn: ...
+
+    def __getitem__(self, index: int | slice) -> str | CommandColumn:
+        if isinstance(index, slice):
+            return CommandColumn(self.vocab, self.codes[index])
+        return self.vocab[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        vocab = self.vocab
+        return (vocab[code] for code in self.codes)
+
+    def __eq__(self, other: object) -> bool:
+        return _sequence_eq(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CommandColumn({self.tolist()!r})"
+
+    def tolist(self) -> list[str]:
+        return list(self)
+
+    def json_bytes(self) -> bytes:
+        encoded = [json.dumps(command) for command in self.vocab]
+        return ("[" + ",".join(encoded[code] for code in self.codes) + "]").encode("ascii")
+
+
+Column = Union[BitColumn, IntColumn, CommandColumn]
@@ -0,0 +1,74 @@
+"""Shared bookkeeping for the on-disk caches: one file per key, LRU by mtime.
+
+A hit touches its file, so eviction (oldest mtime first) approximates LRU across
+every process sharing the directory. Writes go through ``atomic_write`` so
+readers never see a partial file.
+"""
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+from typing import ClassVar
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file + rename."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    with tmp.open("wb") as handle:
+        handle.write(data)
+    os.replace(tmp, path)
+
+
+class LruDirectory:
+    """Mixin for caches storing ``<key><suffix>`` files under ``root`` within ``max_bytes``."""
+
+    suffix: ClassVar[str]
+    root: Path
+    max_bytes: int
+
+    def path_for(self, key: str) -> Path:
+        return self.root / f"{key}{self.suffix}"
+
+    def touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def entries(self) -> list[tuple[Path, int, float]]:
+        """``(path, size, mtime)`` per cached file, least recently used first."""
+        if not self.root.is_dir():
+            return []
+        out = []
+        for path in self.root.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            out.append((path, stat.st_size, stat.st_mtime))
+        out.sort(key=lambda entry: entry[2])
+        return out
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """Drop least-recently-used files until the cache fits; returns files removed."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if total <= budget:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        return self.evict(max_bytes=0)
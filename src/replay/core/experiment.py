@@ -2,29 +2,42 @@
 from __future__ import annotations
 
 import dataclasses
-import statistics
-import sys
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, TypeVar
 
+from .accumulator import RunAccumulator
 from .attacker import (
     AdaptiveReplay,
     AttackContext,
     AttackerStrategy,
     RandomReplay,
 )
-from .auth import AsconAeadAuthenticator, Authenticator, HmacAuthenticator
+from .auth import (
+    AsconAeadAuthenticator,
+    Authenticator,
+    HmacAuthenticator,
+    SymbolicAuthenticator,
+)
+from .batch_engine import simulate_runs_vector, vector_supported
 from .channel import Channel
 from .channel_models import GilbertElliottLoss, IidLoss, LossModel, ReorderDelay, TraceLoss
+from .columns import BitColumn, CommandColumn, IntColumn
 from .cost import CostModel, CostStats, estimate_energy
+from .instrument import RunProbe, counted_keys, summarize_instrumentation
 from .kernel.critical_commit import payload_digest, pid_for
 from .policy import PolicyTable
+from .progress import ProgressReporter, ProgressTracker, resolve_reporter
 from .receiver import Receiver
 from .rng import DeterministicRNG, RandomLike
 from .scheduler import EventScheduler
+from .security import TagTable
 from .sender import Sender
-from .stats import wilson_ci
-from .trace import ScenarioTrace, generate_trace
+from .trace import ScenarioTrace, iter_traces
+from .trace_cache import TraceCache
 from .types import (
     WINDOW_SIZED_MODES,
     AggregateStats,
@@ -35,6 +48,12 @@ from .types import (
     SimulationRunResult,
 )
 
+_T = TypeVar("_T")
+
+# Bump whenever a seeded batch can produce different results (RNG draw order,
+# receiver/attacker semantics, aggregation); it invalidates persisted results.
+ENGINE_VERSION = 1
+
 
 def _resolve_rng(rng: RandomLike | None, seed: int | None) -> RandomLike:
     if rng is not None:
@@ -58,11 +77,71 @@ def _tag_bits(config: SimulationConfig) -> int:
     return config.mac_tag_bits or config.mac_length * 4
 
 
-def _authenticator(config: SimulationConfig) -> Authenticator:
+def _authenticator(config: SimulationConfig, tag_table: TagTable | None = None) -> Authenticator:
     tag_bits = _tag_bits(config)
     if config.auth_profile == "ascon":
         return AsconAeadAuthenticator(config.shared_key, tag_bits=tag_bits)
-    return HmacAuthenticator(config.shared_key, tag_bits=tag_bits)
+    if config.auth_profile == "symbolic":
+        return SymbolicAuthenticator(config.shared_key, tag_bits=tag_bits)
+    return HmacAuthenticator(config.shared_key, tag_bits=tag_bits, table=tag_table)
+
+
+def _batch_tag_table(
+    config: SimulationConfig, tag_table: TagTable | None, *, precompute: bool
+) -> TagTable:
+    """One tag table per batch; ``precompute`` pre-fills counters 1..num_legit so
+    worker processes start warm instead of each paying the first run's misses.
+
+    Skipped when the pairs outnumber ``max_entries``: the fill would evict its own
+    early counters, and a run walking 1..num_legit would then miss on every tag."""
+    table = tag_table if tag_table is not None else TagTable()
+    pairs = config.num_legit * len(config.effective_command_set())
+    if precompute and config.auth_profile == "hmac" and pairs <= table.max_entries:
+        table.precompute(
+            key=config.shared_key,
+            tag_bits=_tag_bits(config),
+            tokens=range(1, config.num_legit + 1),
+            commands=config.effective_command_set(),
+        )
+    return table
+
+
+# Set once per worker process by ``_process_pool``'s initializer.
+_WORKER_TAG_TABLE: TagTable | None = None
+
+
+def _install_worker_tag_table(tag_table: TagTable | None) -> None:
+    global _WORKER_TAG_TABLE
+    _WORKER_TAG_TABLE = tag_table
+
+
+def _worker_tag_table(tag_table: TagTable | None) -> TagTable | None:
+    return tag_table if tag_table is not None else _WORKER_TAG_TABLE
+
+
+def _process_pool(workers: int, tag_table: TagTable | None) -> ProcessPoolExecutor:
+    """Pool whose workers each receive ``tag_table`` once, at start-up, rather than
+    a pickled copy with every submitted task."""
+    return ProcessPoolExecutor(
+        max_workers=workers, initializer=_install_worker_tag_table, initargs=(tag_table,)
+    )
+
+
+def _run_tag_counts(table: TagTable | None, before: tuple[int, int]) -> dict[str, int]:
+    if table is None:
+        return {}
+    return {
+        "tag_cache_hits": table.hits - before[0],
+        "tag_cache_misses": table.misses - before[1],
+    }
+
+
+def _tag_cache_summary(acc: RunAccumulator) -> dict[str, int]:
+    """Tag-cache totals for an instrumentation summary (zeros without a table)."""
+    return {
+        "hits": acc.diagnostics.get("tag_cache_hits", 0),
+        "misses": acc.diagnostics.get("tag_cache_misses", 0),
+    }
 
 
 def _loss_model(config: SimulationConfig) -> LossModel:
@@ -78,26 +157,6 @@ def _loss_model(config: SimulationConfig) -> LossModel:
     return IidLoss(config.p_loss)
 
 
-def _frame_bytes(frame: Frame, tag_bits: int, nonce_bits: int) -> int:
-    size = len(frame.command.encode("utf-8"))
-    if frame.counter is not None:
-        size += 4
-    if frame.nonce is not None:
-        size += max(1, (nonce_bits + 7) // 8)
-    if frame.mac is not None:
-        size += max(1, (tag_bits + 7) // 8)
-    return size
-
-
-def _state_bytes(config: SimulationConfig, receiver: Receiver) -> int:
-    window_bytes = max(1, (max(config.window_size, 1) + 7) // 8)
-    nonce_bytes = len(receiver.state.outstanding_nonces) * max(
-        1,
-        (config.challenge_nonce_bits + 7) // 8,
-    )
-    return window_bytes + nonce_bytes
-
-
 def _should_challenge(config: SimulationConfig, command: str) -> bool:
     # 单阶段 challenge 仅用于 CHALLENGE baseline；HSW_CR 高风险改走两阶段 critical（D5）。
     return config.mode is Mode.CHALLENGE
@@ -130,25 +189,120 @@ def _make_attacker_strategy(config: SimulationConfig) -> AttackerStrategy:
     )
 
 
-def _is_two_phase_critical(
-    config: SimulationConfig, command: str, policy_table: PolicyTable
-) -> bool:
-    """HSW_CR critical 命令走两阶段 commit（§4.4，D5）；其余走 window/单阶段。
-    分类经预构建 policy_table（G5/G9, P1/P3：运行时 O(1)，不逐帧调 classify_critical）。"""
-    if config.mode is not Mode.HSW_CR:
-        return False
-    return policy_table.is_critical(command)
+@dataclass(eq=False)
+class RunPlan:
+    """Everything about a run that depends only on its ``SimulationConfig``.
+
+    Compiled once by ``compile_run_plan`` and reused across thousands of runs:
+    authenticator, policy table, per-command frame sizes / critical flags, cost
+    constants, and a sender/receiver pair that ``reset()`` returns to the freshly
+    constructed state. Stateful per-run pieces (loss model, channel, attacker,
+    RNG) are still built per run. A plan serves one run at a time.
+    """
+
+    config: SimulationConfig
+    tag_bits: int
+    authenticator: Authenticator
+    tag_table: TagTable | None
+    sender: Sender
+    receiver: Receiver
+    cost_model: CostModel
+    ascon_ops: bool              # MAC 记账进 ascon_ops（否则 hmac_ops）
+    tag_bytes: int
+    nonce_bytes: int
+    window_bytes: int
+    command_bytes: dict[str, int]
+    two_phase: dict[str, bool]   # HSW_CR 下走两阶段 critical 的命令（§4.4，D5）
+
+    @property
+    def policy_table(self) -> PolicyTable:
+        # 与 Receiver 内同一张表（G5/G9, P1/P3：运行时 O(1)，不逐帧调 classify_critical）
+        return self.receiver.policy_table
+
+    def reset(self) -> None:
+        self.sender.reset()
+        self.receiver.reset()
+
+    def frame_bytes(self, frame: Frame) -> int:
+        size = self.command_bytes.get(frame.command)
+        if size is None:  # command_sequence 可含命令集之外的命令
+            size = self.command_bytes[frame.command] = len(frame.command.encode("utf-8"))
+        if frame.counter is not None:
+            size += 4
+        if frame.nonce is not None:
+            size += self.nonce_bytes
+        if frame.mac is not None:
+            size += self.tag_bytes
+        return size
+
+    def state_bytes(self) -> int:
+        return self.window_bytes + len(self.receiver.state.outstanding_nonces) * self.nonce_bytes
+
+    def is_two_phase_critical(self, command: str) -> bool:
+        flag = self.two_phase.get(command)
+        if flag is None:
+            flag = self.two_phase[command] = (
+                self.config.mode is Mode.HSW_CR and self.policy_table.is_critical(command)
+            )
+        return flag
 
 
-def _build_policy_table(config: SimulationConfig) -> PolicyTable:
-    """每次运行预构建一次 policy_table（与 Receiver 内的同源同构）。"""
-    return PolicyTable.from_config(
+def compile_run_plan(config: SimulationConfig, tag_table: TagTable | None = None) -> RunPlan:
+    """Build the reusable per-config part of a run (see ``RunPlan``)."""
+    tag_bits = _tag_bits(config)
+    authenticator = _authenticator(config, tag_table)
+    sender = Sender(
+        mode=config.mode,
+        shared_key=config.shared_key,
+        mac_length=max(1, tag_bits // 4),
+        authenticator=authenticator,
+    )
+    receiver = Receiver(
+        mode=config.mode,
+        shared_key=config.shared_key,
+        mac_length=max(1, tag_bits // 4),
+        window_size=config.window_size or 1,
+        g_hard=config.g_hard,
+        authenticator=authenticator,
+        max_outstanding_challenges=config.max_outstanding_challenges,
+        challenge_ttl_ticks=config.challenge_ttl_ticks,
+        command_risk=config.command_risk,
+        risk_high=config.risk_high,
+        critical_pending_capacity=config.critical_pending_capacity,
+        critical_ttl_ticks=config.critical_ttl_ticks,
         policy_source=config.policy_source,
         profile=config.profile,
         command_impact=config.command_impact,
-        command_risk=config.command_risk,
-        risk_high=config.risk_high,
     )
+    plan = RunPlan(
+        config=config,
+        tag_bits=tag_bits,
+        authenticator=authenticator,
+        tag_table=tag_table if authenticator.profile == "hmac" else None,
+        sender=sender,
+        receiver=receiver,
+        cost_model=CostModel(),
+        ascon_ops=authenticator.profile == "ascon",
+        tag_bytes=max(1, (tag_bits + 7) // 8),
+        nonce_bytes=max(1, (config.challenge_nonce_bits + 7) // 8),
+        window_bytes=max(1, (max(config.window_size, 1) + 7) // 8),
+        command_bytes={},
+        two_phase={},
+    )
+    for command in config.effective_command_set():
+        plan.command_bytes[command] = len(command.encode("utf-8"))
+        plan.is_two_phase_critical(command)
+    return plan
+
+
+def _resolve_plan(
+    config: SimulationConfig, plan: RunPlan | None, tag_table: TagTable | None
+) -> RunPlan:
+    if plan is None:
+        return compile_run_plan(config, tag_table)
+    if plan.config is not config and plan.config != config:
+        raise ValueError("plan was compiled for a different SimulationConfig")
+    return plan
 
 
 def _roll_drop_delay(rng: RandomLike, p_loss: float, p_reorder: float) -> tuple[bool, int]:
@@ -273,37 +427,47 @@ def _resolve_reboot_recovery(
 def simulate_one_run(
     config: SimulationConfig,
     rng: RandomLike | None = None,
+    *,
+    tag_table: TagTable | None = None,
+    plan: RunPlan | None = None,
+    instrument: bool = False,
 ) -> SimulationRunResult:
-    """Simulate one round of legitimate traffic followed by replay attempts."""
+    """Simulate one round of legitimate traffic followed by replay attempts.
 
-    local_rng = _resolve_rng(rng, config.rng_seed)
-    tag_bits = _tag_bits(config)
-    authenticator = _authenticator(config)
+    ``tag_table`` shares HMAC tags across runs; its hit/miss delta for this run
+    is recorded in ``metadata``. ``plan`` (from ``compile_run_plan(config)``)
+    skips the per-config setup; its table takes precedence over ``tag_table``.
+    ``instrument=True`` adds per-stage timers and operation counters
+    (``instrument.INSTRUMENT_KEYS``) to ``metadata``; the run itself is unchanged."""
 
-    sender = Sender(
-        mode=config.mode,
-        shared_key=config.shared_key,
-        mac_length=max(1, tag_bits // 4),
-        authenticator=authenticator,
-    )
-    receiver = Receiver(
-        mode=config.mode,
-        shared_key=config.shared_key,
-        mac_length=max(1, tag_bits // 4),
-        window_size=config.window_size or 1,
-        g_hard=config.g_hard,
-        authenticator=authenticator,
-        max_outstanding_challenges=config.max_outstanding_challenges,
-        challenge_ttl_ticks=config.challenge_ttl_ticks,
-        command_risk=config.command_risk,
-        risk_high=config.risk_high,
-        critical_pending_capacity=config.critical_pending_capacity,
-        critical_ttl_ticks=config.critical_ttl_ticks,
-        policy_source=config.policy_source,
-        profile=config.profile,
-        command_impact=config.command_impact,
-    )
-    policy_table = _build_policy_table(config)
+    local_rng = _resolve_rng(rng, config.rng_seed)
+    plan = _resolve_plan(config, plan, tag_table)
+    if not instrument:
+        return _simulate_run(config, local_rng, plan)
+    probe = RunProbe()
+    start = time.perf_counter_ns()
+    try:
+        result = _simulate_run(config, local_rng, plan, probe)
+    finally:
+        probe.detach()
+    probe.ns["run"] += time.perf_counter_ns() - start
+    probe.calls["run"] += 1
+    result.metadata.update(probe.metadata())
+    return result
+
+
+def _simulate_run(
+    config: SimulationConfig,
+    local_rng: RandomLike,
+    plan: RunPlan,
+    probe: RunProbe | None = None,
+) -> SimulationRunResult:
+    plan.reset()
+    authenticator = plan.authenticator
+    tag_table = plan.tag_table
+    tag_counts_before = (tag_table.hits, tag_table.misses) if tag_table is not None else (0, 0)
+    sender = plan.sender
+    receiver = plan.receiver
     attacker = _make_attacker_strategy(config)
     channel = Channel(
         p_loss=config.p_loss,
@@ -312,6 +476,10 @@ def simulate_one_run(
         loss_model=_loss_model(config),
         delay_model=ReorderDelay(config.p_reorder),
     )
+    if probe is not None:
+        probe.attach(
+            sender=sender, receiver=receiver, scheduler=channel._scheduler, attacker=attacker
+        )
 
     legit_sent = 0
     legit_accepted = 0
@@ -341,33 +509,26 @@ def simulate_one_run(
         return ch_dropped, ch_delay, cf_dropped, cf_delay
 
     def record_tx(frame: Frame) -> None:
-        size = _frame_bytes(frame, tag_bits, config.challenge_nonce_bits)
-        cost_stats.tx_bytes += size
+        cost_stats.tx_bytes += plan.frame_bytes(frame)
         if frame.mac is not None:
-            if authenticator.profile == "ascon":
+            if plan.ascon_ops:
                 cost_stats.ascon_ops += 1
             else:
                 cost_stats.hmac_ops += 1
-        cost_stats.state_bytes_peak = max(
-            cost_stats.state_bytes_peak,
-            _state_bytes(config, receiver),
-        )
+        cost_stats.state_bytes_peak = max(cost_stats.state_bytes_peak, plan.state_bytes())
 
     def process_arrived(frames: list[Frame]) -> None:
         nonlocal attack_success, legit_accepted
         for frame in frames:
             if config.attacker_position == "rx" and not frame.is_attack:
                 attacker.observe(frame, local_rng)  # rx: record only delivered legit frames
-            cost_stats.rx_bytes += _frame_bytes(frame, tag_bits, config.challenge_nonce_bits)
+            cost_stats.rx_bytes += plan.frame_bytes(frame)
             if frame.mac is not None:
-                if authenticator.profile == "ascon":
+                if plan.ascon_ops:
                     cost_stats.ascon_ops += 1
                 else:
                     cost_stats.hmac_ops += 1
-            cost_stats.state_bytes_peak = max(
-                cost_stats.state_bytes_peak,
-                _state_bytes(config, receiver),
-            )
+            cost_stats.state_bytes_peak = max(cost_stats.state_bytes_peak, plan.state_bytes())
             if frame.flags == Frame.FLAG_CRIT_PREPARE:   # 两阶段 critical 路由（D2）
                 committed = _resolve_critical(
                     receiver,
@@ -414,7 +575,7 @@ def simulate_one_run(
             window_size=receiver.window_size,
             g_hard=receiver.g_hard,
             last_counter=receiver.state.last_counter,
-            received_mask=tuple(receiver.state.received_mask),
+            received_mask=receiver.state.received_mask,
             policy_table=receiver.policy_table,
         )
 
@@ -439,7 +600,7 @@ def simulate_one_run(
             ):
                 cost_stats.epoch_recoveries += 1
         command = _choose_command(config, index, local_rng)
-        if _is_two_phase_critical(config, command, policy_table):
+        if plan.is_two_phase_critical(command):
             cost_stats.critical_command_count += 1   # D6：legit 两阶段命令单点计数
             frame = sender.begin_critical_intent(
                 command,
@@ -497,7 +658,7 @@ def simulate_one_run(
 
     process_arrived(channel.flush())
 
-    energy = estimate_energy(cost_stats, CostModel())
+    energy = estimate_energy(cost_stats, plan.cost_model)
     legit_rate = legit_accepted / legit_sent if legit_sent else 0.0
     crypto_ops = cost_stats.hmac_ops + cost_stats.ascon_ops
     return SimulationRunResult(
@@ -534,102 +695,211 @@ def simulate_one_run(
             "attack_mode": config.attack_mode.value,
             "auth_profile": authenticator.profile,
         },
+        diagnostics=_run_tag_counts(tag_table, tag_counts_before),
     )
 
 
 def _aggregate_results(
     config: SimulationConfig,
     mode: Mode,
-    results: list[SimulationRunResult],
+    acc: RunAccumulator,
     metadata: dict[str, object],
 ) -> AggregateStats:
-    legit_rates = [result.legit_accept_rate for result in results]
-    attack_rates = [result.attack_success_rate for result in results]
-    legit_accepted = sum(result.legit_accepted for result in results)
-    legit_total = sum(result.legit_sent for result in results)
-    attack_accepted = sum(result.attack_success for result in results)
-    attack_total = sum(result.attack_attempts for result in results)
-    lar_ci = wilson_ci(legit_accepted, legit_total)
-    asr_ci = wilson_ci(attack_accepted, attack_total)
+    lar_ci = acc.lar_ci()
+    asr_ci = acc.asr_ci()
+    counts = acc.counts
     window_value = config.window_size if mode in WINDOW_SIZED_MODES else 0
     return AggregateStats(
         mode=mode,
-        runs=len(results),
-        avg_legit_rate=_mean(legit_rates),
-        std_legit_rate=_std(legit_rates),
-        avg_attack_rate=_mean(attack_rates),
-        std_attack_rate=_std(attack_rates),
+        runs=acc.runs,
+        avg_legit_rate=acc.mean("legit_accept_rate"),
+        std_legit_rate=acc.std("legit_accept_rate"),
+        avg_attack_rate=acc.mean("attack_success_rate"),
+        std_attack_rate=acc.std("attack_success_rate"),
         p_loss=config.p_loss,
         p_reorder=config.p_reorder,
         window_size=window_value,
         num_legit=config.num_legit,
         num_replay=config.num_replay,
         attack_mode=config.attack_mode,
-        legit_accepted=legit_accepted,
-        legit_total=legit_total,
-        attack_accepted=attack_accepted,
-        attack_total=attack_total,
+        legit_accepted=counts["legit_accepted"],
+        legit_total=counts["legit_sent"],
+        attack_accepted=counts["attack_success"],
+        attack_total=counts["attack_attempts"],
         lar_ci_low=lar_ci.lower,
         lar_ci_high=lar_ci.upper,
         asr_ci_low=asr_ci.lower,
         asr_ci_high=asr_ci.upper,
-        frr=_mean([result.frr for result in results]),
-        energy_proxy=_mean([result.energy_proxy for result in results]),
-        bytes_overhead=_mean([result.bytes_overhead for result in results]),
-        state_bytes=_mean([result.state_bytes for result in results]),
-        latency_ticks=_mean([result.latency_ticks for result in results]),
-        crypto_ops=_mean([result.crypto_ops for result in results]),
-        challenge_round_trips=_mean([result.challenge_round_trips for result in results]),
-        resync_initiated=sum(result.resync_initiated for result in results),
-        resync_completed=sum(result.resync_completed for result in results),
-        resync_timeout=sum(result.resync_timeout for result in results),
-        crit_prepared=sum(result.crit_prepared for result in results),
-        crit_committed=sum(result.crit_committed for result in results),
-        crit_rejected=sum(result.crit_rejected for result in results),
-        reboots=sum(result.reboots for result in results),
-        locked_safe_rejects=sum(result.locked_safe_rejects for result in results),
-        epoch_recoveries=sum(result.epoch_recoveries for result in results),
-        critical_command_count=sum(result.critical_command_count for result in results),
+        frr=acc.mean("frr"),
+        energy_proxy=acc.mean("energy_proxy"),
+        bytes_overhead=acc.mean("bytes_overhead"),
+        state_bytes=acc.mean("state_bytes"),
+        latency_ticks=acc.mean("latency_ticks"),
+        crypto_ops=acc.mean("crypto_ops"),
+        challenge_round_trips=acc.mean("challenge_round_trips"),
+        resync_initiated=counts["resync_initiated"],
+        resync_completed=counts["resync_completed"],
+        resync_timeout=counts["resync_timeout"],
+        crit_prepared=counts["crit_prepared"],
+        crit_committed=counts["crit_committed"],
+        crit_rejected=counts["crit_rejected"],
+        reboots=counts["reboots"],
+        locked_safe_rejects=counts["locked_safe_rejects"],
+        epoch_recoveries=counts["epoch_recoveries"],
+        critical_command_count=counts["critical_command_count"],
         mac_tag_bits=_tag_bits(config),
         auth_profile=config.auth_profile,
         metadata=metadata,
+        run_results=acc.results,
+        diagnostics=dict(acc.diagnostics),
     )
 
 
+def _shard(items: Sequence[_T], shards: int) -> list[list[_T]]:
+    """Split ``items`` into at most ``shards`` contiguous, order-preserving chunks."""
+    shards = max(1, min(shards, len(items)))
+    size, extra = divmod(len(items), shards)
+    chunks: list[list[_T]] = []
+    start = 0
+    for index in range(shards):
+        stop = start + size + (1 if index < extra else 0)
+        chunks.append(list(items[start:stop]))
+        start = stop
+    return chunks
+
+
+def _simulate_seed_chunk(
+    config: SimulationConfig,
+    scenario_seeds: Sequence[int],
+    tag_table: TagTable | None = None,
+    keep_runs: bool = False,
+    instrument: bool = False,
+) -> RunAccumulator:
+    """Worker entry point: one live run per scenario seed, folded into an accumulator.
+
+    Without ``tag_table`` the chunk uses the worker's own table (installed once per
+    process by ``_process_pool``); it compiles its own ``RunPlan`` once. Only the
+    accumulator (plus the runs themselves when ``keep_runs``) crosses back."""
+    plan = compile_run_plan(config, _worker_tag_table(tag_table))
+    acc = RunAccumulator(keep_runs=keep_runs)
+    counted = counted_keys(instrument)
+    for seed in scenario_seeds:
+        acc.add(
+            simulate_one_run(config, rng=DeterministicRNG(seed), plan=plan, instrument=instrument),
+            counted_metadata=counted,
+        )
+    return acc
+
+
 def run_many_experiments(
     base_config: SimulationConfig,
     modes: Sequence[Mode],
     runs: int,
     seed: int | None = None,
     show_progress: bool = True,
+    workers: int = 1,
+    engine: str = "scalar",
+    tag_table: TagTable | None = None,
+    keep_runs: bool = False,
+    progress: ProgressReporter | None = None,
+    instrument: bool = False,
 ) -> list[AggregateStats]:
-    """Run multiple Monte Carlo trials for each requested mode with visual progress."""
+    """Run multiple Monte Carlo trials for each requested mode.
+
+    ``workers > 1`` shards each mode's ``scenario_seed`` list across a process pool.
+    Seeds are still drawn serially from the per-mode RNG and results are re-joined in
+    seed order, so the aggregates are identical to the serial path for the same seed.
+
+    ``engine="vector"`` runs modes the NumPy batch engine supports (window family,
+    iid channel, random attacker) in one batch per mode; other modes fall back to
+    the scalar engine. Each aggregate records the engine used in ``metadata``.
+
+    Scalar runs share one HMAC ``TagTable`` across runs and modes (pass
+    ``tag_table`` to reuse or pre-fill one); with workers each process gets a
+    pre-filled copy. Hit/miss totals land in ``metadata``.
+
+    Runs are folded into a ``RunAccumulator`` as they finish, so memory does not
+    grow with ``runs``; ``keep_runs=True`` also returns every per-run result in
+    ``AggregateStats.run_results``.
 
+    Progress goes to ``progress`` (one tracked label per mode), or to a console
+    bar when ``show_progress`` and no reporter is given.
+
+    ``instrument=True`` times the hot-path stages of every scalar run and adds
+    their totals to ``metadata["instrumentation"]`` (see ``summarize_instrumentation``).
+    """
+
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers!r}")
+    if engine not in ("scalar", "vector"):
+        raise ValueError(f"engine must be 'scalar' or 'vector', got {engine!r}")
     start_time = time.time()
     per_mode_configs = {mode: dataclasses.replace(base_config, mode=mode) for mode in modes}
-    per_mode_results: dict[Mode, list[SimulationRunResult]] = {mode: [] for mode in modes}
-
-    if show_progress:
-        print("\n" + "=" * 80)
-        print("STARTING MONTE CARLO SIMULATION")
-        print("=" * 80 + "\n")
-
-    for mode in modes:
-        mode_rng = DeterministicRNG(seed)
-        for run_idx in range(runs):
-            scenario_seed = mode_rng.randint(0, 2**31 - 1)
-            scenario_rng = DeterministicRNG(scenario_seed)
-            result = simulate_one_run(per_mode_configs[mode], rng=scenario_rng)
-            per_mode_results[mode].append(result)
-
-            if show_progress and ((run_idx + 1) % 10 == 0 or run_idx == runs - 1):
-                bar_length = 50
-                filled = int(bar_length * (run_idx + 1) / runs)
-                bar = "#" * filled + "." * (bar_length - filled)
-                sys.stdout.write(f"\r   Progress: [{bar}] {run_idx + 1}/{runs} runs")
-                sys.stdout.flush()
-        if show_progress:
-            print()
+    per_mode_acc = {mode: RunAccumulator(keep_runs=keep_runs) for mode in modes}
+
+    reporter = resolve_reporter(progress, show_progress)
+    if reporter is not None:
+        reporter.start("STARTING MONTE CARLO SIMULATION")
+
+    engine_by_mode: dict[Mode, str] = {}
+    counted = counted_keys(instrument)
+    table = _batch_tag_table(base_config, tag_table, precompute=workers > 1)
+    executor: Executor | None = _process_pool(workers, table) if workers > 1 else None
+    try:
+        for mode in modes:
+            tracker = None if reporter is None else ProgressTracker(reporter, mode.value, runs)
+            if engine == "vector" and vector_supported(per_mode_configs[mode]):
+                engine_by_mode[mode] = "vector"
+                vector_seed = None if seed is None else [seed, sum(mode.value.encode("utf-8"))]
+                per_mode_acc[mode].extend(
+                    simulate_runs_vector(per_mode_configs[mode], runs, seed=vector_seed)
+                )
+                if tracker is not None:
+                    tracker.advance(runs)
+                continue
+            engine_by_mode[mode] = "scalar"
+            mode_rng = DeterministicRNG(seed)
+            scenario_seeds = [mode_rng.randint(0, 2**31 - 1) for _ in range(runs)]
+            if executor is None:
+                plan = compile_run_plan(per_mode_configs[mode], table)
+                acc = per_mode_acc[mode]
+                for scenario_seed in scenario_seeds:
+                    scenario_rng = DeterministicRNG(scenario_seed)
+                    result = simulate_one_run(
+                        per_mode_configs[mode], rng=scenario_rng, plan=plan, instrument=instrument
+                    )
+                    acc.add(result, counted_metadata=counted)
+                    if tracker is not None:
+                        tracker.advance()
+            else:
+                # 4 chunks per worker: enough slack to balance uneven run lengths.
+                chunks = _shard(scenario_seeds, workers * 4)
+                futures = [
+                    executor.submit(
+                        _simulate_seed_chunk,
+                        per_mode_configs[mode],
+                        chunk,
+                        None,
+                        keep_runs,
+                        instrument,
+                    )
+                    for chunk in chunks
+                ]
+                for future in futures:
+                    shard = future.result()
+                    per_mode_acc[mode].merge(shard)
+                    if tracker is not None:
+                        tracker.advance(shard.runs)
+    except BaseException:
+        if executor is not None:
+            # e.g. JobCancelled from the reporter: drop the shards still queued
+            executor.shutdown(cancel_futures=True)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if reporter is not None:
+            reporter.finish()
 
     total_time = time.time() - start_time
     perf_metadata = {
@@ -637,10 +907,19 @@ def run_many_experiments(
         "time_per_run": total_time / (len(modes) * runs) if runs > 0 else 0,
         "total_runs": len(modes) * runs,
     }
-    return [
-        _aggregate_results(config, mode, per_mode_results[mode], dict(perf_metadata))
-        for mode, config in per_mode_configs.items()
-    ]
+    stats: list[AggregateStats] = []
+    for mode, config in per_mode_configs.items():
+        metadata: dict[str, object] = dict(perf_metadata)
+        if engine == "vector":
+            metadata["engine"] = engine_by_mode[mode]
+        if instrument and engine_by_mode[mode] == "scalar":
+            summary = summarize_instrumentation(
+                per_mode_acc[mode].metadata_counts, per_mode_acc[mode].runs
+            )
+            summary["tag_cache"] = _tag_cache_summary(per_mode_acc[mode])
+            metadata["instrumentation"] = summary
+        stats.append(_aggregate_results(config, mode, per_mode_acc[mode], metadata))
+    return stats
 
 
 def run_until_precision(
@@ -652,32 +931,42 @@ def run_until_precision(
     seed: int | None,
     min_runs: int = 30,
     metric: str = "asr",
+    keep_runs: bool = False,
 ) -> tuple[AggregateStats, int]:
-    cfg = dataclasses.replace(config, mode=mode)
-    mode_rng = DeterministicRNG(seed)
-    results: list[SimulationRunResult] = []
-    for _ in range(max_runs):
-        scenario_seed = mode_rng.randint(0, 2**31 - 1)
-        results.append(simulate_one_run(cfg, rng=DeterministicRNG(scenario_seed)))
-        if len(results) >= min_runs:
-            legit_accepted = sum(result.legit_accepted for result in results)
-            legit_total = sum(result.legit_sent for result in results)
-            attack_accepted = sum(result.attack_success for result in results)
-            attack_total = sum(result.attack_attempts for result in results)
-            ci = (
-                wilson_ci(attack_accepted, attack_total)
-                if metric == "asr"
-                else wilson_ci(legit_accepted, legit_total)
-            )
-            if ci.half_width <= target_half_width:
-                break
-    stats = _aggregate_results(
-        cfg,
-        mode,
-        results,
-        {"stopping": "sequential", "target_half_width": target_half_width},
+    """Single-mode, serial ``run_modes_until_precision`` (one run per check)."""
+    (stats,) = run_modes_until_precision(
+        config,
+        [mode],
+        target_half_width=target_half_width,
+        max_runs=max_runs,
+        seed=seed,
+        min_runs=min_runs,
+        metric=metric,
+        batch_size=1,
+        keep_runs=keep_runs,
     )
-    return stats, len(results)
+    return stats, stats.runs
+
+
+class _TraceView:
+    """List-decoded view of a ``ScenarioTrace`` shared by every mode run on it.
+
+    Each column is unpacked on first access and cached, so a trace is decoded
+    (and digested) at most once however many modes walk it."""
+
+    def __init__(self, trace: ScenarioTrace) -> None:
+        self._trace = trace
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._trace, name)
+        if isinstance(value, (BitColumn, IntColumn, CommandColumn)):
+            value = value.tolist()
+        setattr(self, name, value)
+        return value
+
+    @cached_property
+    def trace_digest(self) -> str:
+        return self._trace.digest()
 
 
 def simulate_one_run_with_trace(
@@ -685,36 +974,97 @@ def simulate_one_run_with_trace(
     trace: ScenarioTrace,
     *,
     nonce_seed: int | None = None,
+    tag_table: TagTable | None = None,
+    plan: RunPlan | None = None,
 ) -> SimulationRunResult:
     """Simulate one run while consuming a pre-generated channel/attacker trace."""
+    plan = _resolve_plan(config, plan, tag_table)
+    return _drive([_trace_run(config, _TraceView(trace), nonce_seed=nonce_seed, plan=plan)])[0]
 
-    tag_bits = _tag_bits(config)
-    authenticator = _authenticator(config)
-    nonce_rng = DeterministicRNG(nonce_seed)
-    sender = Sender(
-        mode=config.mode,
-        shared_key=config.shared_key,
-        mac_length=max(1, tag_bits // 4),
-        authenticator=authenticator,
+
+def simulate_fused_with_trace(
+    configs: Sequence[SimulationConfig],
+    trace: ScenarioTrace,
+    *,
+    nonce_seeds: Sequence[int | None],
+    plans: Sequence[RunPlan | None] | None = None,
+    tag_table: TagTable | None = None,
+) -> list[SimulationRunResult]:
+    """Mode-fused paired engine: one walk over ``trace`` advances every config.
+
+    The trace is decoded and digested once and all runs step through it in
+    lockstep, one legitimate frame at a time. Sender tags go through the shared
+    ``TagTable``, so each (counter, command) MAC is computed once for all modes
+    with the same key and tag length. Receiver, attacker and cost state stay
+    per mode, so each result equals ``simulate_one_run_with_trace`` for that
+    config. Only the split of tag-cache hits versus misses can differ."""
+    return _simulate_fused_view(
+        configs, _TraceView(trace), nonce_seeds=nonce_seeds, plans=plans, tag_table=tag_table
     )
-    receiver = Receiver(
-        mode=config.mode,
-        shared_key=config.shared_key,
-        mac_length=max(1, tag_bits // 4),
-        window_size=config.window_size or 1,
-        g_hard=config.g_hard,
-        authenticator=authenticator,
-        max_outstanding_challenges=config.max_outstanding_challenges,
-        challenge_ttl_ticks=config.challenge_ttl_ticks,
-        command_risk=config.command_risk,
-        risk_high=config.risk_high,
-        critical_pending_capacity=config.critical_pending_capacity,
-        critical_ttl_ticks=config.critical_ttl_ticks,
-        policy_source=config.policy_source,
-        profile=config.profile,
-        command_impact=config.command_impact,
+
+
+def _simulate_fused_view(
+    configs: Sequence[SimulationConfig],
+    view: _TraceView,
+    *,
+    nonce_seeds: Sequence[int | None],
+    plans: Sequence[RunPlan | None] | None = None,
+    tag_table: TagTable | None = None,
+) -> list[SimulationRunResult]:
+    """``simulate_fused_with_trace`` on an existing view (its cached digest included)."""
+    if len(nonce_seeds) != len(configs):
+        raise ValueError("nonce_seeds must have one entry per config")
+    plan_list = list(plans) if plans is not None else [None] * len(configs)
+    return _drive(
+        [
+            _trace_run(
+                config,
+                view,
+                nonce_seed=nonce_seed,
+                plan=_resolve_plan(config, plan, tag_table),
+            )
+            for config, nonce_seed, plan in zip(configs, nonce_seeds, plan_list)
+        ]
     )
-    policy_table = _build_policy_table(config)
+
+
+def _drive(
+    runs: Sequence[Generator[None, None, SimulationRunResult]],
+) -> list[SimulationRunResult]:
+    """Advance every run one step per round until all have returned."""
+    results: list[SimulationRunResult | None] = [None] * len(runs)
+    live = list(enumerate(runs))
+    while live:
+        still_live = []
+        for index, run in live:
+            try:
+                next(run)
+            except StopIteration as stop:
+                results[index] = stop.value
+            else:
+                still_live.append((index, run))
+        live = still_live
+    return [result for result in results if result is not None]
+
+
+def _trace_run(
+    config: SimulationConfig,
+    trace: _TraceView,
+    *,
+    nonce_seed: int | None,
+    plan: RunPlan,
+) -> Generator[None, None, SimulationRunResult]:
+    """Trace-driven run as a generator that yields after each legitimate frame."""
+
+    plan.reset()
+    authenticator = plan.authenticator
+    tag_table = plan.tag_table
+    # Own tag lookups only: other fused runs touch the same table between steps.
+    tag_hits = tag_misses = 0
+    tag_mark = (tag_table.hits, tag_table.misses) if tag_table is not None else (0, 0)
+    nonce_rng = DeterministicRNG(nonce_seed)
+    sender = plan.sender
+    receiver = plan.receiver
 
     scheduler = EventScheduler()
     recorded: list[Frame] = []
@@ -777,33 +1127,26 @@ def simulate_one_run_with_trace(
         )
 
     def record_tx(frame: Frame) -> None:
-        size = _frame_bytes(frame, tag_bits, config.challenge_nonce_bits)
-        cost_stats.tx_bytes += size
+        cost_stats.tx_bytes += plan.frame_bytes(frame)
         if frame.mac is not None:
-            if authenticator.profile == "ascon":
+            if plan.ascon_ops:
                 cost_stats.ascon_ops += 1
             else:
                 cost_stats.hmac_ops += 1
-        cost_stats.state_bytes_peak = max(
-            cost_stats.state_bytes_peak,
-            _state_bytes(config, receiver),
-        )
+        cost_stats.state_bytes_peak = max(cost_stats.state_bytes_peak, plan.state_bytes())
 
     def process_arrived(frames: list[Frame]) -> None:
         nonlocal attack_success, legit_accepted
         for frame in frames:
             if not frame.is_attack and rx_pending.pop(id(frame), False):
                 recorded.append(frame.clone())  # rx: record at actual delivery
-            cost_stats.rx_bytes += _frame_bytes(frame, tag_bits, config.challenge_nonce_bits)
+            cost_stats.rx_bytes += plan.frame_bytes(frame)
             if frame.mac is not None:
-                if authenticator.profile == "ascon":
+                if plan.ascon_ops:
                     cost_stats.ascon_ops += 1
                 else:
                     cost_stats.hmac_ops += 1
-            cost_stats.state_bytes_peak = max(
-                cost_stats.state_bytes_peak,
-                _state_bytes(config, receiver),
-            )
+            cost_stats.state_bytes_peak = max(cost_stats.state_bytes_peak, plan.state_bytes())
             if frame.flags == Frame.FLAG_CRIT_PREPARE:   # 两阶段 critical 路由（D2）
                 committed = _resolve_critical(
                     receiver,
@@ -859,7 +1202,7 @@ def simulate_one_run_with_trace(
             window_size=receiver.window_size,
             g_hard=receiver.g_hard,
             last_counter=receiver.state.last_counter,
-            received_mask=tuple(receiver.state.received_mask),
+            received_mask=receiver.state.received_mask,
             policy_table=receiver.policy_table,
         )
 
@@ -915,7 +1258,7 @@ def simulate_one_run_with_trace(
                 transport=_reboot_transport,
             ):
                 cost_stats.epoch_recoveries += 1
-        if _is_two_phase_critical(config, command, policy_table):
+        if plan.is_two_phase_critical(command):
             cost_stats.critical_command_count += 1   # D6：legit 两阶段命令单点计数
             frame = sender.begin_critical_intent(
                 command,
@@ -965,6 +1308,13 @@ def simulate_one_run_with_trace(
                 if not attempt_replay():
                     break
 
+        if tag_table is not None:
+            tag_hits += tag_table.hits - tag_mark[0]
+            tag_misses += tag_table.misses - tag_mark[1]
+        yield
+        if tag_table is not None:
+            tag_mark = (tag_table.hits, tag_table.misses)
+
     if config.attack_mode is AttackMode.POST_RUN:
         process_arrived(flush_traced())
         for _ in range(remaining_replays):
@@ -973,7 +1323,13 @@ def simulate_one_run_with_trace(
 
     process_arrived(flush_traced())
 
-    energy = estimate_energy(cost_stats, CostModel())
+    tag_counts: dict[str, int] = {}
+    if tag_table is not None:
+        tag_counts = {
+            "tag_cache_hits": tag_hits + tag_table.hits - tag_mark[0],
+            "tag_cache_misses": tag_misses + tag_table.misses - tag_mark[1],
+        }
+    energy = estimate_energy(cost_stats, plan.cost_model)
     legit_rate = legit_accepted / legit_sent if legit_sent else 0.0
     crypto_ops = cost_stats.hmac_ops + cost_stats.ascon_ops
     return SimulationRunResult(
@@ -1009,47 +1365,179 @@ def simulate_one_run_with_trace(
             "window_size": config.window_size,
             "attack_mode": config.attack_mode.value,
             "auth_profile": authenticator.profile,
-            "trace_digest": trace.digest(),
+            "trace_digest": trace.trace_digest,
             "legit_drop_count": trace.legit_drop_count,
         },
+        diagnostics=tag_counts,
     )
 
 
+def _paired_nonce_seed(trace_seed: int, mode: Mode) -> int:
+    return trace_seed + sum(mode.value.encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class _PairedTraceRuns:
+    """One trace's identity plus one result per mode."""
+
+    trace_digest: str
+    legit_drop_count: int
+    results: tuple[SimulationRunResult, ...]
+
+
+@dataclass
+class _PairedChunk:
+    """Worker output for a slice of trace seeds: per-trace identities (seed order)
+    and one accumulator per mode."""
+
+    trace_digests: list[str]
+    legit_drop_counts: list[int]
+    accumulators: list[RunAccumulator]
+
+
+def _trim_paired_metadata(result: SimulationRunResult) -> SimulationRunResult:
+    return dataclasses.replace(result, metadata={})
+
+
+def _iter_paired_runs(
+    base_config: SimulationConfig,
+    modes: Sequence[Mode],
+    trace_seeds: Iterable[int],
+    tag_table: TagTable | None = None,
+    *,
+    trim: bool = False,
+    trace_cache: TraceCache | None = None,
+) -> Iterator[_PairedTraceRuns]:
+    """Stream traces: each one is generated, run under every mode (fused), then released.
+
+    Only the digest, drop count and per-mode results outlive the trace, so memory
+    stays O(one trace) however many seeds are fed in."""
+    per_mode_configs = [dataclasses.replace(base_config, mode=mode) for mode in modes]
+    plans = [compile_run_plan(config, tag_table) for config in per_mode_configs]
+    for trace_seed, trace in iter_traces(base_config, trace_seeds, trace_cache):
+        view = _TraceView(trace)
+        results = tuple(
+            _simulate_fused_view(
+                per_mode_configs,
+                view,
+                nonce_seeds=[_paired_nonce_seed(trace_seed, mode) for mode in modes],
+                plans=plans,
+            )
+        )
+        if trim:
+            results = tuple(_trim_paired_metadata(result) for result in results)
+        # the runs already hashed the trace through the view; reuse that digest
+        yield _PairedTraceRuns(view.trace_digest, trace.legit_drop_count, results)
+
+
+def _simulate_paired_chunk(
+    base_config: SimulationConfig,
+    modes: Sequence[Mode],
+    trace_seeds: Sequence[int],
+    tag_table: TagTable | None = None,
+    trace_cache: TraceCache | None = None,
+    keep_runs: bool = False,
+) -> _PairedChunk:
+    """Worker entry point: generate each trace locally and run every mode on it.
+
+    Traces never cross the process boundary and runs are folded into per-mode
+    accumulators; kept runs (``keep_runs``) have their metadata trimmed to the
+    tag-cache counters (digest/drop count travel separately)."""
+    chunk = _PairedChunk([], [], [RunAccumulator(keep_runs=keep_runs) for _ in modes])
+    for paired in _iter_paired_runs(
+        base_config,
+        modes,
+        trace_seeds,
+        _worker_tag_table(tag_table),
+        trim=keep_runs,
+        trace_cache=trace_cache,
+    ):
+        chunk.trace_digests.append(paired.trace_digest)
+        chunk.legit_drop_counts.append(paired.legit_drop_count)
+        for acc, result in zip(chunk.accumulators, paired.results):
+            acc.add(result)
+    return chunk
+
+
 def run_paired_experiments(
     base_config: SimulationConfig,
     modes: Sequence[Mode],
     runs: int,
     seed: int | None = None,
     show_progress: bool = True,
+    workers: int = 1,
+    tag_table: TagTable | None = None,
+    trace_cache: TraceCache | None = None,
+    keep_runs: bool = False,
+    progress: ProgressReporter | None = None,
 ) -> list[AggregateStats]:
+    """Run every mode on the same streamed traces (common random numbers).
+
+    ``workers > 1`` hands each worker a contiguous slice of ``trace_seeds``; the
+    worker rebuilds its traces from the seeds, so pairing and results are unchanged.
+    ``tag_table`` is shared as in ``run_many_experiments``. ``trace_cache`` loads
+    traces from the on-disk cache instead of regenerating them (same values).
+    Runs are accumulated as in ``run_many_experiments`` (``keep_runs`` and
+    ``progress`` likewise; progress counts traces, all modes at once).
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers!r}")
     trace_rng = DeterministicRNG(seed)
     trace_seeds = [trace_rng.randint(0, 2**31 - 1) for _ in range(runs)]
-    traces = [generate_trace(base_config, trace_seed) for trace_seed in trace_seeds]
-    trace_digests = [trace.digest() for trace in traces]
-    legit_drop_counts = [trace.legit_drop_count for trace in traces]
     per_mode_configs = {mode: dataclasses.replace(base_config, mode=mode) for mode in modes}
-    per_mode_results: dict[Mode, list[SimulationRunResult]] = {mode: [] for mode in modes}
-
-    if show_progress:
-        print("\n" + "=" * 80)
-        print("STARTING PAIRED MONTE CARLO SIMULATION")
-        print("=" * 80 + "\n")
-
-    for run_idx, (trace_seed, trace) in enumerate(zip(trace_seeds, traces)):
-        for mode, config in per_mode_configs.items():
-            mode_seed = trace_seed + sum(mode.value.encode("utf-8"))
-            per_mode_results[mode].append(
-                simulate_one_run_with_trace(config, trace, nonce_seed=mode_seed)
-            )
-        if show_progress and ((run_idx + 1) % 10 == 0 or run_idx == runs - 1):
-            bar_length = 50
-            filled = int(bar_length * (run_idx + 1) / runs)
-            bar = "#" * filled + "." * (bar_length - filled)
-            sys.stdout.write(f"\r   Progress: [{bar}] {run_idx + 1}/{runs} runs")
-            sys.stdout.flush()
+    per_mode_acc = {mode: RunAccumulator(keep_runs=keep_runs) for mode in modes}
+    table = _batch_tag_table(base_config, tag_table, precompute=workers > 1)
+
+    reporter = resolve_reporter(progress, show_progress)
+    tracker = None if reporter is None else ProgressTracker(reporter, "paired", runs)
+    if reporter is not None:
+        reporter.start("STARTING PAIRED MONTE CARLO SIMULATION")
+
+    trace_digests: list[str] = []
+    legit_drop_counts: list[int] = []
+    mode_list = list(per_mode_configs)
+
+    if workers > 1:
+        executor = _process_pool(workers, table)
+        try:
+            futures = [
+                executor.submit(
+                    _simulate_paired_chunk,
+                    base_config,
+                    mode_list,
+                    chunk,
+                    None,
+                    trace_cache,
+                    keep_runs,
+                )
+                for chunk in _shard(trace_seeds, workers * 4)
+            ]
+            for future in futures:
+                done = future.result()
+                trace_digests.extend(done.trace_digests)
+                legit_drop_counts.extend(done.legit_drop_counts)
+                for mode, acc in zip(mode_list, done.accumulators):
+                    per_mode_acc[mode].merge(acc)
+                if tracker is not None:
+                    tracker.advance(len(done.trace_digests))
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown()
+    else:
+        for paired in _iter_paired_runs(
+            base_config, mode_list, trace_seeds, table, trace_cache=trace_cache
+        ):
+            trace_digests.append(paired.trace_digest)
+            legit_drop_counts.append(paired.legit_drop_count)
+            for mode, result in zip(mode_list, paired.results):
+                per_mode_acc[mode].add(result)
+            if tracker is not None:
+                tracker.advance()
 
-    if show_progress:
-        print()
+    if reporter is not None:
+        reporter.finish()
 
     stats: list[AggregateStats] = []
     for mode, config in per_mode_configs.items():
@@ -1057,7 +1545,7 @@ def run_paired_experiments(
             _aggregate_results(
                 config,
                 mode,
-                per_mode_results[mode],
+                per_mode_acc[mode],
                 {
                     "paired": True,
                     "trace_digests": trace_digests,
@@ -1068,13 +1556,207 @@ def run_paired_experiments(
     return stats
 
 
-def _mean(values: list[float]) -> float:
-    if not values:
-        return 0.0
-    return statistics.fmean(values)
+def _simulate_seed_runs(
+    config: SimulationConfig,
+    scenario_seeds: Sequence[int],
+    tag_table: TagTable | None = None,
+    plan: RunPlan | None = None,
+) -> list[SimulationRunResult]:
+    """One live run per scenario seed, in seed order (worker entry point)."""
+    plan = plan if plan is not None else compile_run_plan(config, _worker_tag_table(tag_table))
+    return [
+        simulate_one_run(config, rng=DeterministicRNG(seed), plan=plan) for seed in scenario_seeds
+    ]
+
+
+def _simulate_paired_runs(
+    base_config: SimulationConfig,
+    modes: Sequence[Mode],
+    trace_seeds: Sequence[int],
+    tag_table: TagTable | None = None,
+) -> list[_PairedTraceRuns]:
+    """Paired runs for ``modes`` on each trace seed, in seed order (worker entry point)."""
+    return list(_iter_paired_runs(base_config, modes, trace_seeds, _worker_tag_table(tag_table)))
+
 
+def _fold_until_precise(
+    acc: RunAccumulator,
+    results: Iterable[SimulationRunResult],
+    *,
+    min_runs: int,
+    metric: str,
+    target_half_width: float,
+) -> bool:
+    """Add ``results`` in order, stopping at the first run that meets the target.
+
+    Runs past that point are discarded, so the stopping run (and the aggregate)
+    do not depend on how the runs were batched."""
+    for result in results:
+        acc.add(result)
+        if acc.runs >= min_runs:
+            ci = acc.asr_ci() if metric == "asr" else acc.lar_ci()
+            if ci.half_width <= target_half_width:
+                return True
+    return False
 
-def _std(values: list[float]) -> float:
-    if len(values) <= 1:
-        return 0.0
-    return statistics.stdev(values)
+
+def run_modes_until_precision(
+    base_config: SimulationConfig,
+    modes: Sequence[Mode],
+    *,
+    target_half_width: float,
+    max_runs: int,
+    seed: int | None,
+    min_runs: int = 30,
+    metric: str = "asr",
+    workers: int = 1,
+    batch_size: int | None = None,
+    paired: bool = False,
+    keep_runs: bool = False,
+    show_progress: bool = False,
+    progress: ProgressReporter | None = None,
+) -> list[AggregateStats]:
+    """Sequential stopping for several modes at once, in parallel batches.
+
+    Each round dispatches ``batch_size`` runs for every mode that has not yet met
+    its target. The Wilson half-width of ``metric`` ("asr" or "lar") is checked
+    after every run, with running counts. Each mode stops on its own. Live
+    runs draw scenario seeds from a per-mode ``DeterministicRNG(seed)``, exactly
+    like ``run_until_precision``. ``paired=True`` instead runs the still-active
+    modes on shared traces, as in ``run_paired_experiments``. Both give the same
+    aggregates for any ``workers``/``batch_size``. Batching only decides how many
+    surplus runs of the final round are computed and thrown away.
+
+    ``progress`` (or a console bar with ``show_progress``) is advanced once per
+    round under the label ``"precision"``, up to ``max_runs``; an exception it
+    raises (e.g. ``JobCancelled``) aborts the batch. Besides the stopping rule,
+    metadata carries the timing of ``run_many_experiments`` or, with ``paired``,
+    each mode's trace digests and drop counts as in ``run_paired_experiments``.
+    There is no ``total_runs``: modes stop after different run counts.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers!r}")
+    batch = batch_size if batch_size is not None else max(min_runs, 16 * workers)
+    if batch < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size!r}")
+    per_mode_configs = {mode: dataclasses.replace(base_config, mode=mode) for mode in modes}
+    per_mode_acc = {mode: RunAccumulator(keep_runs=keep_runs) for mode in modes}
+    table = TagTable()
+    seed_rngs = {mode: DeterministicRNG(seed) for mode in modes}
+    trace_rng = DeterministicRNG(seed)
+    plans: dict[Mode, RunPlan] = {}
+    trace_digests: list[str] = []
+    legit_drop_counts: list[int] = []
+    active = list(per_mode_configs)
+    issued = 0
+    start_time = time.time()
+    reporter = resolve_reporter(progress, show_progress)
+    tracker = None if reporter is None else ProgressTracker(reporter, "precision", max_runs)
+    if reporter is not None:
+        reporter.start("STARTING SEQUENTIAL-STOPPING SIMULATION")
+    executor: Executor | None = _process_pool(workers, table) if workers > 1 else None
+    try:
+        while active and issued < max_runs:
+            count = min(batch, max_runs - issued)
+            issued += count
+            if paired:
+                trace_seeds = [trace_rng.randint(0, 2**31 - 1) for _ in range(count)]
+                rows = _paired_precision_batch(
+                    executor, workers, base_config, active, trace_seeds, table
+                )
+                trace_digests.extend(row.trace_digest for row in rows)
+                legit_drop_counts.extend(row.legit_drop_count for row in rows)
+                batch_results = {
+                    mode: [row.results[index] for row in rows]
+                    for index, mode in enumerate(active)
+                }
+            else:
+                scenario_seeds = {
+                    mode: [seed_rngs[mode].randint(0, 2**31 - 1) for _ in range(count)]
+                    for mode in active
+                }
+                if executor is None:
+                    batch_results = {}
+                    for mode in active:
+                        config = per_mode_configs[mode]
+                        if mode not in plans:
+                            plans[mode] = compile_run_plan(config, table)
+                        batch_results[mode] = _simulate_seed_runs(
+                            config, scenario_seeds[mode], plan=plans[mode]
+                        )
+                else:
+                    pending = {
+                        mode: [
+                            executor.submit(
+                                _simulate_seed_runs, per_mode_configs[mode], chunk
+                            )
+                            for chunk in _shard(scenario_seeds[mode], workers)
+                        ]
+                        for mode in active
+                    }
+                    batch_results = {
+                        mode: [result for future in futures for result in future.result()]
+                        for mode, futures in pending.items()
+                    }
+            active = [
+                mode
+                for mode in active
+                if not _fold_until_precise(
+                    per_mode_acc[mode],
+                    batch_results[mode],
+                    min_runs=min_runs,
+                    metric=metric,
+                    target_half_width=target_half_width,
+                )
+            ]
+            if tracker is not None:
+                # every mode met its target: the rest of the budget is not needed
+                tracker.advance(count if active else max_runs - tracker.completed)
+    except BaseException:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if reporter is not None:
+            reporter.finish()
+
+    metadata: dict[str, object] = {"stopping": "sequential", "target_half_width": target_half_width}
+    if not paired:
+        total_runs = sum(acc.runs for acc in per_mode_acc.values())
+        total_time = time.time() - start_time
+        metadata.update(
+            total_time=total_time,
+            time_per_run=total_time / total_runs if total_runs > 0 else 0,
+        )
+    stats: list[AggregateStats] = []
+    for mode, config in per_mode_configs.items():
+        mode_metadata = dict(metadata)
+        if paired:
+            # a mode ran on every trace until it stopped, so its runs are a prefix
+            runs = per_mode_acc[mode].runs
+            mode_metadata.update(
+                paired=True,
+                trace_digests=trace_digests[:runs],
+                legit_drop_counts_by_run=legit_drop_counts[:runs],
+            )
+        stats.append(_aggregate_results(config, mode, per_mode_acc[mode], mode_metadata))
+    return stats
+
+
+def _paired_precision_batch(
+    executor: Executor | None,
+    workers: int,
+    base_config: SimulationConfig,
+    modes: Sequence[Mode],
+    trace_seeds: Sequence[int],
+    tag_table: TagTable,
+) -> list[_PairedTraceRuns]:
+    if executor is None:
+        return _simulate_paired_runs(base_config, modes, trace_seeds, tag_table)
+    futures = [
+        executor.submit(_simulate_paired_runs, base_config, modes, chunk)
+        for chunk in _shard(trace_seeds, workers)
+    ]
+    return [row for future in futures for row in future.result()]
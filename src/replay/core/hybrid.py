@@ -0,0 +1,329 @@
+"""Hybrid analytic / Monte-Carlo estimator for the configs the ``a_W`` model covers.
+
+For ``Mode.WINDOW`` on an iid, in-order channel (``p_reorder == 0``) a legit frame
+is accepted iff it is delivered, so LAR is exactly ``1 - p_loss``: it is reported
+analytically, with a zero-width interval.
+
+ASR has no closed form once replays interact (a forward-accepted replay moves the
+window for the next one; a second pick of a frame is a duplicate). For post-run
+replays by a random attacker that recorded every frame, ``a_W`` still gives the
+exact mean of a strongly correlated control. Per replay of frame ``i`` (of ``N``)
+
+    Z = 1[i lost] * 1[frames i+W .. N-1 all lost] * 1[replay delivered]
+
+which is the acceptance event of a lone replay, and
+
+    E[Z] = (1 - p) * sum_i P(pick = i) * p * a_W(N-1-i, p, W)
+
+with the exact pick distribution of ``getrandbits(31) % N``. Runs are simulated on
+paired traces, so each run's control ``X = mean(Z)`` is read off its trace, and the
+ASR is the regression estimate ``mean(Y) - beta * (mean(X) - E[X])``. With a single
+replay per run ``Y == X``, so the ASR is the analytic ``E[Z]`` itself.
+
+Everything else (other modes, bursty/trace channels, reordering, inline or weak
+attacks, adaptive/rx/lossy attackers) is plain paired Monte Carlo, and so is a
+control-variate interval that comes out no tighter than the Wilson one.
+``metadata["estimator"]`` names the path behind each rate (``ESTIMATOR_PATHS``)
+and, for ``mc``, why. A rate that is not plain MC no longer matches its
+accepted/total counts, so those counts move into the rate's provenance as
+``mc_counts`` and the top-level counts are zeroed.
+"""
+from __future__ import annotations
+
+import dataclasses
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .accumulator import RunAccumulator
+from .analytic.models import a_W
+from .experiment import (
+    _aggregate_results,
+    _paired_nonce_seed,
+    compile_run_plan,
+    simulate_fused_with_trace,
+)
+from .progress import ProgressReporter, ProgressTracker, resolve_reporter
+from .rng import DeterministicRNG
+from .security import TagTable
+from .stats import _Z
+from .trace import ScenarioTrace, iter_traces
+from .trace_cache import TraceCache
+from .types import AggregateStats, AttackMode, Mode, SimulationConfig
+
+# Path labels of metadata["estimator"]; only "analytic" is exact.
+ESTIMATOR_PATHS = {
+    "analytic": "closed form (LAR; ASR only with at most one replay per run)",
+    "control_variate": "Monte Carlo regression estimate on the a_W control",
+    "mc": "plain paired Monte Carlo",
+}
+
+_PICK_SPACE = 1 << 31  # trace replay picks are getrandbits(31)
+
+
+def lar_coverage(config: SimulationConfig) -> str | None:
+    """``None`` when LAR is exactly ``1 - p_loss``; otherwise why it is not."""
+    if config.mode is not Mode.WINDOW:
+        return f"mode {config.mode.value!r} is not modelled"
+    if config.channel_model != "iid":
+        return f"channel_model {config.channel_model!r} is not iid"
+    if config.p_reorder > 0:
+        return "p_reorder > 0 reorders deliveries"
+    if config.num_legit < 1:
+        return "no legit frames"
+    return None
+
+
+def asr_coverage(config: SimulationConfig) -> str | None:
+    """``None`` when the ``a_W`` control applies to the ASR; otherwise why not."""
+    reason = lar_coverage(config)
+    if reason is not None:
+        return reason
+    if config.attack_mode is not AttackMode.POST_RUN:
+        return "inline replays interleave with legit frames"
+    if config.attacker_inject_strength != "strong":
+        return "weak injection adds attack-only drops"
+    if config.attacker_strategy != "random" or config.target_commands:
+        return "attacker picks are not uniform over the recording"
+    if config.attacker_position == "rx" or config.attacker_record_loss > 0:
+        return "attacker does not record every legit frame"
+    return None
+
+
+def pick_probabilities(num_legit: int) -> list[float]:
+    """Exact ``P(pick = i)`` of the trace pick ``getrandbits(31) % num_legit``."""
+    return [((_PICK_SPACE - 1 - i) // num_legit + 1) / _PICK_SPACE for i in range(num_legit)]
+
+
+def replay_control_mean(num_legit: int, p_loss: float, w: int) -> float:
+    """``E[Z]``: probability that one post-run replay is accepted on its own."""
+    weights = pick_probabilities(num_legit)
+    total = math.fsum(
+        weight * p_loss * a_W(num_legit - 1 - i, p_loss, w) for i, weight in enumerate(weights)
+    )
+    return (1.0 - p_loss) * total
+
+
+def replay_control(trace: ScenarioTrace, num_legit: int, w: int) -> float:
+    """One run's control ``X``: the fraction of its replays whose lone-replay
+    acceptance event (see the module docstring) holds on ``trace``."""
+    dropped = trace.legit_dropped.tolist()[:num_legit]
+    picks = trace.replay_pick.tolist()
+    if not picks:
+        return 0.0
+    tail = num_legit  # frames tail .. N-1 are all lost
+    while tail > 0 and dropped[tail - 1]:
+        tail -= 1
+    hits = 0
+    for pick, replay_lost in zip(picks, trace.replay_dropped.tolist()):
+        index = pick % num_legit
+        if dropped[index] and index + w >= tail and not replay_lost:
+            hits += 1
+    return hits / len(picks)
+
+
+@dataclass(frozen=True)
+class ControlVariateEstimate:
+    estimate: float
+    half_width: float
+    beta: float
+    variance_reduction: float
+
+
+def control_variate_estimate(
+    y: Sequence[float], x: Sequence[float], mean_x: float, confidence: float = 0.95
+) -> ControlVariateEstimate | None:
+    """Regression estimate of ``E[y]`` given the known ``E[x] = mean_x``.
+
+    The half-width is the normal interval of the fitted value at ``x = mean_x``.
+    ``None`` when there are fewer than three samples or ``x`` is constant."""
+    n = len(y)
+    if n != len(x):
+        raise ValueError("y and x must have the same length")
+    if n < 3:
+        return None
+    y_bar = math.fsum(y) / n
+    x_bar = math.fsum(x) / n
+    sxx = math.fsum((xi - x_bar) ** 2 for xi in x)
+    if sxx <= 0.0:
+        return None
+    syy = math.fsum((yi - y_bar) ** 2 for yi in y)
+    sxy = math.fsum((xi - x_bar) * (yi - y_bar) for xi, yi in zip(x, y))
+    beta = sxy / sxx
+    residual = max(0.0, syy - beta * sxy) / (n - 2)
+    se = math.sqrt(residual * (1.0 / n + (x_bar - mean_x) ** 2 / sxx))
+    return ControlVariateEstimate(
+        estimate=y_bar - beta * (x_bar - mean_x),
+        half_width=_Z.get(confidence, 1.96) * se,
+        beta=beta,
+        variance_reduction=(syy / (n - 1)) / residual if residual > 0 else math.inf,
+    )
+
+
+@dataclass
+class _ModeState:
+    config: SimulationConfig
+    lar_reason: str | None
+    asr_reason: str | None
+    control_mean: float = 0.0
+    acc: RunAccumulator = field(default_factory=RunAccumulator)
+    y: list[float] = field(default_factory=list)
+    x: list[float] = field(default_factory=list)
+
+    @property
+    def asr_exact(self) -> bool:
+        return self.asr_reason is None and self.config.num_replay <= 1
+
+    def asr(self) -> tuple[float, float, float, dict[str, Any]]:
+        """``(estimate, ci_low, ci_high, provenance)`` of the attack success rate."""
+        wilson = self.acc.asr_ci()
+        if self.asr_reason is not None:
+            mc_path = {"path": "mc", "reason": self.asr_reason}
+            return self.acc.mean("attack_success_rate"), wilson.lower, wilson.upper, mc_path
+        if self.asr_exact:
+            value = self.control_mean if self.config.num_replay else 0.0
+            return value, value, value, {"path": "analytic"}
+        cv = control_variate_estimate(self.y, self.x, self.control_mean)
+        if cv is None or cv.half_width >= wilson.half_width:
+            reason = (
+                "control has no variance" if cv is None else "control did not tighten the CI"
+            )
+            mc_path = {"path": "mc", "reason": reason}
+            return self.acc.mean("attack_success_rate"), wilson.lower, wilson.upper, mc_path
+        return (
+            cv.estimate,
+            max(0.0, cv.estimate - cv.half_width),
+            min(1.0, cv.estimate + cv.half_width),
+            {
+                "path": "control_variate",
+                "beta": cv.beta,
+                "variance_reduction": cv.variance_reduction,
+                "mc_ci": [wilson.lower, wilson.upper],
+            },
+        )
+
+    def half_width(self, metric: str) -> float:
+        if metric == "lar":
+            return 0.0 if self.lar_reason is None else self.acc.lar_ci().half_width
+        _, low, high, _ = self.asr()
+        return (high - low) / 2
+
+    def aggregate(self) -> AggregateStats:
+        stats = _aggregate_results(
+            self.config,
+            self.config.mode,
+            self.acc,
+            {"paired": True},
+        )
+        asr, asr_low, asr_high, asr_path = self.asr()
+        lar_path: dict[str, Any]
+        if self.lar_reason is None:
+            lar = 1.0 - self.config.p_loss
+            lar_path = {
+                "path": "analytic",
+                "mc_counts": [stats.legit_accepted, stats.legit_total],
+            }
+            stats = dataclasses.replace(
+                stats,
+                avg_legit_rate=lar,
+                lar_ci_low=lar,
+                lar_ci_high=lar,
+                legit_accepted=0,
+                legit_total=0,
+            )
+        else:
+            lar_path = {"path": "mc", "reason": self.lar_reason}
+        if asr_path["path"] != "mc":
+            asr_path["mc_counts"] = [stats.attack_accepted, stats.attack_total]
+            stats = dataclasses.replace(stats, attack_accepted=0, attack_total=0)
+        stats.metadata["estimator"] = {"lar": lar_path, "asr": asr_path}
+        return dataclasses.replace(
+            stats, avg_attack_rate=asr, asr_ci_low=asr_low, asr_ci_high=asr_high
+        )
+
+
+def run_hybrid_experiments(
+    base_config: SimulationConfig,
+    modes: Sequence[Mode],
+    runs: int,
+    seed: int | None = None,
+    *,
+    target_half_width: float | None = None,
+    max_runs: int = 2000,
+    min_runs: int = 30,
+    metric: str = "asr",
+    show_progress: bool = False,
+    tag_table: TagTable | None = None,
+    trace_cache: TraceCache | None = None,
+    progress: ProgressReporter | None = None,
+) -> list[AggregateStats]:
+    """Run every mode on shared paired traces and estimate each rate by the
+    cheapest path that covers it (see the module docstring).
+
+    Traces and nonce seeds are those of ``run_paired_experiments``, so the
+    cost metrics and counts (top-level, or ``mc_counts`` for estimated rates)
+    equal a paired batch of the same runs. With ``target_half_width`` each mode
+    runs in batches of ``min_runs`` until the interval of ``metric`` ("asr" or
+    "lar") is that narrow, or ``max_runs``; analytic rates are done after the
+    first batch. Runs stay in-process (there is no ``workers`` option).
+    """
+    if metric not in ("asr", "lar"):
+        raise ValueError(f"metric must be 'asr' or 'lar', got {metric!r}")
+    if min_runs < 1:
+        raise ValueError(f"min_runs must be >= 1, got {min_runs!r}")
+    states: dict[Mode, _ModeState] = {}
+    for mode in modes:
+        config = dataclasses.replace(base_config, mode=mode)
+        state = _ModeState(config, lar_coverage(config), asr_coverage(config))
+        if state.asr_reason is None:
+            state.control_mean = replay_control_mean(
+                config.num_legit, config.p_loss, config.window_size
+            )
+        states[mode] = state
+    table = tag_table if tag_table is not None else TagTable()
+    plans = {mode: compile_run_plan(state.config, table) for mode, state in states.items()}
+
+    budget = runs if target_half_width is None else max_runs
+    batch = budget if target_half_width is None else min(min_runs, budget)
+    reporter = resolve_reporter(progress, show_progress)
+    tracker = None if reporter is None else ProgressTracker(reporter, "hybrid", budget)
+    if reporter is not None:
+        reporter.start("STARTING HYBRID ANALYTIC/MONTE CARLO ESTIMATION")
+
+    trace_rng = DeterministicRNG(seed)
+    active = list(states)
+    issued = 0
+    while active and issued < budget:
+        count = min(batch, budget - issued)
+        issued += count
+        trace_seeds = [trace_rng.randint(0, 2**31 - 1) for _ in range(count)]
+        for trace_seed, trace in iter_traces(base_config, trace_seeds, trace_cache):
+            results = simulate_fused_with_trace(
+                [states[mode].config for mode in active],
+                trace,
+                nonce_seeds=[_paired_nonce_seed(trace_seed, mode) for mode in active],
+                plans=[plans[mode] for mode in active],
+            )
+            for mode, result in zip(active, results):
+                state = states[mode]
+                state.acc.add(result)
+                if state.asr_reason is not None or state.asr_exact:
+                    continue
+                state.y.append(result.attack_success_rate)
+                state.x.append(
+                    replay_control(trace, state.config.num_legit, state.config.window_size)
+                )
+            if tracker is not None:
+                tracker.advance()
+        if target_half_width is not None:
+            active = [
+                mode for mode in active if states[mode].half_width(metric) > target_half_width
+            ]
+
+    if tracker is not None and issued < budget:
+        # every mode hit the precision target early: the rest of the budget is not needed
+        tracker.advance(budget - issued)
+    if reporter is not None:
+        reporter.finish()
+    return [states[mode].aggregate() for mode in modes]
@@ -0,0 +1,183 @@
+"""Opt-in hot-path instrumentation for ``simulate_one_run``.
+
+A ``RunProbe`` wraps the per-run objects (authenticator, ``Receiver.process``,
+the channel's ``EventScheduler`` and the attacker) with timing shims for one
+run and restores them afterwards. Nothing is patched at class level, so
+uninstrumented runs, and concurrent runs in other threads, pay nothing.
+
+Timings are integer nanoseconds, so per-run values are plain ``int`` metadata
+that ``RunAccumulator`` sums across runs and worker shards. Stages nest:
+``receiver`` includes the verifies it triggers, and ``run`` is the whole run.
+``tag_calls`` counts every ``tag()`` call, tag-table hits included. The batch
+summary's ``tag_cache`` hits/misses show how many MACs the HMAC tag table
+actually computed; they depend on how runs were spread over processes and are
+therefore only exported here.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+STAGES = ("run", "mac", "receiver", "scheduler", "attacker")
+COUNTERS = (
+    "tag_calls",
+    "verifies",
+    "frames_processed",
+    "heap_pushes",
+    "heap_pops",
+    "clones",
+    "candidate_scans",
+)
+INSTRUMENT_KEYS = (
+    tuple(f"stage_ns.{stage}" for stage in STAGES)
+    + tuple(f"stage_calls.{stage}" for stage in STAGES)
+    + tuple(f"ops.{name}" for name in COUNTERS)
+)
+
+
+class _TimedAuthenticator:
+    """Authenticator proxy whose ``tag``/``verify`` are timed; the rest delegates."""
+
+    def __init__(self, inner: Any, probe: RunProbe) -> None:
+        self.inner = inner
+        self.tag = probe.timed("mac", inner.tag, counter="tag_calls")
+        self.verify = probe.timed("mac", inner.verify, counter="verifies")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+
+class RunProbe:
+    """Stage wall time (ns), stage call counts and operation counters of one run."""
+
+    __slots__ = ("ns", "calls", "counts", "_restore")
+
+    def __init__(self) -> None:
+        self.ns = dict.fromkeys(STAGES, 0)
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self._restore: list[Callable[[], None]] = []
+
+    def timed(self, stage: str, fn: _F, *, counter: str | None = None) -> _F:
+        """``fn`` wrapped to add its wall time to ``stage`` (and 1 to ``counter``)."""
+        ns, calls, counts = self.ns, self.calls, self.counts
+        clock = time.perf_counter_ns
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                ns[stage] += clock() - start
+                calls[stage] += 1
+                if counter is not None:
+                    counts[counter] += 1
+
+        return wrapper  # type: ignore[return-value]
+
+    def attach(self, *, sender: Any, receiver: Any, scheduler: Any, attacker: Any) -> None:
+        """Install the shims; ``sender``/``receiver`` belong to a reusable ``RunPlan``
+        and are put back by ``detach``. ``scheduler`` and ``attacker`` are per run."""
+        authenticator = receiver.authenticator
+        timed_auth = _TimedAuthenticator(authenticator, self)
+        receiver.authenticator = timed_auth
+        self._restore.append(lambda: setattr(receiver, "authenticator", authenticator))
+        if sender.authenticator is authenticator:
+            sender.authenticator = timed_auth
+            self._restore.append(lambda: setattr(sender, "authenticator", authenticator))
+        receiver.process = self.timed("receiver", receiver.process, counter="frames_processed")
+        self._restore.append(lambda: delattr(receiver, "process"))
+        self._attach_scheduler(scheduler)
+        self._attach_attacker(attacker)
+
+    def detach(self) -> None:
+        while self._restore:
+            self._restore.pop()()
+
+    def _attach_scheduler(self, scheduler: Any) -> None:
+        scheduler.submit = self.timed("scheduler", scheduler.submit, counter="heap_pushes")
+        drain = scheduler._drain
+        queues = scheduler._queues
+        ns, calls, counts = self.ns, self.calls, self.counts
+        clock = time.perf_counter_ns
+
+        def timed_drain(direction: Any, due_only: bool) -> list:
+            queue = queues[direction]
+            before = len(queue)
+            start = clock()
+            try:
+                return drain(direction, due_only)
+            finally:
+                ns["scheduler"] += clock() - start
+                calls["scheduler"] += 1
+                counts["heap_pops"] += before - len(queue)
+
+        scheduler._drain = timed_drain
+
+    def _attach_attacker(self, attacker: Any) -> None:
+        # Strategies clone on every recorded observation and on every pick; the
+        # candidate filter scans the whole recording.
+        recorded = getattr(attacker, "_recorded", None)
+        if recorded is None:
+            attacker.observe = self.timed("attacker", attacker.observe)
+            attacker.pick_frame = self.timed("attacker", attacker.pick_frame)
+            return
+        observe = self.timed("attacker", attacker.observe)
+        pick_frame = self.timed("attacker", attacker.pick_frame)
+        counts = self.counts
+
+        def counted_observe(*args: Any, **kwargs: Any) -> None:
+            before = len(recorded)
+            observe(*args, **kwargs)
+            counts["clones"] += len(recorded) - before
+
+        def counted_pick(*args: Any, **kwargs: Any) -> Any:
+            counts["candidate_scans"] += len(recorded)
+            frame = pick_frame(*args, **kwargs)
+            if frame is not None:
+                counts["clones"] += 1
+            return frame
+
+        attacker.observe = counted_observe
+        attacker.pick_frame = counted_pick
+
+    def metadata(self) -> dict[str, int]:
+        """Flat ``int`` metadata (``INSTRUMENT_KEYS``) for ``SimulationRunResult``."""
+        return {
+            **{f"stage_ns.{stage}": value for stage, value in self.ns.items()},
+            **{f"stage_calls.{stage}": value for stage, value in self.calls.items()},
+            **{f"ops.{name}": value for name, value in self.counts.items()},
+        }
+
+
+def summarize_instrumentation(counts: Mapping[str, int], runs: int) -> dict[str, Any]:
+    """Nested summary of summed ``INSTRUMENT_KEYS`` counts over ``runs`` runs.
+
+    Each stage reports total ``seconds``, ``calls``, ``us_per_call`` and its
+    ``share`` of the total run time; ``ops`` holds totals and per-run means."""
+    run_ns = counts.get("stage_ns.run", 0)
+    stages: dict[str, dict[str, float]] = {}
+    for stage in STAGES:
+        ns = counts.get(f"stage_ns.{stage}", 0)
+        calls = counts.get(f"stage_calls.{stage}", 0)
+        stages[stage] = {
+            "seconds": ns / 1e9,
+            "calls": calls,
+            "us_per_call": ns / calls / 1e3 if calls else 0.0,
+            "share": ns / run_ns if run_ns else 0.0,
+        }
+    ops = {name: counts.get(f"ops.{name}", 0) for name in COUNTERS}
+    return {
+        "runs": runs,
+        "stages": stages,
+        "ops": ops,
+        "ops_per_run": {name: value / runs if runs else 0.0 for name, value in ops.items()},
+    }
+
+
+def counted_keys(instrument: bool) -> tuple[str, ...]:
+    """Metadata keys ``RunAccumulator`` should sum: ``INSTRUMENT_KEYS`` when instrumenting."""
+    return INSTRUMENT_KEYS if instrument else ()
@@ -10,12 +10,13 @@ class SwDecision(str, Enum):
     REJECT_OLD = "reject_old"
 
 
-def classify(n: int, h: int, mask: list[int], w: int) -> SwDecision:
-    """SW 四分支判定（§5.2）。只判定是否接受，不更新状态（更新走 window_commit）。"""
+def classify(n: int, h: int, mask: int, w: int) -> SwDecision:
+    """SW 四分支判定（§5.2）。只判定是否接受，不更新状态（更新走 window_commit）。
+    mask 为整数位图：bit d=1 表示 counter h-d 已接受。"""
     if n > h:
         return SwDecision.ACCEPT_FORWARD
     if h - w + 1 <= n <= h:
-        return SwDecision.REJECT_DUP if mask[h - n] == 1 else SwDecision.ACCEPT_IN_WINDOW
+        return SwDecision.REJECT_DUP if (mask >> (h - n)) & 1 else SwDecision.ACCEPT_IN_WINDOW
     return SwDecision.REJECT_OLD
 
 
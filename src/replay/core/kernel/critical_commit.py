@@ -18,6 +18,6 @@ def pid_for(*, epoch: int, ctr: int, cmd: str, payload_hash: bytes) -> int:
     return int.from_bytes(hashlib.sha256(raw).digest()[:8], "big") & 0x7FFF_FFFF_FFFF_FFFF
 
 
-def critical_commit(*, n: int, h: int, mask: list[int], w: int) -> tuple[int, list[int]]:
+def critical_commit(*, n: int, h: int, mask: int, w: int) -> tuple[int, int]:
     """原子 commit 的窗口部分：与 normal accept 调同一 window_commit（§4.1）。"""
     return window_commit(n, h, mask, w)
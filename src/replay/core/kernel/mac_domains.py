@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+from functools import lru_cache
 
 _TAG_HEX = 96 // 4  # 24
 
@@ -30,29 +31,66 @@ def _encode(*parts: object) -> bytes:
     return bytes(out)
 
 
+class KeyedMac:
+    """HMAC-SHA256 上下文：key schedule（ipad/opad 两块）与可选常量前缀只吸收一次，
+    每条消息在 .copy() 上 update，结果与 hmac.new(key, prefix + msg) 逐字节一致。"""
+
+    __slots__ = ("_base",)
+
+    def __init__(self, key: str, prefix: bytes = b"") -> None:
+        self._base = hmac.new(key.encode(), prefix, hashlib.sha256)
+
+    def hexdigest(self, message: bytes) -> str:
+        ctx = self._base.copy()
+        ctx.update(message)
+        return ctx.hexdigest()
+
+
+@lru_cache(maxsize=256)
+def keyed_mac(key: str, prefix: bytes = b"") -> KeyedMac:
+    """按 (shared key, 常量前缀) 缓存的 KeyedMac；一次仿真只涉及少数几个 key。"""
+    return KeyedMac(key, prefix)
+
+
 def hmac96(key: str, *parts: object) -> str:
-    return hmac.new(key.encode(), _encode(*parts), hashlib.sha256).hexdigest()[:_TAG_HEX]
+    return keyed_mac(key).hexdigest(_encode(*parts))[:_TAG_HEX]
+
+
+# 域标签是常量：预编码（类型标签 + 长度前缀）后并入 keyed 上下文，逐帧只编码可变字段。
+_DOMAIN_PREFIX = {
+    domain: _encode(domain)
+    for domain in (
+        DOMAIN_NORMAL_REQ, DOMAIN_CRIT_PREPARE, DOMAIN_CRIT_CONFIRM, DOMAIN_RESYNC_CONFIRM,
+    )
+}
+
+
+def _domain_hmac96(key: str, domain: bytes, *parts: object) -> str:
+    """等价于 hmac96(key, domain, *parts)。"""
+    return keyed_mac(key, _DOMAIN_PREFIX[domain]).hexdigest(_encode(*parts))[:_TAG_HEX]
 
 
 def normal_req_tag(
     key: str, dev_id: int, key_id: int, epoch: int, ctr: int,
     cmd: str, payload: bytes, flags: int,
 ) -> str:
-    return hmac96(key, DOMAIN_NORMAL_REQ, dev_id, key_id, epoch, ctr, cmd, payload, flags)
+    return _domain_hmac96(key, DOMAIN_NORMAL_REQ, dev_id, key_id, epoch, ctr, cmd, payload, flags)
 
 
 def crit_prepare_tag(
     key: str, dev_id: int, key_id: int, epoch: int, ctr: int,
     cmd: str, payload_hash: bytes, flags: int,
 ) -> str:
-    return hmac96(key, DOMAIN_CRIT_PREPARE, dev_id, key_id, epoch, ctr, cmd, payload_hash, flags)
+    return _domain_hmac96(
+        key, DOMAIN_CRIT_PREPARE, dev_id, key_id, epoch, ctr, cmd, payload_hash, flags
+    )
 
 
 def crit_confirm_tag(
     key: str, dev_id: int, key_id: int, epoch: int, ctr: int, cmd: str,
     payload_hash: bytes, pid: int, nonce_id: int, nonce_r: str, ttl: int, flags: int,
 ) -> str:
-    return hmac96(
+    return _domain_hmac96(
         key, DOMAIN_CRIT_CONFIRM, dev_id, key_id, epoch, ctr, cmd,
         payload_hash, pid, nonce_id, nonce_r, ttl, flags,
     )
@@ -62,7 +100,7 @@ def resync_confirm_tag(
     key: str, dev_id: int, key_id: int, old_epoch: int, new_epoch: int,
     old_h: int, new_h: int, nonce_r: str, ttl: int, flags: int,
 ) -> str:
-    return hmac96(
+    return _domain_hmac96(
         key, DOMAIN_RESYNC_CONFIRM, dev_id, key_id, old_epoch, new_epoch,
         old_h, new_h, nonce_r, ttl, flags,
     )
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 
-def window_commit(n: int, h: int, mask: list[int], w: int) -> tuple[int, list[int]]:
-    """滑动窗口状态更新（§8.6-3）。mask[d]=1 表示 counter h-d 已接受。
-    仅在帧被接受（ACCEPT_FORWARD / ACCEPT_IN_WINDOW）时调用。返回 (new_h, new_mask)。"""
+def window_commit(n: int, h: int, mask: int, w: int) -> tuple[int, int]:
+    """滑动窗口状态更新（§8.6-3）。mask 为整数位图：bit d=1 表示 counter h-d 已接受。
+    仅在帧被接受（ACCEPT_FORWARD / ACCEPT_IN_WINDOW）时调用。返回 (new_h, new_mask)。
+    位图用 int 移位/按位或更新，不随 W 重建 list（大窗口 W=256–4096 的网关场景）。"""
     if n > h:  # 情形1：前跳接受
         jump = n - h
-        new_mask = [0] * w
-        new_mask[0] = 1  # 新窗口顶 H'=n 自身置位
-        for d in range(w):
-            if jump + d < w:
-                new_mask[jump + d] = mask[d]
-        return n, new_mask
-    if h - w + 1 <= n <= h and mask[h - n] == 0:  # 情形2：窗口内接受
-        new_mask = list(mask)
-        new_mask[h - n] = 1
-        return h, new_mask
-    return h, list(mask)  # 情形3：dup/old/macfail/resync-pending，不变
+        if jump >= w:  # 旧位全部移出；不做巨量左移（jump 可达 2**31）
+            return n, 1
+        return n, ((mask << jump) | 1) & ((1 << w) - 1)  # 新窗口顶 H'=n 自身置位
+    if h - w + 1 <= n <= h and not (mask >> (h - n)) & 1:  # 情形2：窗口内接受
+        return h, mask | (1 << (h - n))
+    return h, mask  # 情形3：dup/old/macfail/resync-pending，不变
+
+
+def mask_to_bits(mask: int, w: int) -> list[int]:
+    """位图 -> 长度 W 的 0/1 list（offset 序，仅供调试/导出/测试对照）。"""
+    return [(mask >> d) & 1 for d in range(w)]
+
+
+def bits_to_mask(bits: list[int]) -> int:
+    """mask_to_bits 的逆：offset 序 0/1 list -> 位图。"""
+    return sum(1 << d for d, b in enumerate(bits) if b)
@@ -0,0 +1,177 @@
+"""Progress reporting for long batches: a small protocol plus built-in reporters.
+
+Engines never write to stdout themselves. They drive a ``ProgressTracker``
+per unit of work (one mode's runs, one sweep's cells). The tracker throttles
+updates to the reporter's ``min_interval`` (the final update always goes
+through) and stamps each ``ProgressUpdate`` with elapsed time and throughput.
+So the console bar, log lines, GUI/API queues and parallel batches all see the
+same numbers. With no reporter, nothing is tracked at all.
+"""
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Protocol, TextIO
+
+
+@dataclass(frozen=True)
+class ProgressUpdate:
+    """``completed`` of ``total`` ``unit`` done for ``label`` after ``elapsed`` seconds."""
+
+    label: str
+    completed: int
+    total: int
+    elapsed: float
+    unit: str = "runs"
+
+    @property
+    def rate(self) -> float:
+        """Units per second (0.0 before any time has elapsed)."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.completed >= self.total
+
+
+class ProgressReporter(Protocol):
+    """Receives a batch's progress. ``start``/``finish`` bracket the batch and
+    ``update`` arrives at most every ``min_interval`` seconds per tracked label,
+    plus once when it completes."""
+
+    min_interval: float
+
+    def start(self, title: str) -> None: ...
+
+    def update(self, update: ProgressUpdate) -> None: ...
+
+    def finish(self) -> None: ...
+
+
+class ProgressTracker:
+    """Counts completed units for one label and forwards throttled updates."""
+
+    __slots__ = ("reporter", "label", "total", "unit", "completed", "_start", "_last")
+
+    def __init__(
+        self, reporter: ProgressReporter, label: str, total: int, *, unit: str = "runs"
+    ) -> None:
+        self.reporter = reporter
+        self.label = label
+        self.total = total
+        self.unit = unit
+        self.completed = 0
+        self._start = self._last = time.perf_counter()
+
+    def advance(self, count: int = 1) -> None:
+        self.completed += count
+        now = time.perf_counter()
+        if self.completed < self.total and now - self._last < self.reporter.min_interval:
+            return
+        self._last = now
+        self.reporter.update(
+            ProgressUpdate(self.label, self.completed, self.total, now - self._start, self.unit)
+        )
+
+
+def resolve_reporter(
+    progress: ProgressReporter | None, show_progress: bool
+) -> ProgressReporter | None:
+    """``progress`` if given, else a ``ConsoleProgress`` when ``show_progress``."""
+    if progress is not None:
+        return progress
+    return ConsoleProgress() if show_progress else None
+
+
+class ConsoleProgress:
+    """A ``\\r``-redrawn bar per label on ``stream`` (stdout by default)."""
+
+    bar_length = 50
+
+    def __init__(self, stream: TextIO | None = None, *, min_interval: float = 0.1) -> None:
+        self.stream = stream
+        self.min_interval = min_interval
+        self._open_line = False
+
+    def _out(self) -> TextIO:
+        return self.stream if self.stream is not None else sys.stdout
+
+    def start(self, title: str) -> None:
+        out = self._out()
+        out.write("\n" + "=" * 80 + "\n" + title + "\n" + "=" * 80 + "\n\n")
+        out.flush()
+
+    def update(self, update: ProgressUpdate) -> None:
+        filled = int(self.bar_length * update.completed / update.total) if update.total else 0
+        bar = "#" * filled + "." * (self.bar_length - filled)
+        out = self._out()
+        out.write(
+            f"\r   {update.label}: [{bar}] {update.completed}/{update.total} {update.unit}"
+            f" ({update.rate:.1f} {update.unit}/s)"
+        )
+        if update.finished:
+            out.write("\n")
+        self._open_line = not update.finished
+        out.flush()
+
+    def finish(self) -> None:
+        if self._open_line:
+            self._out().write("\n")
+            self._open_line = False
+        self._out().flush()
+
+
+class LoggingProgress:
+    """One log record per update (default: ``replay.progress`` at INFO, every 5 s)."""
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        *,
+        level: int = logging.INFO,
+        min_interval: float = 5.0,
+    ) -> None:
+        self.logger = logger if logger is not None else logging.getLogger("replay.progress")
+        self.level = level
+        self.min_interval = min_interval
+
+    def start(self, title: str) -> None:
+        self.logger.log(self.level, "%s", title)
+
+    def update(self, update: ProgressUpdate) -> None:
+        self.logger.log(
+            self.level,
+            "%s: %d/%d %s (%.1f %s/s, %.1fs elapsed)",
+            update.label,
+            update.completed,
+            update.total,
+            update.unit,
+            update.rate,
+            update.unit,
+            update.elapsed,
+        )
+
+    def finish(self) -> None:
+        pass
+
+
+class QueueProgress:
+    """Puts ``("start", title)``, ``("update", ProgressUpdate)`` and ``("finish", None)``
+    on ``queue``. Any ``put``-able queue works: ``queue.Queue`` for GUI threads, or a
+    ``multiprocessing`` (manager) queue to report from worker processes (the
+    reporter pickles with its queue)."""
+
+    def __init__(self, queue: Any, *, min_interval: float = 0.2) -> None:
+        self.queue = queue
+        self.min_interval = min_interval
+
+    def start(self, title: str) -> None:
+        self.queue.put(("start", title))
+
+    def update(self, update: ProgressUpdate) -> None:
+        self.queue.put(("update", update))
+
+    def finish(self) -> None:
+        self.queue.put(("finish", None))
@@ -78,10 +78,10 @@ def verify_with_window(
     if not auth.verify(frame.counter, frame.command, frame.mac):
         return VerificationResult(False, "mac_mismatch", state)
 
-    # 初始帧：空 list -> 长度 W 的位图，仅顶位置位（mask[0]=1 表示 H 已收）。
+    # 初始帧：建窗，仅顶位置位（bit0=1 表示 H 已收）。
     if state.last_counter < 0:
         state.last_counter = frame.counter
-        state.received_mask = [1] + [0] * (window_size - 1)
+        state.received_mask = 1
         return VerificationResult(True, "window_accept_initial", state)
 
     # G_hard 闸门（§5.3）：MAC 已通过，前跳越闸需认证重同步。占位——不执行命令、不改状态
@@ -98,7 +98,7 @@ def verify_with_window(
             )
         return VerificationResult(False, "resync_required", state)
 
-    # 此后 received_mask 恒为长度 W 的 list，安全交给 kernel 判定。
+    # 此后 received_mask 恒为 W 位整数位图，安全交给 kernel 判定。
     decision = classify(frame.counter, state.last_counter, state.received_mask, window_size)
     if decision is SwDecision.REJECT_DUP:
         return VerificationResult(False, "counter_replay", state)
@@ -510,7 +510,7 @@ class Receiver:
         if state.last_counter < 0:
             # 初始帧：直接建窗（与 verify_with_window 初始一致），不调 classify（空 mask）
             state.last_counter = pending.ctr
-            state.received_mask = [1] + [0] * (self.window_size - 1)
+            state.received_mask = 1
         else:
             decision = classify(
                 pending.ctr, state.last_counter, state.received_mask, self.window_size
@@ -534,7 +534,7 @@ class Receiver:
         state = self.state
         # R4：清空易失态（H/M_W + resync/critical pending + nonce 表 + committed 去重集）
         state.last_counter = -1
-        state.received_mask = []
+        state.received_mask = 0
         state.resync_pending = None
         state.pending_critical = {}
         state.committed_critical = set()
@@ -550,4 +550,6 @@ class Receiver:
         state.locked_safe = True
 
     def reset(self) -> None:
+        """回到刚构造时的状态（RunPlan 跨 run 复用同一 Receiver）。"""
         self.state = ReceiverState()
+        self._issue_tick = 0
@@ -1,8 +1,13 @@
 """Security primitives used by the defensive protocol variants."""
 from __future__ import annotations
 
-import hashlib
 import hmac
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+
+from .kernel.mac_domains import keyed_mac
+
+TagKey = tuple[str, int, "int | str", str]
 
 
 def compute_mac(token: int | str, command: str, key: str, mac_length: int = 8) -> str:
@@ -12,7 +17,7 @@ def compute_mac(token: int | str, command: str, key: str, mac_length: int = 8) -
         raise ValueError("Token is required to compute a MAC")
 
     message = f"{token}|{command}".encode()
-    mac = hmac.new(key.encode(), message, hashlib.sha256).hexdigest()
+    mac = keyed_mac(key).hexdigest(message)
     if mac_length <= 0:
         return mac
     return mac[:mac_length]
@@ -24,6 +29,68 @@ def compute_mac_bits(token: int | str, command: str, *, key: str, tag_bits: int
     return compute_mac(token, command, key=key, mac_length=tag_bits // 4)
 
 
+class TagTable:
+    """Bounded LRU table of HMAC tags keyed by ``(key, tag_bits, token, command)``.
+
+    Tags are a pure function of the key, so one table can be shared by every run
+    and mode of a batch: sender counters restart at 1 each run and the command set
+    is fixed, so run k asks for the same tags as run k-1 (and replays re-verify
+    tags the sender already produced). ``entries`` seeds the table, e.g. with a
+    parent's ``export()`` inside a worker process.
+    """
+
+    def __init__(
+        self, max_entries: int = 65536, entries: Mapping[TagKey, str] | None = None
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries!r}")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._tags: OrderedDict[TagKey, str] = OrderedDict()
+        for entry_key, tag in (entries or {}).items():
+            self._store(entry_key, tag)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def tag(self, token: int | str, command: str, *, key: str, tag_bits: int) -> str:
+        entry_key: TagKey = (key, tag_bits, token, command)
+        tag = self._tags.get(entry_key)
+        if tag is not None:
+            self.hits += 1
+            self._tags.move_to_end(entry_key)
+            return tag
+        self.misses += 1
+        tag = compute_mac_bits(token, command, key=key, tag_bits=tag_bits)
+        self._store(entry_key, tag)
+        return tag
+
+    def precompute(
+        self, *, key: str, tag_bits: int, tokens: Iterable[int | str], commands: Iterable[str]
+    ) -> None:
+        """Fill the table for every (token, command) pair without touching counters."""
+        command_list = list(commands)
+        for token in tokens:
+            for command in command_list:
+                entry_key: TagKey = (key, tag_bits, token, command)
+                if entry_key not in self._tags:
+                    self._store(
+                        entry_key, compute_mac_bits(token, command, key=key, tag_bits=tag_bits)
+                    )
+
+    def export(self) -> dict[TagKey, str]:
+        """Plain-dict snapshot (picklable) for seeding tables in worker processes."""
+        return dict(self._tags)
+
+    def _store(self, entry_key: TagKey, tag: str) -> None:
+        self._tags[entry_key] = tag
+        if len(self._tags) > self.max_entries:
+            self._tags.popitem(last=False)
+            self.evictions += 1
+
+
 def constant_time_compare(a: str | None, b: str | None) -> bool:
     """Safely compare two MAC strings."""
 
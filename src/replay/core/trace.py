@@ -3,52 +3,129 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict, dataclass, field
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
 
+from .columns import _U32, BitColumn, CommandColumn, IntColumn
 from .rng import DeterministicRNG, RandomLike
 from .types import SimulationConfig
 
+if TYPE_CHECKING:
+    from .trace_cache import TraceCache
+
+_BOOL_FIELDS = (
+    "legit_dropped",
+    "attacker_record_dropped",
+    "inline_attempt",
+    "replay_dropped",
+    "resync_challenge_dropped",
+    "resync_confirm_dropped",
+    "critical_challenge_dropped",
+    "critical_confirm_dropped",
+    "reboot_challenge_dropped",
+    "reboot_confirm_dropped",
+    "attack_extra_dropped",
+)
+_INT_FIELDS = {
+    "legit_delay": "B",
+    "replay_pick": _U32,
+    "replay_delay": "B",
+    "resync_challenge_delay": "B",
+    "resync_confirm_delay": "B",
+    "critical_challenge_delay": "B",
+    "critical_confirm_delay": "B",
+    "reboot_challenge_delay": "B",
+    "reboot_confirm_delay": "B",
+}
+
 
 @dataclass(frozen=True)
 class ScenarioTrace:
-    commands: list[str]
-    legit_dropped: list[bool]
-    legit_delay: list[int]
-    attacker_record_dropped: list[bool]
-    inline_attempt: list[bool]
-    replay_pick: list[int]
-    replay_dropped: list[bool]
-    replay_delay: list[int]
+    """One run's pre-drawn channel/attacker decisions, stored column-wise.
+
+    Drop flags are packed bits (``BitColumn``), delays/picks small-int arrays
+    (``IntColumn``), commands vocabulary codes (``CommandColumn``). Plain lists
+    passed to the constructor are packed in ``__post_init__``.
+    """
+
+    commands: CommandColumn
+    legit_dropped: BitColumn
+    legit_delay: IntColumn
+    attacker_record_dropped: BitColumn
+    inline_attempt: BitColumn
+    replay_pick: IntColumn
+    replay_dropped: BitColumn
+    replay_delay: IntColumn
     # 反向 resync 信道决策（paired 路径确定性来源；按 resync 尝试序号索引，§4.3）
-    resync_challenge_dropped: list[bool] = field(default_factory=list)
-    resync_challenge_delay: list[int] = field(default_factory=list)
-    resync_confirm_dropped: list[bool] = field(default_factory=list)
-    resync_confirm_delay: list[int] = field(default_factory=list)
+    resync_challenge_dropped: BitColumn = field(default_factory=BitColumn)
+    resync_challenge_delay: IntColumn = field(default_factory=IntColumn)
+    resync_confirm_dropped: BitColumn = field(default_factory=BitColumn)
+    resync_confirm_delay: IntColumn = field(default_factory=IntColumn)
     # 反向 critical 两阶段信道决策（paired 路径；按 critical 尝试序号索引，§4.4）
-    critical_challenge_dropped: list[bool] = field(default_factory=list)
-    critical_challenge_delay: list[int] = field(default_factory=list)
-    critical_confirm_dropped: list[bool] = field(default_factory=list)
-    critical_confirm_delay: list[int] = field(default_factory=list)
+    critical_challenge_dropped: BitColumn = field(default_factory=BitColumn)
+    critical_challenge_delay: IntColumn = field(default_factory=IntColumn)
+    critical_confirm_dropped: BitColumn = field(default_factory=BitColumn)
+    critical_confirm_delay: IntColumn = field(default_factory=IntColumn)
     # reboot 后认证重建信道决策（paired 路径；每次运行最多一次 reboot，§8.5）
-    reboot_challenge_dropped: list[bool] = field(default_factory=list)
-    reboot_challenge_delay: list[int] = field(default_factory=list)
-    reboot_confirm_dropped: list[bool] = field(default_factory=list)
-    reboot_confirm_delay: list[int] = field(default_factory=list)
+    reboot_challenge_dropped: BitColumn = field(default_factory=BitColumn)
+    reboot_challenge_delay: IntColumn = field(default_factory=IntColumn)
+    reboot_confirm_dropped: BitColumn = field(default_factory=BitColumn)
+    reboot_confirm_delay: IntColumn = field(default_factory=IntColumn)
     # 攻击专属额外丢弃（weak 强度；按 replay 序号索引，§6 G10）——末尾追加保非 weak 零漂移
-    attack_extra_dropped: list[bool] = field(default_factory=list)
-
-    def digest(self) -> str:
-        data = asdict(self)
+    attack_extra_dropped: BitColumn = field(default_factory=BitColumn)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.commands, CommandColumn):
+            object.__setattr__(self, "commands", CommandColumn.from_commands(self.commands))
+        for name in _BOOL_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, BitColumn):
+                object.__setattr__(self, name, BitColumn.from_bools(value))
+        for name, typecode in _INT_FIELDS.items():
+            value = getattr(self, name)
+            if not isinstance(value, IntColumn):
+                object.__setattr__(self, name, IntColumn.from_ints(value, typecode))
+
+    def digest(self, mode: str = "compat") -> str:
+        """12-hex trace identity.
+
+        ``compat`` reproduces the legacy ``sha256(json.dumps(asdict(trace)))`` value
+        (what ``trace_digest`` metadata has always recorded) without boxing the
+        columns; ``raw`` hashes the packed column buffers directly."""
+        if mode == "raw":
+            hasher = hashlib.sha256()
+            for f in fields(self):
+                column = getattr(self, f.name)
+                hasher.update(f"{f.name}:{len(column)}:".encode())
+                if isinstance(column, CommandColumn):
+                    hasher.update(json.dumps(column.vocab).encode("utf-8"))
+                    column = column.codes
+                if isinstance(column, IntColumn):
+                    hasher.update(column.typecode.encode("ascii"))
+                hasher.update(column.raw())
+            return hasher.hexdigest()[:12]
+        if mode != "compat":
+            raise ValueError(f"digest mode must be 'compat' or 'raw', got {mode!r}")
         # Legacy-shape digest: omit the weak-only field when empty so default (strong)
         # traces keep their pre-Phase-5 trace_digest (reproducibility metadata stability).
-        if not data.get("attack_extra_dropped"):
-            data.pop("attack_extra_dropped", None)
-        payload = json.dumps(data, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+        names = sorted(
+            f.name for f in fields(self)
+            if f.name != "attack_extra_dropped" or len(self.attack_extra_dropped)
+        )
+        payload = b",".join(
+            b'"' + name.encode("ascii") + b'":' + getattr(self, name).json_bytes()
+            for name in names
+        )
+        return hashlib.sha256(b"{" + payload + b"}").hexdigest()[:12]
+
+    def to_lists(self) -> dict[str, list[Any]]:
+        """Plain-list view (the pre-columnar ``asdict`` shape)."""
+        return {f.name: getattr(self, f.name).tolist() for f in fields(self)}
 
     @property
     def legit_drop_count(self) -> int:
-        return sum(1 for dropped in self.legit_dropped if dropped)
+        return self.legit_dropped.count_true()
 
 
 def _dropped(rng: RandomLike, probability: float) -> bool:
@@ -134,26 +211,37 @@ def generate_trace(config: SimulationConfig, seed: int) -> ScenarioTrace:
     else:
         attack_extra_dropped = []
 
+    bits, small = BitColumn.from_bools, IntColumn.from_ints
     return ScenarioTrace(
-        commands=commands,
-        legit_dropped=legit_dropped,
-        legit_delay=legit_delay,
-        attacker_record_dropped=attacker_record_dropped,
-        inline_attempt=inline_attempt,
-        replay_pick=replay_pick,
-        replay_dropped=replay_dropped,
-        replay_delay=replay_delay,
-        resync_challenge_dropped=resync_challenge_dropped,
-        resync_challenge_delay=resync_challenge_delay,
-        resync_confirm_dropped=resync_confirm_dropped,
-        resync_confirm_delay=resync_confirm_delay,
-        critical_challenge_dropped=critical_challenge_dropped,
-        critical_challenge_delay=critical_challenge_delay,
-        critical_confirm_dropped=critical_confirm_dropped,
-        critical_confirm_delay=critical_confirm_delay,
-        reboot_challenge_dropped=reboot_challenge_dropped,
-        reboot_challenge_delay=reboot_challenge_delay,
-        reboot_confirm_dropped=reboot_confirm_dropped,
-        reboot_confirm_delay=reboot_confirm_delay,
-        attack_extra_dropped=attack_extra_dropped,
+        commands=CommandColumn.from_commands(commands),
+        legit_dropped=bits(legit_dropped),
+        legit_delay=small(legit_delay),
+        attacker_record_dropped=bits(attacker_record_dropped),
+        inline_attempt=bits(inline_attempt),
+        replay_pick=small(replay_pick, _U32),
+        replay_dropped=bits(replay_dropped),
+        replay_delay=small(replay_delay),
+        resync_challenge_dropped=bits(resync_challenge_dropped),
+        resync_challenge_delay=small(resync_challenge_delay),
+        resync_confirm_dropped=bits(resync_confirm_dropped),
+        resync_confirm_delay=small(resync_confirm_delay),
+        critical_challenge_dropped=bits(critical_challenge_dropped),
+        critical_challenge_delay=small(critical_challenge_delay),
+        critical_confirm_dropped=bits(critical_confirm_dropped),
+        critical_confirm_delay=small(critical_confirm_delay),
+        reboot_challenge_dropped=bits(reboot_challenge_dropped),
+        reboot_challenge_delay=small(reboot_challenge_delay),
+        reboot_confirm_dropped=bits(reboot_confirm_dropped),
+        reboot_confirm_delay=small(reboot_confirm_delay),
+        attack_extra_dropped=bits(attack_extra_dropped),
     )
+
+
+def iter_traces(
+    config: SimulationConfig, seeds: Iterable[int], cache: TraceCache | None = None
+) -> Iterator[tuple[int, ScenarioTrace]]:
+    """Lazily yield ``(seed, trace)``: one trace is alive at a time, whatever the run count.
+
+    With ``cache`` each trace is loaded from (or stored into) the on-disk trace cache."""
+    for seed in seeds:
+        yield seed, (generate_trace(config, seed) if cache is None else cache.get(config, seed))
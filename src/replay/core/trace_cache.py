@@ -0,0 +1,165 @@
+"""Content-addressed on-disk cache of ``ScenarioTrace`` files, mmap'd on load.
+
+A trace depends only on the channel/attacker fields ``generate_trace`` reads plus
+its seed, so every paired batch, sweep point and advisor candidate that shares
+those fields can reuse one file. Files are columnar (a JSON header, then each
+column's raw buffer 8-byte aligned); loading maps the file read-only and builds
+column views straight over the mapping, so concurrent workers share pages.
+
+Eviction is LRU by file mtime (a hit touches the file) under ``max_bytes``;
+see ``disk_cache``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from array import array
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, ClassVar
+
+from .columns import BitColumn, CommandColumn, IntColumn
+from .disk_cache import LruDirectory, atomic_write
+from .trace import ScenarioTrace, generate_trace
+from .types import SimulationConfig
+
+# Bump whenever generate_trace's draw order or the file layout changes.
+TRACE_FORMAT_VERSION = 1
+
+_MAGIC = b"RPTRACE1"
+_ALIGN = 8
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_trace_cache_dir() -> Path:
+    """``$REPLAY_TRACE_CACHE_DIR`` or ``~/.cache/replay/traces``."""
+    override = os.environ.get("REPLAY_TRACE_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "replay" / "traces"
+
+
+def trace_key(config: SimulationConfig, seed: int) -> str:
+    """Hash of exactly the inputs ``generate_trace`` reads (mode etc. excluded)."""
+    payload = {
+        "version": TRACE_FORMAT_VERSION,
+        "seed": seed,
+        "num_legit": config.num_legit,
+        "num_replay": config.num_replay,
+        "command_sequence": list(config.command_sequence or []),
+        "command_set": list(config.effective_command_set()),
+        "p_loss": config.p_loss,
+        "p_reorder": config.p_reorder,
+        "attacker_record_loss": config.attacker_record_loss,
+        "inline_attack_probability": config.inline_attack_probability,
+        "inline_attack_burst": config.inline_attack_burst,
+        "attacker_inject_strength": config.attacker_inject_strength,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _padded(size: int) -> int:
+    return -size % _ALIGN
+
+
+def write_trace_file(path: Path, trace: ScenarioTrace) -> int:
+    """Write ``trace`` atomically (temp file + rename); returns the file size."""
+    columns: list[dict[str, Any]] = []
+    blobs: list[bytes] = []
+    offset = 0
+    for f in fields(trace):
+        column = getattr(trace, f.name)
+        meta: dict[str, Any] = {"name": f.name, "length": len(column)}
+        if isinstance(column, BitColumn):
+            meta["kind"], blob = "bits", column.raw()
+        else:
+            ints = column.codes if isinstance(column, CommandColumn) else column
+            meta["kind"] = "command" if isinstance(column, CommandColumn) else "int"
+            meta["typecode"], blob = ints.typecode, ints.raw()
+            meta["itemsize"] = array(ints.typecode).itemsize
+            if isinstance(column, CommandColumn):
+                meta["vocab"] = list(column.vocab)
+        meta.update(offset=offset, nbytes=len(blob))
+        columns.append(meta)
+        blobs.append(blob + b"\0" * _padded(len(blob)))
+        offset += len(blobs[-1])
+
+    header = json.dumps({"columns": columns}, separators=(",", ":")).encode("utf-8")
+    preamble = _MAGIC + struct.pack("<I", len(header)) + header
+    preamble += b"\0" * _padded(len(preamble))
+    atomic_write(path, preamble + b"".join(blobs))
+    return len(preamble) + offset
+
+
+def read_trace_file(path: Path) -> ScenarioTrace:
+    """Map ``path`` read-only and return a trace whose columns view the mapping.
+
+    Raises ``ValueError`` for files that are not (or no longer) valid traces."""
+    with path.open("rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if bytes(view[: len(_MAGIC)]) != _MAGIC:
+        raise ValueError(f"not a trace cache file: {path}")
+    (header_len,) = struct.unpack_from("<I", view, len(_MAGIC))
+    start = len(_MAGIC) + 4
+    header = json.loads(bytes(view[start : start + header_len]))
+    body = start + header_len + _padded(start + header_len)
+    values: dict[str, Any] = {}
+    for meta in header["columns"]:
+        lo = body + meta["offset"]
+        chunk = view[lo : lo + meta["nbytes"]]
+        if len(chunk) != meta["nbytes"]:
+            raise ValueError(f"truncated trace cache file: {path}")
+        if meta["kind"] == "bits":
+            values[meta["name"]] = BitColumn(chunk, 0, meta["length"])
+            continue
+        if array(meta["typecode"]).itemsize != meta["itemsize"]:
+            raise ValueError(f"trace cache file written on another platform: {path}")
+        ints = IntColumn(chunk.cast(meta["typecode"]), 0, meta["length"])
+        if meta["kind"] == "command":
+            values[meta["name"]] = CommandColumn(meta["vocab"], ints)
+        else:
+            values[meta["name"]] = ints
+    return ScenarioTrace(**values)
+
+
+@dataclass
+class TraceCache(LruDirectory):
+    """Directory of ``<trace_key>.trace`` files with LRU eviction under ``max_bytes``.
+
+    Safe to share between processes (writes are atomic renames) and to pickle
+    into workers; ``hits``/``misses`` count this instance's lookups only."""
+
+    suffix: ClassVar[str] = ".trace"
+
+    root: Path = field(default_factory=default_trace_cache_dir)
+    max_bytes: int = DEFAULT_MAX_BYTES
+    hits: int = 0
+    misses: int = 0
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+        if self.max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {self.max_bytes!r}")
+
+    def get(self, config: SimulationConfig, seed: int) -> ScenarioTrace:
+        """Cached trace for ``(config, seed)``; generated and stored on a miss."""
+        path = self.path_for(trace_key(config, seed))
+        try:
+            trace = read_trace_file(path)
+        except (OSError, ValueError, KeyError):
+            pass
+        else:
+            self.hits += 1
+            self.touch(path)
+            return trace
+        self.misses += 1
+        trace = generate_trace(config, seed)
+        self.root.mkdir(parents=True, exist_ok=True)
+        write_trace_file(path, trace)
+        self.evict()
+        return trace
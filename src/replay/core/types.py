@@ -131,7 +131,7 @@ class ReceiverState:
 
     last_counter: int = -1
     expected_nonce: str | None = None
-    received_mask: list[int] = field(default_factory=list)
+    received_mask: int = 0  # 滑动窗口位图：bit d=1 表示 counter last_counter-d 已接受
     outstanding_nonces: dict[str, int] = field(default_factory=dict)
     used_nonces: set[str] = field(default_factory=set)
     epoch: int = 0
@@ -233,6 +233,9 @@ class SimulationRunResult:
     epoch_recoveries: int = 0
     critical_command_count: int = 0
     metadata: dict[str, object] = field(default_factory=dict)
+    # Counters that depend on how runs are spread over processes (tag-cache
+    # hits/misses); kept out of equality and of every exported payload.
+    diagnostics: dict[str, int] = field(default_factory=dict, compare=False, repr=False)
 
     @property
     def legit_accept_rate(self) -> float:
@@ -293,6 +296,12 @@ class AggregateStats:
     mac_tag_bits: int = 80
     auth_profile: str = "hmac"
     metadata: dict[str, object] = field(default_factory=dict)
+    # Per-run results, only when the batch was asked to keep them (``keep_runs``).
+    run_results: list[SimulationRunResult] | None = field(
+        default=None, compare=False, repr=False
+    )
+    # Summed run ``diagnostics``; like ``run_results``, not part of ``as_dict``.
+    diagnostics: dict[str, int] = field(default_factory=dict, compare=False, repr=False)
 
     def as_dict(self) -> dict[str, object]:
         result: dict[str, object] = {
@@ -4,18 +4,36 @@ from __future__ import annotations
 from .advisor import DeviceProfile, Recommendation, recommend
 from .artifacts import build_demo_artifacts, load_artifact_manifest, load_experiment_artifact
 from .lab import compare_sim_vs_hardware, load_lab_validation_artifact, validate_lab_run
-from .simulation import run_sweep, simulate_batch
+from .profiling import PROFILE_KINDS, ProfileKind, profile_batch, profile_call
+from .result_store import ResultStore
+from .simulation import (
+    ResultCache,
+    iter_sweep,
+    result_cache_key,
+    run_sweep,
+    simulate_batch,
+    sweep_event_stream,
+)
 
 __all__ = [
     "build_demo_artifacts",
     "compare_sim_vs_hardware",
     "DeviceProfile",
+    "iter_sweep",
     "load_artifact_manifest",
     "load_experiment_artifact",
     "load_lab_validation_artifact",
+    "profile_batch",
+    "profile_call",
+    "PROFILE_KINDS",
+    "ProfileKind",
     "recommend",
     "Recommendation",
+    "ResultCache",
+    "result_cache_key",
+    "ResultStore",
     "run_sweep",
     "simulate_batch",
+    "sweep_event_stream",
     "validate_lab_run",
 ]
@@ -4,8 +4,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from replay.contracts import SimulationSpec
-from replay.core import Mode
-from replay.services.simulation import simulate_batch
+from replay.core import Mode, TraceCache
+from replay.services.simulation import ResultCache, simulate_batch
 
 
 @dataclass(frozen=True)
@@ -34,7 +34,15 @@ class Recommendation:
     constraint_status: str = "met"
 
 
-def recommend(device_profile: DeviceProfile) -> Recommendation:
+def recommend(
+    device_profile: DeviceProfile,
+    *,
+    trace_cache: TraceCache | None = None,
+    result_cache: ResultCache | None = None,
+) -> Recommendation:
+    """Score every candidate; with a seeded profile and ``trace_cache`` the candidates
+    share one set of cached traces (they differ only in receiver-side parameters),
+    and with ``result_cache`` previously scored candidates are not re-simulated."""
     high_risk_commands = [
         command for command, risk in device_profile.command_risk.items() if risk >= 0.8
     ]
@@ -58,7 +66,12 @@ def recommend(device_profile: DeviceProfile) -> Recommendation:
                     target_commands=high_risk_commands or None,
                     paired=True,
                 )
-                result = simulate_batch(spec, show_progress=False).results[0]
+                result = simulate_batch(
+                    spec,
+                    show_progress=False,
+                    trace_cache=trace_cache,
+                    result_cache=result_cache,
+                ).results[0]
                 rec = Recommendation(
                     mode=mode,
                     window_size=window_size,
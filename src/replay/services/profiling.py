@@ -0,0 +1,203 @@
+"""CPU (cProfile) and memory (tracemalloc) profiling of a simulation batch.
+
+``profile_batch`` runs ``simulate_batch`` unchanged under a profiler, writes the
+raw profile (a ``pstats`` file, or a ``tracemalloc`` snapshot) to disk and adds a
+top-N summary to the batch ``metadata["profile"]``. The records themselves are
+exactly those of an unprofiled run. The result cache is never consulted, since
+a cache hit would profile nothing.
+
+Both profilers only see the calling process: with ``workers > 1`` the
+simulation work happens in pool processes and the profile shows the parent
+waiting on them. Both profilers are also process-wide, so concurrent
+profiles (e.g. API jobs) are serialised.
+
+Default outputs go to ``default_profile_dir()``, where each kind keeps at most
+``$REPLAY_PROFILE_MAX_BYTES`` (default 256 MiB) of files, least recently
+written dropped first. Files written to an explicit ``output`` are left alone.
+"""
+from __future__ import annotations
+
+import cProfile
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar, Literal, TypeVar
+
+from replay.contracts import SimulationBatchResult, SimulationSpec
+from replay.core import ProgressReporter, TraceCache
+from replay.core.disk_cache import LruDirectory
+
+from .simulation import simulate_batch
+
+ProfileKind = Literal["cpu", "mem"]
+PROFILE_KINDS: tuple[ProfileKind, ...] = ("cpu", "mem")
+DEFAULT_TOP = 20
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_T = TypeVar("_T")
+_PROFILE_LOCK = threading.Lock()
+
+
+def default_profile_dir() -> Path:
+    """``$REPLAY_PROFILE_DIR`` or ``<tmp>/replay-profiles``."""
+    override = os.environ.get("REPLAY_PROFILE_DIR")
+    if override:
+        return Path(override)
+    return Path(tempfile.gettempdir()) / "replay-profiles"
+
+
+def default_profile_max_bytes() -> int:
+    """``$REPLAY_PROFILE_MAX_BYTES`` or ``DEFAULT_MAX_BYTES`` (per profile kind)."""
+    raw = os.environ.get("REPLAY_PROFILE_MAX_BYTES", "").strip()
+    return int(raw) if raw else DEFAULT_MAX_BYTES
+
+
+@dataclass
+class _ProfileFiles(LruDirectory):
+    """Default outputs of one profile kind under ``root``, kept within ``max_bytes``."""
+
+    root: Path = field(default_factory=default_profile_dir)
+    max_bytes: int = field(default_factory=default_profile_max_bytes)
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+        if self.max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {self.max_bytes!r}")
+
+    def new_path(self, kind: ProfileKind) -> Path:
+        self.root.mkdir(parents=True, exist_ok=True)
+        handle, name = tempfile.mkstemp(prefix=f"replay-{kind}-", suffix=self.suffix, dir=self.root)
+        os.close(handle)
+        return Path(name)
+
+
+class _CpuProfiles(_ProfileFiles):
+    suffix: ClassVar[str] = ".pstats"
+
+
+class _MemProfiles(_ProfileFiles):
+    suffix: ClassVar[str] = ".tracemalloc"
+
+
+_PROFILE_FILES: dict[str, type[_ProfileFiles]] = {"cpu": _CpuProfiles, "mem": _MemProfiles}
+
+
+def _cpu_summary(profiler: cProfile.Profile, top: int) -> dict[str, Any]:
+    profiler.create_stats()
+    rows = sorted(profiler.stats.items(), key=lambda item: item[1][2], reverse=True)
+    hot = []
+    for (filename, line, function), (primitive, calls, tottime, cumtime, _) in rows[:top]:
+        hot.append(
+            {
+                "function": f"{filename}:{line}({function})",
+                "calls": calls,
+                "primitive_calls": primitive,
+                "tottime": tottime,
+                "cumtime": cumtime,
+            }
+        )
+    total_calls = sum(entry[1] for entry in profiler.stats.values())
+    return {"total_calls": total_calls, "top": hot}
+
+
+def _mem_summary(snapshot: tracemalloc.Snapshot, peak: int, top: int) -> dict[str, Any]:
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen *>")]
+    )
+    sites = []
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        site = f"{frame.filename}:{frame.lineno}"
+        sites.append({"site": site, "size_bytes": stat.size, "count": stat.count})
+    return {"peak_bytes": peak, "top": sites}
+
+
+def profile_call(
+    kind: ProfileKind,
+    fn: Callable[[], _T],
+    *,
+    output: str | Path | None = None,
+    top: int = DEFAULT_TOP,
+) -> tuple[_T, dict[str, Any]]:
+    """``fn()`` under the ``kind`` profiler: ``(result, summary)``.
+
+    The raw profile goes to ``output`` (default: a fresh file under
+    ``default_profile_dir()``, which is then trimmed to its byte budget);
+    ``summary["output"]`` names it."""
+    if kind not in PROFILE_KINDS:
+        raise ValueError(f"profile kind must be one of {PROFILE_KINDS}, got {kind!r}")
+    if top < 1:
+        raise ValueError(f"top must be >= 1, got {top!r}")
+    explicit = Path(output) if output is not None else None
+    files = _PROFILE_FILES[kind]() if explicit is None else None
+
+    def output_path() -> Path:
+        # Allocated only once ``fn()`` has returned, so a failed call leaves no
+        # empty file behind in the capped default directory.
+        if explicit is not None:
+            return explicit
+        assert files is not None
+        return files.new_path(kind)
+
+    with _PROFILE_LOCK:
+        start = time.perf_counter()
+        if kind == "cpu":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                result = fn()
+            finally:
+                profiler.disable()
+            wall = time.perf_counter() - start
+            path = output_path()
+            profiler.dump_stats(str(path))
+            details = _cpu_summary(profiler, top)
+        else:
+            if tracemalloc.is_tracing():
+                raise RuntimeError("tracemalloc is already tracing in this process")
+            tracemalloc.start()
+            try:
+                result = fn()
+                wall = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+            path = output_path()
+            snapshot.dump(str(path))
+            details = _mem_summary(snapshot, peak, top)
+        if files is not None:
+            files.evict()
+    return result, {"kind": kind, "output": str(path), "wall_seconds": wall, **details}
+
+
+def profile_batch(
+    spec: SimulationSpec,
+    kind: ProfileKind,
+    *,
+    output: str | Path | None = None,
+    top: int = DEFAULT_TOP,
+    show_progress: bool = False,
+    trace_cache: TraceCache | None = None,
+    progress: ProgressReporter | None = None,
+) -> SimulationBatchResult:
+    """``simulate_batch(spec)`` under ``profile_call``; the summary lands in
+    ``metadata["profile"]`` (with ``workers`` noted, see the module docstring)."""
+    batch, summary = profile_call(
+        kind,
+        lambda: simulate_batch(
+            spec, show_progress=show_progress, trace_cache=trace_cache, progress=progress
+        ),
+        output=output,
+        top=top,
+    )
+    summary["workers"] = spec.workers
+    metadata = dict(batch.metadata)
+    metadata["profile"] = summary
+    return batch.model_copy(update={"metadata": metadata})
@@ -0,0 +1,85 @@
+"""Persistent, content-addressed store of per-mode simulation results.
+
+Entries are ``SimulationResultRecord`` JSON files named by ``result_cache_key``
+of a single-mode, seeded spec (which folds in ``ENGINE_VERSION``). So a
+``replay sim run``, a web request, a sweep cell and an advisor candidate that
+describe the same mode under the same spec all share one entry. Eviction is LRU
+by file mtime under ``max_bytes``.
+"""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator, MutableMapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar
+
+from pydantic import ValidationError
+
+from replay.contracts import SimulationResultRecord
+from replay.core.disk_cache import LruDirectory, atomic_write
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_result_cache_dir() -> Path:
+    """``$REPLAY_RESULT_CACHE_DIR`` or ``~/.cache/replay/results``."""
+    override = os.environ.get("REPLAY_RESULT_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "replay" / "results"
+
+
+# LruDirectory.clear returns the number of files removed; MutableMapping's returns None.
+@dataclass(eq=False)
+class ResultStore(  # type: ignore[misc]
+    LruDirectory, MutableMapping[str, SimulationResultRecord]
+):
+    """Directory of ``<key>.json`` result records usable wherever a ``ResultCache`` is.
+
+    Unreadable or stale-schema files read as missing. Writes are atomic renames,
+    so concurrent CLI/API processes can share one directory. ``hits`` and
+    ``misses`` count this instance's lookups only."""
+
+    suffix: ClassVar[str] = ".json"
+
+    root: Path = field(default_factory=default_result_cache_dir)
+    max_bytes: int = DEFAULT_MAX_BYTES
+    hits: int = 0
+    misses: int = 0
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+        if self.max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {self.max_bytes!r}")
+
+    def __getitem__(self, key: str) -> SimulationResultRecord:
+        path = self.path_for(key)
+        try:
+            record = SimulationResultRecord.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            self.misses += 1
+            raise KeyError(key) from None
+        self.hits += 1
+        self.touch(path)
+        return record
+
+    def __setitem__(self, key: str, record: SimulationResultRecord) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path_for(key), record.model_dump_json().encode("utf-8"))
+        self.evict()
+
+    def __delitem__(self, key: str) -> None:
+        try:
+            self.path_for(key).unlink()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.path_for(key).is_file()
+
+    def __iter__(self) -> Iterator[str]:
+        return (path.name[: -len(self.suffix)] for path, _, _ in self.entries())
+
+    def __len__(self) -> int:
+        return len(self.entries())
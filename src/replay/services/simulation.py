@@ -1,6 +1,10 @@
 """Simulation-facing application services."""
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Iterator, MutableMapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 
 from replay.contracts import (
@@ -11,23 +15,54 @@ from replay.contracts import (
     SweepPoint,
     SweepSpec,
 )
-from replay.core import Mode, run_many_experiments, run_paired_experiments, run_until_precision
+from replay.core import (
+    ENGINE_VERSION,
+    DeterministicRNG,
+    Mode,
+    ProgressReporter,
+    ProgressTracker,
+    TraceCache,
+    run_hybrid_experiments,
+    run_many_experiments,
+    run_modes_until_precision,
+    run_paired_experiments,
+)
+from replay.core.progress import resolve_reporter
 
 
-def simulate_batch(spec: SimulationSpec, *, show_progress: bool = False) -> SimulationBatchResult:
+def _run_batch(
+    spec: SimulationSpec,
+    show_progress: bool,
+    trace_cache: TraceCache | None,
+    progress: ProgressReporter | None = None,
+    instrument: bool = False,
+) -> list[SimulationResultRecord]:
     base_config = spec.to_runtime_config()
     modes = [Mode(mode) for mode in spec.modes]
-    if spec.target_ci_half_width is not None:
-        stats = [
-            run_until_precision(
-                base_config,
-                mode=mode,
-                target_half_width=spec.target_ci_half_width,
-                max_runs=spec.max_runs,
-                seed=spec.seed,
-            )[0]
-            for mode in modes
-        ]
+    if spec.estimator == "hybrid":
+        stats = run_hybrid_experiments(
+            base_config,
+            modes,
+            spec.runs,
+            spec.seed,
+            target_half_width=spec.target_ci_half_width,
+            max_runs=spec.max_runs,
+            show_progress=show_progress,
+            trace_cache=trace_cache if spec.seed is not None else None,
+            progress=progress,
+        )
+    elif spec.target_ci_half_width is not None:
+        stats = run_modes_until_precision(
+            base_config,
+            modes,
+            target_half_width=spec.target_ci_half_width,
+            max_runs=spec.max_runs,
+            seed=spec.seed,
+            workers=spec.workers,
+            paired=spec.paired,
+            show_progress=show_progress,
+            progress=progress,
+        )
     elif spec.paired:
         stats = run_paired_experiments(
             base_config=base_config,
@@ -35,6 +70,9 @@ def simulate_batch(spec: SimulationSpec, *, show_progress: bool = False) -> Simu
             runs=spec.runs,
             seed=spec.seed,
             show_progress=show_progress,
+            workers=spec.workers,
+            trace_cache=trace_cache if spec.seed is not None else None,
+            progress=progress,
         )
     else:
         stats = run_many_experiments(
@@ -43,17 +81,108 @@ def simulate_batch(spec: SimulationSpec, *, show_progress: bool = False) -> Simu
             runs=spec.runs,
             seed=spec.seed,
             show_progress=show_progress,
+            workers=spec.workers,
+            progress=progress,
+            instrument=instrument,
         )
+    return [SimulationResultRecord.from_aggregate(entry) for entry in stats]
+
+
+def simulate_batch(
+    spec: SimulationSpec,
+    *,
+    show_progress: bool = False,
+    trace_cache: TraceCache | None = None,
+    result_cache: ResultCache | None = None,
+    progress: ProgressReporter | None = None,
+    instrument: bool = False,
+) -> SimulationBatchResult:
+    """Run ``spec``; paired batches with a fixed seed read traces via ``trace_cache``.
+
+    With ``result_cache`` and a fixed seed, each mode is looked up under the
+    ``result_cache_key`` of its single-mode spec and only the missing modes are
+    simulated (every mode draws its own seeds, so a mode's result does not depend
+    on which other modes share the batch). Unseeded specs bypass the cache. The
+    batch metadata reports ``result_cache_hits``/``result_cache_misses``.
+    ``progress`` receives the engine's per-mode (or per-trace) run counts.
+
+    ``spec.estimator == "hybrid"`` runs ``run_hybrid_experiments`` (always on paired
+    traces, in-process); each record's ``metadata["estimator"]`` names the path
+    behind its LAR and ASR.
+
+    ``instrument=True`` records per-stage timers and operation counters in each
+    record's ``metadata["instrumentation"]``. Only live (unpaired, fixed-run, MC)
+    batches are instrumented, and they always run (the result cache is bypassed).
+    """
+    if instrument and (
+        spec.paired or spec.target_ci_half_width is not None or spec.estimator != "mc"
+    ):
+        raise ValueError("instrumentation is only available for unpaired, fixed-run MC batches")
+    metadata: dict[str, object] = {"mode_count": len(spec.modes)}
+    if result_cache is None or spec.seed is None or instrument:
+        results = _run_batch(spec, show_progress, trace_cache, progress, instrument)
+        if result_cache is not None:
+            metadata["result_cache_bypassed"] = True
+    else:
+        keys = [
+            result_cache_key(spec.model_copy(update={"modes": [mode]})) for mode in spec.modes
+        ]
+        found: dict[str, SimulationResultRecord] = {}
+        missing: dict[str, object] = {}
+        for mode, key in zip(spec.modes, keys):
+            if key in found or key in missing:
+                continue
+            record = result_cache.get(key)
+            if record is None:
+                missing[key] = mode
+            else:
+                found[key] = record
+        if missing:
+            fresh = _run_batch(
+                spec.model_copy(update={"modes": list(missing.values())}),
+                show_progress,
+                trace_cache,
+                progress,
+            )
+            for key, record in zip(missing, fresh):
+                found[key] = result_cache[key] = _with_mode_count(record, 1)
+        results = [_with_mode_count(found[key], len(spec.modes)) for key in keys]
+        metadata["result_cache_hits"] = len(found) - len(missing)
+        metadata["result_cache_misses"] = len(missing)
     return SimulationBatchResult(
         generated_at=datetime.now(timezone.utc),
         config=SimulationSpecPublic.from_spec(spec),
-        results=[SimulationResultRecord.from_aggregate(entry) for entry in stats],
-        metadata={"mode_count": len(spec.modes)},
+        results=results,
+        metadata=metadata,
     )
 
 
-def run_sweep(spec: SweepSpec, *, show_progress: bool = False) -> list[SweepPoint]:
-    points: list[SweepPoint] = []
+ResultCache = MutableMapping[str, SimulationResultRecord]
+
+
+def result_cache_key(spec: SimulationSpec) -> str:
+    """Content hash of every ``spec`` field that can change results (``workers`` cannot)
+    plus ``ENGINE_VERSION``. The default ``estimator="mc"`` is left out, so keys
+    recorded before the field existed stay valid."""
+    exclude = {"workers"} if spec.estimator != "mc" else {"workers", "estimator"}
+    payload = {
+        "engine_version": ENGINE_VERSION,
+        "spec": spec.model_dump(mode="json", exclude=exclude),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _with_mode_count(record: SimulationResultRecord, mode_count: int) -> SimulationResultRecord:
+    """Rewrite the batch-level ``total_runs`` counter for a batch of ``mode_count`` modes."""
+    if "total_runs" not in record.metadata:
+        return record
+    metadata = {**record.metadata, "total_runs": record.runs * mode_count}
+    return record.model_copy(update={"metadata": metadata})
+
+
+def _sweep_scenarios(spec: SweepSpec) -> list[tuple[float | int, SimulationSpec]]:
+    scenarios: list[tuple[float | int, SimulationSpec]] = []
     simulation = spec.simulation
     for value in spec.values:
         if spec.sweep_type == "p_loss":
@@ -78,14 +207,180 @@ def run_sweep(spec: SweepSpec, *, show_progress: bool = False) -> list[SweepPoin
             scenario = simulation.model_copy(update={"mac_tag_bits": int(value)})
         else:
             scenario = simulation.model_copy(update={"window_size": int(value)})
+        scenarios.append((value, scenario))
+    return scenarios
 
-        batch = simulate_batch(scenario, show_progress=show_progress)
-        for result in batch.results:
-            points.append(
-                SweepPoint(
-                    sweep_type=spec.sweep_type,
-                    sweep_value=value,
-                    result=result,
-                )
+
+def _simulate_work_item(
+    spec: SimulationSpec, trace_cache: TraceCache | None
+) -> SimulationResultRecord:
+    """One (point, mode) cell of a sweep grid (process-pool entry point)."""
+    return simulate_batch(spec, trace_cache=trace_cache).results[0]
+
+
+def iter_sweep(
+    spec: SweepSpec,
+    *,
+    show_progress: bool = False,
+    trace_cache: TraceCache | None = None,
+    workers: int | None = None,
+    result_cache: ResultCache | None = None,
+    progress: ProgressReporter | None = None,
+) -> Iterator[tuple[int, SweepPoint]]:
+    """Yield ``(grid_index, point)`` for every (point, mode) cell as soon as it is known.
+
+    Cached cells come first, then computed cells in completion order.
+    ``grid_index`` is the point's position in ``run_sweep``'s ordering (values
+    order, then modes order). Each cell is a single-mode ``simulate_batch``.
+    Every mode draws its own seeds (and paired traces depend only on the seed),
+    so a cell's result is the same as that mode's entry in the whole-point
+    batch. An unseeded point first gets a concrete seed from a sweep-level
+    ``DeterministicRNG``, so its paired cells still share traces. That seed is
+    recorded as ``metadata["seed"]`` of its results (rerun the point with it to
+    reproduce them), and such cells are never cached. With a
+    fixed seed, cells are keyed by ``result_cache_key``. Identical cells, within
+    this sweep or already in ``result_cache``, are computed once, and each
+    result is written to ``result_cache`` as it completes. ``workers``
+    (default ``spec.simulation.workers``) sizes one shared process pool. Cells
+    are queued on it together, so idle workers pick up the next cell whichever
+    point it belongs to. ``progress`` (or a console bar with ``show_progress``)
+    counts computed cells under the label ``"sweep"``. An exception it raises,
+    or closing the generator, aborts the sweep and cancels the cells still
+    queued. Only results not yet yielded are held.
+    """
+    pool_size = workers if workers is not None else spec.simulation.workers
+    if pool_size < 1:
+        raise ValueError(f"workers must be >= 1, got {pool_size!r}")
+    cache: ResultCache = result_cache if result_cache is not None else {}
+    positions: dict[str, list[tuple[int, float | int, int]]] = {}
+    todo: dict[str, SimulationSpec] = {}
+    hits: dict[str, SimulationResultRecord] = {}
+    grid_index = 0
+    point_seeds = DeterministicRNG()
+    for point_index, (value, scenario) in enumerate(_sweep_scenarios(spec)):
+        unseeded = scenario.seed is None
+        if unseeded:
+            # 每个点先落定一个种子再拆成单模式 cell，paired 各模式才共用同一批 trace
+            scenario = scenario.model_copy(update={"seed": point_seeds.randint(0, 2**31 - 1)})
+        for mode in scenario.modes:
+            cell = scenario.model_copy(
+                update={"modes": [mode], "workers": 1 if pool_size > 1 else scenario.workers}
             )
-    return points
+            if unseeded:
+                key = f"unseeded:{point_index}:{Mode(mode).value}"
+            else:
+                key = result_cache_key(cell)
+            positions.setdefault(key, []).append((grid_index, value, len(scenario.modes)))
+            grid_index += 1
+            if key in hits or key in todo:
+                continue
+            record = None if unseeded else cache.get(key)
+            if record is None:
+                todo[key] = cell
+            else:
+                hits[key] = record
+
+    def emit(key: str, record: SimulationResultRecord) -> Iterator[tuple[int, SweepPoint]]:
+        for index, value, mode_count in positions.pop(key):
+            # batch-level counters describe the whole point, not the single-mode cell
+            result = _with_mode_count(record, mode_count)
+            yield index, SweepPoint(sweep_type=spec.sweep_type, sweep_value=value, result=result)
+
+    def computed(key: str, record: SimulationResultRecord) -> Iterator[tuple[int, SweepPoint]]:
+        if key.startswith("unseeded:"):
+            metadata = {**record.metadata, "seed": todo[key].seed}
+            record = record.model_copy(update={"metadata": metadata})
+        else:
+            cache[key] = record
+        return emit(key, record)
+
+    for key, record in hits.items():
+        yield from emit(key, record)
+    hits.clear()
+
+    reporter = resolve_reporter(progress, show_progress) if todo else None
+    tracker = None
+    if reporter is not None:
+        reporter.start("STARTING PARAMETER SWEEP")
+        tracker = ProgressTracker(reporter, "sweep", len(todo), unit="cells")
+    try:
+        if pool_size == 1 or len(todo) <= 1:
+            for key, cell in todo.items():
+                yield from computed(key, _simulate_work_item(cell, trace_cache))
+                if tracker is not None:
+                    tracker.advance()
+            return
+        with ProcessPoolExecutor(max_workers=min(pool_size, len(todo))) as executor:
+            futures = {
+                executor.submit(_simulate_work_item, cell, trace_cache): key
+                for key, cell in todo.items()
+            }
+            try:
+                for future in as_completed(futures):
+                    yield from computed(futures[future], future.result())
+                    if tracker is not None:
+                        tracker.advance()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        if reporter is not None:
+            reporter.finish()
+
+
+def run_sweep(
+    spec: SweepSpec,
+    *,
+    show_progress: bool = False,
+    trace_cache: TraceCache | None = None,
+    workers: int | None = None,
+    result_cache: ResultCache | None = None,
+    progress: ProgressReporter | None = None,
+) -> list[SweepPoint]:
+    """Run every (point, mode) cell of the sweep, in parallel and de-duplicated.
+
+    Points come back in ``values`` order and modes in ``modes`` order; see
+    ``iter_sweep`` for the execution model and the keyword arguments.
+    """
+    points: dict[int, SweepPoint] = dict(
+        iter_sweep(
+            spec,
+            show_progress=show_progress,
+            trace_cache=trace_cache,
+            workers=workers,
+            result_cache=result_cache,
+            progress=progress,
+        )
+    )
+    return [points[index] for index in range(len(points))]
+
+
+def sweep_event_stream(
+    spec: SweepSpec,
+    *,
+    trace_cache: TraceCache | None = None,
+    result_cache: ResultCache | None = None,
+    sse: bool = False,
+) -> Iterator[str]:
+    """Encode ``iter_sweep`` as NDJSON lines (or server-sent events with ``sse=True``).
+
+    Each completed cell is a ``point`` event (``index`` plus the ``SweepPoint``
+    fields), followed by one ``done`` event with the point count. A failure
+    after streaming has started is reported as a final ``error`` event instead
+    of an exception."""
+
+    def event(name: str, payload: dict[str, object]) -> str:
+        if sse:
+            return f"event: {name}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        return json.dumps({"event": name, **payload}, ensure_ascii=False) + "\n"
+
+    count = 0
+    try:
+        for index, point in iter_sweep(spec, trace_cache=trace_cache, result_cache=result_cache):
+            count += 1
+            yield event("point", {"index": index, **point.model_dump(mode="json")})
+    except Exception as exc:  # noqa: BLE001 - reported in-band once streaming started
+        yield event("error", {"detail": f"{type(exc).__name__}: {exc}"})
+        return
+    yield event("done", {"points": count})
@@ -0,0 +1,70 @@
+import dataclasses
+import pickle
+import statistics
+import sys
+
+import pytest
+
+from replay.core import Mode, SimulationConfig, run_many_experiments, run_paired_experiments
+from replay.core.accumulator import RunAccumulator
+from replay.core.experiment import simulate_one_run
+from replay.core.rng import DeterministicRNG
+
+
+def _runs(count: int):
+    cfg = SimulationConfig(mode=Mode.WINDOW, num_legit=15, num_replay=15, p_loss=0.25)
+    return [simulate_one_run(cfg, rng=DeterministicRNG(seed)) for seed in range(count)]
+
+
+def test_accumulator_matches_statistics_module_exactly():
+    results = _runs(25)
+    acc = RunAccumulator()
+    acc.extend(results)
+    for name in ("legit_accept_rate", "attack_success_rate"):
+        values = [getattr(result, name) for result in results]
+        assert acc.mean(name) == statistics.fmean(values)
+        if sys.version_info >= (3, 11):  # stdev is correctly rounded from 3.11 on
+            assert acc.std(name) == statistics.stdev(values)
+        else:
+            assert acc.std(name) == pytest.approx(statistics.stdev(values), rel=1e-12)
+    assert acc.counts["legit_sent"] == sum(result.legit_sent for result in results)
+    assert acc.mean("energy_proxy") == statistics.fmean(r.energy_proxy for r in results)
+    assert acc.results is None
+
+
+def test_merge_is_exact_and_picklable():
+    results = _runs(20)
+    whole = RunAccumulator()
+    whole.extend(results)
+    left, right = RunAccumulator(), RunAccumulator()
+    left.extend(results[:7])
+    right.extend(results[7:])
+    merged = pickle.loads(pickle.dumps(left))
+    merged.merge(right)
+    assert merged == whole
+    assert merged.std("attack_success_rate") == whole.std("attack_success_rate")
+
+
+def test_empty_and_single_run_edge_cases():
+    acc = RunAccumulator()
+    assert (acc.mean("frr"), acc.std("frr")) == (0.0, 0.0)
+    acc.add(_runs(1)[0])
+    assert acc.std("legit_accept_rate") == 0.0
+
+
+def test_batches_only_keep_runs_on_request():
+    cfg = SimulationConfig(mode=Mode.WINDOW, num_legit=8, num_replay=8, p_loss=0.1)
+    lean = run_many_experiments(cfg, [Mode.WINDOW], runs=6, seed=1, show_progress=False)
+    kept = run_many_experiments(
+        cfg, [Mode.WINDOW], runs=6, seed=1, show_progress=False, keep_runs=True
+    )
+    assert lean[0].run_results is None
+    assert kept[0].run_results is not None and len(kept[0].run_results) == 6
+    assert dataclasses.replace(kept[0], metadata={}) == dataclasses.replace(lean[0], metadata={})
+    assert "run_results" not in kept[0].as_dict()
+
+    paired = run_paired_experiments(
+        cfg, [Mode.WINDOW, Mode.NO_DEFENSE], runs=4, seed=1, show_progress=False,
+        workers=2, keep_runs=True,
+    )
+    assert [len(entry.run_results or []) for entry in paired] == [4, 4]
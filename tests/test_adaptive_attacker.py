@@ -11,6 +11,7 @@ from pathlib import Path
 from replay.core import Mode, SimulationConfig, run_paired_experiments
 from replay.core.attacker import AdaptiveReplay, AttackContext
 from replay.core.experiment import simulate_one_run
+from replay.core.kernel.window_commit import bits_to_mask
 from replay.core.types import AttackMode, Frame
 
 _BASELINE = json.loads(Path("tests/fixtures/engine_baseline.json").read_text())
@@ -27,7 +28,9 @@ def _frame(counter: int, command: str = "PING", flags: int = 0) -> Frame:
 
 def test_adaptive_lostframe_targets_unaccepted_window_slot():
     # h=10, W=5; mask offset0 (counter10)=accepted, offset2 (counter8)=free
-    ctx = AttackContext(window_size=5, g_hard=16, last_counter=10, received_mask=(1, 0, 0, 0, 0))
+    ctx = AttackContext(
+        window_size=5, g_hard=16, last_counter=10, received_mask=bits_to_mask([1, 0, 0, 0, 0])
+    )
     f_dup = _frame(10)   # offset 0, mask[0]=1 -> excluded (already accepted)
     f_slot = _frame(8)   # offset 2, mask[2]=0 -> candidate
     f_old = _frame(3)    # offset 7 >= W -> excluded
@@ -39,7 +42,9 @@ def test_adaptive_lostframe_targets_unaccepted_window_slot():
 
 
 def test_adaptive_lostframe_none_when_all_slots_filled():
-    ctx = AttackContext(window_size=3, g_hard=16, last_counter=5, received_mask=(1, 1, 1))
+    ctx = AttackContext(
+        window_size=3, g_hard=16, last_counter=5, received_mask=bits_to_mask([1, 1, 1])
+    )
     strat = AdaptiveReplay("adaptive_lostframe")
     strat._recorded = [_frame(5), _frame(4), _frame(3)]
     assert strat.pick_recorded(0, strat._recorded, context=ctx) is None
@@ -11,7 +11,13 @@ from pathlib import Path
 
 import pytest
 
-from replay.core.analytic.mc import estimate_accept_rate
+from replay.core.analytic.mc import (
+    _replay_accepted,
+    accepts_from_losses,
+    dual_verification,
+    estimate_accept_rate,
+    estimate_accept_rate_vector,
+)
 from replay.core.analytic.models import a_W
 from replay.core.rng import DeterministicRNG
 from replay.core.stats import wilson_ci
@@ -56,6 +62,48 @@ def test_mc_harness_rejects_invalid_parameters():
         estimate_accept_rate(2, -0.1, 4, n_trials=10, rng=rng)
 
 
+def test_vector_form_matches_kernel_walk_on_every_loss_row():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(3)
+    for r in range(0, 10):
+        for w in range(1, 12):
+            lost = rng.random((64, r)) < 0.5
+            expected = [_replay_accepted(row.tolist(), w) for row in lost]
+            assert accepts_from_losses(lost, w).tolist() == expected, (r, w)
+
+
+def test_vector_estimate_matches_a_w_within_95ci():
+    pytest.importorskip("numpy")
+    assert estimate_accept_rate_vector(2, 0.4, 5, n_trials=50, seed=1) == (50, 50)
+    for r, p, w in [(1, 0.6, 1), (5, 0.5, 3), (6, 0.3, 4), (12, 0.8, 2)]:
+        accepts, n = estimate_accept_rate_vector(r, p, w, n_trials=20_000, seed=11)
+        ci = wilson_ci(accepts, n)
+        assert ci.lower <= a_W(r, p, w) <= ci.upper, (r, p, w, accepts)
+    with pytest.raises(ValueError):
+        estimate_accept_rate_vector(2, 0.3, 0, n_trials=10, seed=0)
+
+
+def test_seeded_grid_is_independent_of_workers():
+    grid = ([0, 3, 6], [2, 4], [0.3, 0.5])
+    serial = dual_verification(*grid, n_trials=300, seed=5)
+    assert dual_verification(*grid, n_trials=300, seed=5, workers=2) == serial
+    assert [(p.r, p.w, p.p_loss) for p in serial] == [
+        (r, w, p) for w in grid[1] for p in grid[2] for r in grid[0]
+    ]
+    with pytest.raises(ValueError, match="exactly one"):
+        dual_verification(*grid, n_trials=10)
+    with pytest.raises(ValueError, match="need seed"):
+        dual_verification(*grid, n_trials=10, rng=DeterministicRNG(1), workers=2)
+
+
+def test_vector_grid_runs_in_a_pool():
+    pytest.importorskip("numpy")
+    grid = ([0, 4, 8], [3], [0.5])
+    serial = dual_verification(*grid, n_trials=2000, seed=9, engine="vector")
+    assert dual_verification(*grid, n_trials=2000, seed=9, engine="vector", workers=2) == serial
+    assert all(point.within_ci for point in serial)
+
+
 def test_plot_analytic_vs_mc_smoke_outputs_file(tmp_path):
     spec = importlib.util.spec_from_file_location(
         "plot_analytic_vs_mc", "scripts/plot_analytic_vs_mc.py"
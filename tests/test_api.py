@@ -150,7 +150,7 @@ def test_api_default_attack_mode_uses_centralized_default():
 def test_post_simulations_route_returns_batch_payload(monkeypatch, client):
     captured = {}
 
-    def fake_simulate_batch(spec, show_progress=False):
+    def fake_simulate_batch(spec, show_progress=False, result_cache=None):
         captured["spec"] = spec
         captured["show_progress"] = show_progress
         return _sample_batch(spec)
@@ -189,7 +189,7 @@ def test_post_simulations_route_smoke_uses_real_service(client):
 
 
 def test_legacy_simulate_route_returns_compat_payload(monkeypatch, client):
-    def fake_simulate_batch(spec, show_progress=False):
+    def fake_simulate_batch(spec, show_progress=False, result_cache=None):
         return _sample_batch(spec)
 
     monkeypatch.setattr(app_module, "simulate_batch", fake_simulate_batch)
@@ -225,7 +225,7 @@ def test_post_simulations_route_returns_422_for_invalid_body(client):
 
 
 def test_post_sweeps_route_returns_points(monkeypatch, client):
-    def fake_run_sweep(spec, show_progress=False):
+    def fake_run_sweep(spec, show_progress=False, result_cache=None):
         return [
             SweepPoint(
                 sweep_type=spec.sweep_type,
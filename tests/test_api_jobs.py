@@ -0,0 +1,157 @@
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from replay.api import JobLimits, JobManager, create_app
+from replay.contracts import SimulationSpec, SweepSpec
+from replay.core import ProgressUpdate
+from replay.services import run_sweep, simulate_batch
+
+_VOLATILE = ("total_time", "time_per_run")
+
+
+def _stable_results(results):
+    for result in results:
+        for key in _VOLATILE:
+            result["metadata"].pop(key, None)
+    return results
+
+
+def _wait(poll, *, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        status = poll()
+        if status["state"] in {"succeeded", "failed", "cancelled"}:
+            return status
+        assert time.monotonic() < deadline, status
+        time.sleep(0.02)
+
+
+def _blocking_job(release, started=None):
+    def run(progress):
+        if started is not None:
+            started.set()
+        while not release.wait(0.01):
+            progress.update(ProgressUpdate("block", 0, 1, 0.0))
+        return {"ok": True}
+
+    return run
+
+
+@pytest.fixture
+def client():
+    with TestClient(create_app(job_manager=JobManager())) as test_client:
+        yield test_client
+
+
+def test_simulation_job_returns_the_batch_payload(client):
+    spec = SimulationSpec(modes=["no_def", "window"], runs=4, seed=3, num_legit=10)
+
+    submitted = client.post("/api/v1/jobs/simulations", json=spec.model_dump(mode="json"))
+    assert submitted.status_code == 202
+    job_id = submitted.json()["job_id"]
+    status = _wait(lambda: client.get(f"/api/v1/jobs/{job_id}").json())
+
+    assert status["state"] == "succeeded"
+    assert (status["completed"], status["total"]) == (8, 8)  # runs x modes
+    expected = simulate_batch(spec).model_dump(mode="json")
+    assert _stable_results(status["result"]["results"]) == _stable_results(expected["results"])
+    assert [job["job_id"] for job in client.get("/api/v1/jobs").json()] == [job_id]
+
+
+def test_sweep_job_reports_per_cell_progress(client):
+    spec = SweepSpec(
+        sweep_type="window",
+        values=[3, 5],
+        simulation=SimulationSpec(modes=["window"], runs=3, seed=5, num_legit=8),
+    )
+
+    job_id = client.post("/api/v1/jobs/sweeps", json=spec.model_dump(mode="json")).json()["job_id"]
+    status = _wait(lambda: client.get(f"/api/v1/jobs/{job_id}").json())
+
+    assert status["state"] == "succeeded"
+    assert (status["completed"], status["total"]) == (2, 2)
+    points = status["result"]["points"]
+    expected = [point.model_dump(mode="json") for point in run_sweep(spec)]
+    assert _stable_results([p["result"] for p in points]) == _stable_results(
+        [p["result"] for p in expected]
+    )
+
+
+def test_precision_job_counts_rounds_up_to_max_runs(client):
+    spec = SimulationSpec(
+        modes=["no_def", "window"], seed=4, num_legit=10, target_ci_half_width=0.1, max_runs=200
+    )
+
+    job_id = client.post("/api/v1/jobs/simulations", json=spec.model_dump(mode="json")).json()[
+        "job_id"
+    ]
+    status = _wait(lambda: client.get(f"/api/v1/jobs/{job_id}").json())
+
+    assert status["state"] == "succeeded"
+    assert (status["completed"], status["total"]) == (200, 200)
+    assert all(r["metadata"]["stopping"] == "sequential" for r in status["result"]["results"])
+
+
+def test_admission_limit_rejects_with_429_and_queued_jobs_cancel():
+    manager = JobManager({"simulation": JobLimits(workers=1, max_pending=2)})
+    release, started = threading.Event(), threading.Event()
+    spec = SimulationSpec(modes=["no_def"], runs=1, seed=1).model_dump(mode="json")
+    with TestClient(create_app(job_manager=manager)) as client:
+        running = manager.submit("simulation", _blocking_job(release, started))
+        started.wait(5)
+        queued = client.post("/api/v1/jobs/simulations", json=spec).json()
+        assert queued["state"] == "queued"
+
+        rejected = client.post("/api/v1/jobs/simulations", json=spec)
+        assert rejected.status_code == 429
+
+        cancelled = client.delete(f"/api/v1/jobs/{queued['job_id']}").json()
+        assert (cancelled["state"], cancelled["cancel_requested"]) == ("cancelled", True)
+        release.set()
+        assert _wait(lambda: manager.get(running.job_id).model_dump())["state"] == "succeeded"
+
+        assert client.get("/api/v1/jobs/nope").status_code == 404
+        assert client.delete("/api/v1/jobs/nope").status_code == 404
+
+
+def test_running_job_stops_at_next_progress_report():
+    manager = JobManager({"sweep": JobLimits(workers=1, max_pending=1)})
+    release, started = threading.Event(), threading.Event()
+    try:
+        job = manager.submit("sweep", _blocking_job(release, started))
+        started.wait(5)
+        assert manager.cancel(job.job_id).cancel_requested
+        assert _wait(lambda: manager.get(job.job_id).model_dump())["state"] == "cancelled"
+    finally:
+        release.set()
+        manager.shutdown(wait=True)
+
+
+def test_failed_job_records_the_error_and_finished_jobs_are_bounded():
+    manager = JobManager({"simulation": JobLimits(workers=1, max_pending=1)}, max_retained=1)
+
+    def boom(progress):
+        raise RuntimeError("bad spec")
+
+    try:
+        failed = manager.submit("simulation", boom)
+        status = _wait(lambda: manager.get(failed.job_id).model_dump())
+        assert (status["state"], status["error"]) == ("failed", "RuntimeError: bad spec")
+
+        done = manager.submit("simulation", lambda progress: {"ok": True})
+        _wait(lambda: manager.get(done.job_id).model_dump())
+        manager.submit("simulation", lambda progress: {"ok": True})
+        with pytest.raises(KeyError):
+            manager.get(failed.job_id)
+    finally:
+        manager.shutdown(wait=True)
+
+
+def test_limits_are_validated():
+    with pytest.raises(ValueError, match="workers"):
+        JobLimits(workers=0)
+    with pytest.raises(ValueError, match="max_pending"):
+        JobLimits(workers=2, max_pending=1)
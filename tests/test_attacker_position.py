@@ -6,7 +6,6 @@ appended attack-only extra drop that never touches the legit path.
 """
 import hashlib
 import json
-from dataclasses import asdict
 from pathlib import Path
 
 from replay.core import (
@@ -181,7 +180,7 @@ def test_strong_trace_digest_omits_attack_extra_drop_field():
     tr = generate_trace(_base(attacker_inject_strength="strong"), seed=SEED)
     assert tr.attack_extra_dropped == []
     # digest must equal the legacy-shape digest (empty field popped from the payload)
-    data = asdict(tr)
+    data = tr.to_lists()
     data.pop("attack_extra_dropped")
     expected = hashlib.sha256(
         json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
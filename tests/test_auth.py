@@ -1,6 +1,10 @@
+import dataclasses
+
 import pytest
 
-from replay.core.auth import HmacAuthenticator
+from replay.core import Mode, SimulationConfig, run_many_experiments
+from replay.core.auth import HmacAuthenticator, SymbolicAuthenticator
+from replay.core.auth_check import check_symbolic_equivalence, sample_configs
 
 
 def test_hmac_authenticator_roundtrip():
@@ -20,3 +24,38 @@ def test_ascon_authenticator_roundtrip_if_available():
     tag = authenticator.tag(5, "CMD")
 
     assert authenticator.verify(5, "CMD", tag)
+
+
+def test_symbolic_authenticator_roundtrip():
+    authenticator = SymbolicAuthenticator(key="k", tag_bits=80)
+    tag = authenticator.tag(5, "CMD")
+
+    assert authenticator.verify(5, "CMD", tag)
+    assert not authenticator.verify(6, "CMD", tag)
+    assert not authenticator.verify(5, "OTHER", tag)
+    assert not authenticator.verify(5, "CMD", None)
+    assert not SymbolicAuthenticator(key="k2").verify(5, "CMD", tag)
+    assert not SymbolicAuthenticator(key="k", tag_bits=40).verify(5, "CMD", tag)
+    with pytest.raises(ValueError):
+        SymbolicAuthenticator(key="k", tag_bits=81)
+
+
+def test_symbolic_profile_matches_hmac_counters_on_sample_configs():
+    assert check_symbolic_equivalence(sample_configs(), runs=4, seed=3) == []
+
+
+def test_symbolic_profile_books_hmac_costs():
+    cfg = SimulationConfig(mode=Mode.WINDOW, num_legit=10, num_replay=10, window_size=3)
+    hmac_stats, symbolic_stats = (
+        run_many_experiments(
+            dataclasses.replace(cfg, auth_profile=profile),
+            [Mode.WINDOW],
+            runs=3,
+            seed=1,
+            show_progress=False,
+        )[0]
+        for profile in ("hmac", "symbolic")
+    )
+    assert symbolic_stats.auth_profile == "symbolic"
+    assert symbolic_stats.crypto_ops == hmac_stats.crypto_ops > 0
+    assert symbolic_stats.energy_proxy == hmac_stats.energy_proxy
@@ -0,0 +1,122 @@
+"""NumPy batch engine vs scalar engine: CI-level parity for the window family."""
+import pytest
+
+from replay.core import CostModel, Mode, SimulationConfig, run_many_experiments
+from replay.core.stats import ci_overlap, wilson_ci
+from replay.core.types import AttackMode
+
+pytest.importorskip("numpy")
+
+from replay.core.batch_engine import simulate_runs_vector, vector_supported  # noqa: E402
+
+VECTOR_MODES = [Mode.WINDOW, Mode.SW_RESYNC, Mode.OSCORE_LIKE, Mode.ROLLING_MAC]
+
+
+def _cfg(attack_mode: AttackMode, **kw) -> SimulationConfig:
+    base = dict(
+        mode=Mode.WINDOW,
+        attack_mode=attack_mode,
+        num_legit=20,
+        num_replay=20,
+        p_loss=0.2,
+        p_reorder=0.3,
+        window_size=4,
+        g_hard=3,
+    )
+    base.update(kw)
+    return SimulationConfig(**base)
+
+
+@pytest.mark.parametrize("attack_mode", [AttackMode.POST_RUN, AttackMode.INLINE])
+def test_vector_lar_asr_cis_overlap_scalar(attack_mode):
+    cfg = _cfg(attack_mode)
+    scalar = run_many_experiments(cfg, VECTOR_MODES, runs=300, seed=5, show_progress=False)
+    vector = run_many_experiments(
+        cfg, VECTOR_MODES, runs=300, seed=5, show_progress=False, engine="vector"
+    )
+    for s, v in zip(scalar, vector):
+        assert v.metadata["engine"] == "vector"
+        assert s.legit_total == v.legit_total
+        assert ci_overlap(
+            wilson_ci(s.legit_accepted, s.legit_total),
+            wilson_ci(v.legit_accepted, v.legit_total),
+        ), s.mode
+        assert ci_overlap(
+            wilson_ci(s.attack_accepted, s.attack_total),
+            wilson_ci(v.attack_accepted, v.attack_total),
+        ), s.mode
+
+
+def test_vector_ideal_channel_matches_scalar_exactly():
+    cfg = _cfg(AttackMode.POST_RUN, p_loss=0.0, p_reorder=0.0, command_set=["FWD"])
+    scalar = run_many_experiments(cfg, VECTOR_MODES, runs=20, seed=1, show_progress=False)
+    vector = run_many_experiments(
+        cfg, VECTOR_MODES, runs=20, seed=1, show_progress=False, engine="vector"
+    )
+    for s, v in zip(scalar, vector):
+        assert (v.legit_accepted, v.attack_accepted, v.attack_total) == (
+            s.legit_accepted,
+            s.attack_accepted,
+            s.attack_total,
+        )
+        assert v.energy_proxy == pytest.approx(s.energy_proxy)
+        assert v.bytes_overhead == pytest.approx(s.bytes_overhead)
+
+
+@pytest.mark.parametrize("auth_profile", ["hmac", "ascon"])
+def test_vector_energy_uses_the_scalar_cost_model(auth_profile):
+    cfg = _cfg(
+        AttackMode.POST_RUN, p_loss=0.0, p_reorder=0.0, command_set=["FWD"],
+        auth_profile=auth_profile,
+    )
+    (run,) = simulate_runs_vector(cfg, 1, seed=2)
+    cheap_macs = CostModel(hmac_energy=0.0, ascon_energy=0.0)
+    (cheap,) = simulate_runs_vector(cfg, 1, seed=2, cost_model=cheap_macs)
+    assert run.energy_proxy - cheap.energy_proxy == pytest.approx(
+        run.crypto_ops * (4.0 if auth_profile == "ascon" else 5.0)
+    )
+
+    if auth_profile == "ascon":
+        pytest.importorskip("ascon")  # the scalar engine computes real Ascon tags
+    scalar = run_many_experiments(cfg, [Mode.WINDOW], runs=5, seed=2, show_progress=False)
+    vector = run_many_experiments(
+        cfg, [Mode.WINDOW], runs=5, seed=2, show_progress=False, engine="vector"
+    )
+    assert vector[0].energy_proxy == pytest.approx(scalar[0].energy_proxy)
+
+
+def test_vector_engine_falls_back_to_scalar_for_unsupported_modes():
+    cfg = _cfg(AttackMode.POST_RUN)
+    stats = run_many_experiments(
+        cfg, [Mode.CHALLENGE, Mode.WINDOW], runs=3, seed=1, show_progress=False, engine="vector"
+    )
+    assert [s.metadata["engine"] for s in stats] == ["scalar", "vector"]
+
+
+def test_vector_engine_rejects_state_dependent_attackers():
+    cfg = _cfg(AttackMode.POST_RUN, attacker_strategy="adaptive_lostframe")
+    assert not vector_supported(cfg)
+    with pytest.raises(ValueError, match="engine='vector'"):
+        simulate_runs_vector(cfg, 1)
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError, match="engine"):
+        run_many_experiments(_cfg(AttackMode.POST_RUN), [Mode.WINDOW], runs=1, engine="gpu")
+
+
+def test_block_size_follows_the_cell_budget(monkeypatch):
+    from replay.core import batch_engine
+
+    seen = []
+    simulate_block = batch_engine._simulate_block
+
+    def spy(config, n, rng, cost_model):
+        seen.append(n)
+        return simulate_block(config, n, rng, cost_model)
+
+    monkeypatch.setattr(batch_engine, "_BLOCK_CELLS", 200)
+    monkeypatch.setattr(batch_engine, "_simulate_block", spy)
+    cfg = _cfg(AttackMode.POST_RUN, num_legit=60, num_replay=40)
+    assert len(simulate_runs_vector(cfg, 5, seed=1)) == 5
+    assert seen == [2, 2, 1]  # 200 cells // 100 slots per run
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from replay.bench import (
+    MacroResult,
+    build_baseline,
+    compare_results,
+    format_report,
+    has_failures,
+    load_baseline,
+    macro_cases,
+    run_case,
+    select_cases,
+    write_baseline,
+)
+from replay.cli import app as cli_app
+from replay.core import AttackMode, Mode
+
+
+def _result(name, runs_per_sec, rss=1000):
+    return MacroResult(name, 10, 10 / runs_per_sec, runs_per_sec, rss)
+
+
+def test_suite_covers_modes_attacks_engines_channels_and_large_configs():
+    cases = macro_cases()
+    names = {case.name for case in cases}
+
+    assert {f"mode/{m.value}/{a.value}" for m in Mode for a in AttackMode} <= names
+    assert {"engine/live", "engine/paired"} <= names
+    assert {"channel/iid", "channel/gilbert_elliott", "channel/trace"} <= names
+    assert max(case.spec.num_legit for case in cases) >= 2000
+    assert max(case.spec.window_size for case in cases) >= 1024
+    assert all(len(case.spec.modes) == 1 for case in cases)
+    assert [case.spec.runs for case in macro_cases(0.001)] == [1] * len(cases)
+    assert [c.name for c in select_cases(cases, ["channel/*", "engine/paired"])] == [
+        "engine/paired", "channel/iid", "channel/gilbert_elliott", "channel/trace"
+    ]
+    with pytest.raises(ValueError, match="scale"):
+        macro_cases(0)
+
+
+@pytest.mark.parametrize("isolate", [False, True], ids=["in_process", "isolated"])
+def test_run_case_reports_throughput_and_rss(isolate):
+    (case,) = select_cases(macro_cases(0.02), ["mode/window/post"])
+    result = run_case(case, repeat=1, isolate=isolate)
+
+    assert result.runs == case.spec.runs == 4
+    assert result.runs_per_sec == pytest.approx(result.runs / result.seconds)
+    assert result.peak_rss_kib is None or result.peak_rss_kib > 0
+
+
+def test_compare_flags_throughput_drops_and_rss_growth_beyond_threshold(tmp_path):
+    previous = build_baseline(
+        [_result("a", 100.0), _result("b", 100.0), _result("c", 100.0), _result("gone", 1.0)],
+        scale=1.0,
+        repeat=1,
+    )
+    path = write_baseline(tmp_path / "nested" / "base.json", previous)
+    loaded = load_baseline(path)
+    current = [_result("a", 95.0), _result("b", 80.0), _result("c", 100.0, rss=1200),
+               _result("new", 5.0)]
+
+    rows = {row.name: row for row in compare_results(current, loaded, threshold=0.1)}
+
+    assert rows["a"].status == "ok" and rows["a"].throughput_change == pytest.approx(-0.05)
+    assert rows["b"].status == "regression"
+    assert rows["c"].status == "regression" and rows["c"].rss_change == pytest.approx(0.2)
+    assert (rows["new"].status, rows["gone"].status) == ("new", "skipped")
+    assert "2 regression(s) beyond 10%, 0 missing" in format_report(
+        list(rows.values()), threshold=0.1
+    )
+    assert load_baseline(tmp_path / "absent.json") is None
+
+
+def test_baseline_cases_missing_from_a_full_run_fail():
+    previous = build_baseline([_result("a", 100.0), _result("gone", 1.0)], scale=1.0, repeat=1)
+    current = [_result("a", 100.0)]
+
+    subset = compare_results(current, previous)
+    full = compare_results(current, previous, full_suite=True)
+
+    assert [row.status for row in subset] == ["ok", "skipped"] and not has_failures(subset)
+    assert [row.status for row in full] == ["ok", "missing"] and has_failures(full)
+    assert "0 regression(s) beyond 10%, 1 missing case(s)" in format_report(full, threshold=0.1)
+
+
+def test_baselines_from_another_schema_are_rejected(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({"schema_version": 0, "cases": {}}), encoding="utf-8")
+    with pytest.raises(ValueError, match="schema_version"):
+        load_baseline(path)
+
+
+def test_cli_bench_records_then_compares_and_fails_on_regression(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    argv = ["bench", "--cases", "mode/no_def/post", "--scale", "0.02", "--repeat", "1",
+            "--no-isolate", "--baseline", str(baseline)]
+
+    assert cli_app.main([*argv, "--update-baseline"]) == 0
+    recorded = json.loads(baseline.read_text(encoding="utf-8"))
+    assert list(recorded["cases"]) == ["mode/no_def/post"]
+    assert "new" in capsys.readouterr().out
+
+    recorded["cases"]["mode/no_def/post"]["runs_per_sec"] *= 1000
+    baseline.write_text(json.dumps(recorded), encoding="utf-8")
+    assert cli_app.main(argv) == 1
+    assert "regression" in capsys.readouterr().out
+
+    assert cli_app.main(["bench", "--list", "--cases", "large/*"]) == 0
+    assert capsys.readouterr().out.split() == [
+        "large/num_legit_2000", "large/window_1024", "large/hsw_cr_window_1024"
+    ]
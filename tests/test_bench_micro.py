@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from replay.bench import micro_cases, run_micro_suite, select_micro_cases, suite_payload, time_case
+from replay.cli import app as cli_app
+from replay.core.kernel.acceptance import SwDecision
+
+
+def test_suite_covers_every_primitive_across_parameter_ranges():
+    cases = micro_cases()
+    primitives = {case.primitive for case in cases}
+
+    assert {
+        "classify",
+        "window_commit",
+        "resync_commit_same_epoch",
+        "hmac96",
+        "crit_confirm_tag",
+        "DeterministicRNG.random",
+        "DeterministicRNG.randint",
+        "DeterministicRNG.getrandbits",
+        "EventScheduler.submit+pop_due",
+        "Frame.clone",
+    } <= primitives
+    windows = {case.params["w"] for case in cases if case.primitive == "window_commit"}
+    assert (min(windows), max(windows)) == (1, 4096)
+    assert len({case.params["tag_bits"] for case in cases if "tag_bits" in case.params}) >= 4
+    assert max(c.params["depth"] for c in cases if "depth" in c.params) >= 4096
+    assert len({case.name for case in cases}) == len(cases)
+
+
+@pytest.mark.parametrize(
+    ("label", "decision"),
+    [
+        ("forward", SwDecision.ACCEPT_FORWARD),
+        ("in_window", SwDecision.ACCEPT_IN_WINDOW),
+        ("old", SwDecision.REJECT_OLD),
+    ],
+)
+def test_classify_cases_exercise_the_labelled_branch(label, decision):
+    cases = select_micro_cases(micro_cases(), [f"classify/w=*/{label}"])
+    windows = [case.params["w"] for case in cases]
+    assert windows == [1, 8, 64, 512, 4096]
+    assert {case.setup()() for case in cases} == {decision}
+
+
+def test_timing_is_calibrated_and_payload_is_machine_readable():
+    cases = select_micro_cases(micro_cases(), ["overhead/noop", "scheduler*depth=16"])
+    results = run_micro_suite(cases, repeat=2, min_time=0.002)
+
+    for result in results:
+        assert result.loops * result.ns_per_op_best >= 0.5 * 0.002e9
+        assert 0 < result.ns_per_op_best <= result.ns_per_op_median
+    payload = json.loads(json.dumps(suite_payload(results, repeat=2, min_time=0.002)))
+    assert [row["name"] for row in payload["results"]] == [
+        "overhead/noop", "scheduler.submit+pop_due/depth=16"
+    ]
+    assert payload["results"][1]["params"] == {"depth": 16}
+    assert payload["results"][0]["ops_per_sec"] > 0
+    with pytest.raises(ValueError, match="min_time"):
+        time_case(cases[0], min_time=0)
+
+
+def test_cli_micro_prints_json_and_rejects_baseline_updates(tmp_path, capsys):
+    output = tmp_path / "micro.json"
+    argv = ["bench", "--micro", "--cases", "frame.clone/*", "--repeat", "1",
+            "--min-time", "0.001", "--json", "--output-json", str(output)]
+
+    assert cli_app.main(argv) == 0
+    printed = json.loads(capsys.readouterr().out)
+    assert [row["name"] for row in printed["results"]] == [
+        "frame.clone/normal", "frame.clone/critical"
+    ]
+    assert json.loads(output.read_text(encoding="utf-8"))["schema_version"] == 1
+    with pytest.raises(SystemExit):
+        cli_app.main(["bench", "--micro", "--update-baseline"])
@@ -8,7 +8,9 @@ from replay.core import AttackMode, Mode
 def test_cli_sim_run_uses_preset_and_allows_run_override(monkeypatch, capsys):
     captured = {}
 
-    def fake_simulate_batch(spec, *, show_progress):
+    def fake_simulate_batch(
+        spec, *, show_progress, trace_cache=None, result_cache=None, instrument=False
+    ):
         captured["spec"] = spec
         captured["show_progress"] = show_progress
         return SimulationBatchResult(
@@ -55,7 +57,9 @@ def test_cli_advise_reads_profile(capsys):
 def test_cli_sim_run_accepts_sw_resync_and_g_hard(monkeypatch):
     captured = {}
 
-    def fake_simulate_batch(spec, *, show_progress):
+    def fake_simulate_batch(
+        spec, *, show_progress, trace_cache=None, result_cache=None, instrument=False
+    ):
         captured["spec"] = spec
         return SimulationBatchResult(
             config=SimulationSpecPublic.from_spec(spec),
@@ -68,3 +72,18 @@ def test_cli_sim_run_accepts_sw_resync_and_g_hard(monkeypatch):
     spec = captured["spec"]
     assert spec.modes == ["sw_resync"]
     assert spec.g_hard == 32
+
+
+def test_cli_sim_run_threads_workers(monkeypatch):
+    captured = {}
+
+    def fake_simulate_batch(
+        spec, *, show_progress, trace_cache=None, result_cache=None, instrument=False
+    ):
+        captured["spec"] = spec
+        return SimulationBatchResult(config=SimulationSpecPublic.from_spec(spec), results=[])
+
+    monkeypatch.setattr(cli_app, "simulate_batch", fake_simulate_batch)
+
+    assert cli_app.main(["sim", "run", "--modes", "window", "--workers", "4"]) == 0
+    assert captured["spec"].workers == 4
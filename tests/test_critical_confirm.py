@@ -133,7 +133,7 @@ def test_confirm_sw_reject_when_ctr_old():
     # 窗口已前进到 10；旧 ctr=1 的 confirm 不被借道提交
     rcv = _receiver()
     rcv.state.last_counter = 10
-    rcv.state.received_mask = [1] + [0] * (W - 1)
+    rcv.state.received_mask = 1
     rcv.process_crit_prepare(_prepare_frame(ctr=1), random.Random(1), now_tick=0)
     pid = pid_for(epoch=1, ctr=1, cmd="OPEN", payload_hash=payload_digest(b"data"))
     res = rcv.process_crit_confirm(_confirm_for(rcv, pid), now_tick=5)
@@ -43,7 +43,7 @@ def test_critical_prepare_does_not_update_global_window():
     # blocker C1: 合法 prepare 仅登记 pending，不动 H/M_W、不执行命令
     rcv = _receiver()
     before_h = rcv.state.last_counter
-    before_mask = list(rcv.state.received_mask)
+    before_mask = rcv.state.received_mask
     res = rcv.process_crit_prepare(_prepare_frame(), random.Random(1), now_tick=0)
     assert res.accepted is False
     assert res.reason == "critical_prepared"
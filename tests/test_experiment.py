@@ -8,7 +8,12 @@ Tests for Experiment module
 - 实验参数边界条件
 """
 
+import pytest
+
+from replay.core.experiment import compile_run_plan
 from sim.experiment import run_many_experiments, simulate_one_run
+from sim.rng import DeterministicRNG
+from sim.security import TagTable
 from sim.types import AttackMode, Mode, SimulationConfig
 
 # ============================================================================
@@ -216,6 +221,65 @@ def test_performance_metadata_present_for_all_modes():
         assert "total_runs" in entry.metadata
 
 
+def test_tag_table_shared_across_runs_without_changing_results():
+    """跨 run 共享 MAC tag 表：第二个 run 起命中，结果与无表逐字节一致"""
+    config = SimulationConfig(
+        mode=Mode.WINDOW,
+        num_legit=10,
+        num_replay=10,
+        p_loss=0.1,
+        p_reorder=0.1,
+        window_size=5,
+        attack_mode=AttackMode.POST_RUN,
+    )
+    table = TagTable()
+    results = run_many_experiments(
+        config, modes=[Mode.ROLLING_MAC, Mode.WINDOW], runs=5, seed=3,
+        show_progress=False, tag_table=table,
+    )
+    for entry in results:
+        assert entry.diagnostics["tag_cache_hits"] > entry.diagnostics["tag_cache_misses"]
+        assert "tag_cache_hits" not in entry.as_dict()
+    assert table.misses < table.hits
+
+    cached = simulate_one_run(config, rng=DeterministicRNG(9), tag_table=TagTable())
+    plain = simulate_one_run(config, rng=DeterministicRNG(9))
+    assert cached.diagnostics["tag_cache_misses"] > 0
+    assert cached.diagnostics["tag_cache_hits"] >= 0
+    assert cached == plain
+
+
+def test_run_plan_reuse_matches_fresh_runs():
+    """RunPlan 跨 run 复用（reset 后的 sender/receiver）与每 run 新建逐字节一致"""
+    for mode in (Mode.CHALLENGE, Mode.HSW_CR, Mode.SW_RESYNC):
+        config = SimulationConfig(
+            mode=mode,
+            num_legit=12,
+            num_replay=12,
+            p_loss=0.2,
+            p_reorder=0.2,
+            window_size=3,
+            g_hard=2,
+            command_set=["UNLOCK", "LOCK"],
+            command_risk={"UNLOCK": 1.0},
+            risk_high=0.8,
+            reboot_at_legit_index=6 if mode is Mode.HSW_CR else None,
+        )
+        plan = compile_run_plan(config)
+        for seed in range(4):
+            reused = simulate_one_run(config, rng=DeterministicRNG(seed), plan=plan)
+            fresh = simulate_one_run(config, rng=DeterministicRNG(seed))
+            assert reused == fresh
+
+
+def test_run_plan_rejects_other_config():
+    config = SimulationConfig(mode=Mode.WINDOW, num_legit=3, num_replay=3)
+    plan = compile_run_plan(config)
+    other = SimulationConfig(mode=Mode.ROLLING_MAC, num_legit=3, num_replay=3)
+    with pytest.raises(ValueError, match="plan"):
+        simulate_one_run(other, rng=DeterministicRNG(0), plan=plan)
+
+
 # ============================================================================
 # Test: Reproducibility (Seed)
 # ============================================================================
@@ -0,0 +1,70 @@
+import dataclasses
+
+import pytest
+
+from replay.core import Mode, SimulationConfig, TagTable
+from replay.core.experiment import simulate_fused_with_trace, simulate_one_run_with_trace
+from replay.core.trace import generate_trace
+from replay.core.types import AttackMode
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"attack_mode": AttackMode.INLINE, "inline_attack_probability": 0.6},
+        {"attacker_position": "rx", "attacker_inject_strength": "weak"},
+        {"reboot_at_legit_index": 4, "command_risk": {"UNLOCK": 1.0}, "risk_high": 0.8},
+    ],
+)
+def test_fused_walk_matches_per_mode_runs(overrides):
+    base = dict(
+        mode=Mode.WINDOW,
+        num_legit=25,
+        num_replay=25,
+        p_loss=0.25,
+        p_reorder=0.3,
+        window_size=4,
+        command_set=["UNLOCK", "LOCK", "PING"],
+    )
+    base.update(overrides)
+    configs = [dataclasses.replace(SimulationConfig(**base), mode=mode) for mode in Mode]
+    seeds = [100 + index for index in range(len(configs))]
+    for trace_seed in (1, 2, 3):
+        trace = generate_trace(configs[0], trace_seed)
+        table = TagTable()
+        fused = simulate_fused_with_trace(configs, trace, nonce_seeds=seeds, tag_table=table)
+        single = [
+            simulate_one_run_with_trace(config, trace, nonce_seed=seed)
+            for config, seed in zip(configs, seeds)
+        ]
+        assert fused == single
+        # per-mode tag attribution adds up to the shared table's lookups
+        assert sum(r.diagnostics["tag_cache_hits"] for r in fused) == table.hits
+        assert sum(r.diagnostics["tag_cache_misses"] for r in fused) == table.misses
+
+
+def test_fused_requires_one_nonce_seed_per_config():
+    cfg = SimulationConfig(mode=Mode.WINDOW, num_legit=3, num_replay=3)
+    with pytest.raises(ValueError, match="nonce_seeds"):
+        simulate_fused_with_trace([cfg, cfg], generate_trace(cfg, 1), nonce_seeds=[1])
+
+
+def test_paired_batch_hashes_each_trace_once(monkeypatch):
+    from replay.core import run_paired_experiments
+    from replay.core.trace import ScenarioTrace
+
+    calls = []
+    digest = ScenarioTrace.digest
+
+    def counting_digest(self, mode="compat"):
+        calls.append(mode)
+        return digest(self, mode)
+
+    monkeypatch.setattr(ScenarioTrace, "digest", counting_digest)
+    config = SimulationConfig(mode=Mode.WINDOW, num_legit=10, num_replay=5, p_loss=0.2)
+    (window, _) = run_paired_experiments(
+        config, [Mode.WINDOW, Mode.NO_DEFENSE], runs=4, seed=1, show_progress=False
+    )
+    assert len(calls) == 4
+    assert len(window.metadata["trace_digests"]) == 4
@@ -58,7 +58,7 @@ def test_resync_required_does_not_mutate_state():
     receiver = _recv(Mode.SW_RESYNC)
     receiver.process(_frame(10))
     before_h = receiver.state.last_counter
-    before_mask = list(receiver.state.received_mask)
+    before_mask = receiver.state.received_mask
     res = receiver.process(_frame(100))
     assert res.reason == "resync_required"
     assert receiver.state.last_counter == before_h
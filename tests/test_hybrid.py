@@ -0,0 +1,182 @@
+import dataclasses
+import math
+
+import pytest
+
+from replay.contracts import SimulationSpec
+from replay.core import (
+    AttackMode,
+    Mode,
+    SimulationConfig,
+    generate_trace,
+    run_hybrid_experiments,
+    run_paired_experiments,
+    simulate_one_run_with_trace,
+)
+from replay.core.hybrid import (
+    asr_coverage,
+    control_variate_estimate,
+    lar_coverage,
+    pick_probabilities,
+    replay_control,
+    replay_control_mean,
+)
+from replay.services import result_cache_key, simulate_batch
+
+
+def _config(**overrides):
+    fields = {
+        "mode": Mode.WINDOW,
+        "num_legit": 40,
+        "num_replay": 20,
+        "p_loss": 0.3,
+        "p_reorder": 0.0,
+        "window_size": 5,
+    }
+    fields.update(overrides)
+    return SimulationConfig(**fields)
+
+
+def test_coverage_names_what_the_model_does_not_cover():
+    assert lar_coverage(_config()) is None
+    assert asr_coverage(_config()) is None
+    assert "reorder" in lar_coverage(_config(p_reorder=0.1))
+    assert "not modelled" in lar_coverage(_config(mode=Mode.NO_DEFENSE))
+    assert lar_coverage(_config(attack_mode=AttackMode.INLINE)) is None
+    assert "inline" in asr_coverage(_config(attack_mode=AttackMode.INLINE))
+    assert "weak" in asr_coverage(_config(attacker_inject_strength="weak"))
+    assert "record" in asr_coverage(_config(attacker_position="rx"))
+
+
+def test_pick_probabilities_are_exact():
+    weights = pick_probabilities(7)
+    assert math.fsum(weights) == pytest.approx(1.0, abs=1e-15)
+    assert weights[0] >= weights[-1]
+    assert pick_probabilities(1) == [1.0]
+
+
+def test_single_replay_control_is_the_run_outcome():
+    config = _config(num_replay=1, num_legit=12, window_size=3, p_loss=0.5)
+    for seed in range(200):
+        trace = generate_trace(config, seed)
+        result = simulate_one_run_with_trace(config, trace, nonce_seed=seed)
+        assert replay_control(trace, config.num_legit, config.window_size) == (
+            result.attack_success_rate
+        )
+
+
+def test_legit_rate_is_exactly_one_minus_loss_per_run():
+    config = _config(attack_mode=AttackMode.INLINE, inline_attack_probability=0.5)
+    for seed in range(50):
+        trace = generate_trace(config, seed)
+        result = simulate_one_run_with_trace(config, trace, nonce_seed=seed)
+        assert result.legit_accepted == config.num_legit - trace.legit_drop_count
+
+
+def test_control_variate_estimate():
+    assert control_variate_estimate([0.1, 0.2, 0.3], [0.5, 0.5, 0.5], 0.5) is None
+    assert control_variate_estimate([0.1, 0.2], [0.1, 0.2], 0.1) is None
+    exact = control_variate_estimate([0.1, 0.2, 0.3, 0.5], [0.1, 0.2, 0.3, 0.5], 0.25)
+    assert exact.estimate == pytest.approx(0.25)
+    assert exact.half_width == pytest.approx(0.0, abs=1e-12)
+    with pytest.raises(ValueError):
+        control_variate_estimate([0.1], [0.1, 0.2], 0.1)
+
+
+def test_hybrid_matches_paired_counts_and_flags_each_path():
+    config = _config()
+    modes = [Mode.WINDOW, Mode.NO_DEFENSE]
+    hybrid = run_hybrid_experiments(config, modes, 120, seed=7)
+    paired = run_paired_experiments(config, modes, 120, seed=7, show_progress=False)
+
+    for ours, theirs in zip(hybrid, paired):
+        assert ours.energy_proxy == theirs.energy_proxy
+
+    window, no_def = hybrid
+    # estimated rates carry their MC counts in the provenance, not next to the rate
+    lar = window.metadata["estimator"]["lar"]
+    assert lar == {"path": "analytic", "mc_counts": [paired[0].legit_accepted, 40 * 120]}
+    assert (window.legit_accepted, window.legit_total) == (0, 0)
+    assert window.avg_legit_rate == window.lar_ci_low == window.lar_ci_high == 0.7
+    asr = window.metadata["estimator"]["asr"]
+    assert asr["path"] == "control_variate"
+    assert asr["mc_counts"] == [paired[0].attack_accepted, paired[0].attack_total]
+    assert (window.attack_accepted, window.attack_total) == (0, 0)
+    mc_low, mc_high = asr["mc_ci"]
+    assert window.asr_ci_high - window.asr_ci_low < mc_high - mc_low
+    assert asr["variance_reduction"] > 1.0
+
+    assert no_def.metadata["estimator"]["asr"]["path"] == "mc"
+    assert no_def.attack_accepted == paired[1].attack_accepted
+    assert no_def.legit_accepted == paired[1].legit_accepted
+    assert no_def.avg_attack_rate == paired[1].avg_attack_rate
+    assert (no_def.asr_ci_low, no_def.asr_ci_high) == (paired[1].asr_ci_low, paired[1].asr_ci_high)
+
+
+def test_single_replay_asr_is_analytic():
+    config = _config(num_replay=1)
+    (stats,) = run_hybrid_experiments(config, [Mode.WINDOW], 5, seed=1)
+    expected = replay_control_mean(config.num_legit, config.p_loss, config.window_size)
+    assert stats.metadata["estimator"]["asr"]["path"] == "analytic"
+    assert stats.attack_total == 0 and stats.metadata["estimator"]["asr"]["mc_counts"][1] == 5
+    assert stats.avg_attack_rate == stats.asr_ci_low == stats.asr_ci_high == expected
+
+
+def test_target_half_width_stops_each_mode_on_its_own():
+    config = _config()
+    window, no_def = run_hybrid_experiments(
+        config,
+        [Mode.WINDOW, Mode.NO_DEFENSE],
+        0,
+        seed=3,
+        target_half_width=0.01,
+        max_runs=600,
+        min_runs=20,
+    )
+    assert window.runs < no_def.runs <= 600
+    assert (window.asr_ci_high - window.asr_ci_low) / 2 <= 0.01
+    (alone,) = run_hybrid_experiments(
+        config, [Mode.WINDOW], 0, seed=3, target_half_width=0.01, max_runs=600, min_runs=20
+    )
+    assert dataclasses.replace(alone, metadata={}) == dataclasses.replace(window, metadata={})
+
+
+def test_progress_reaches_the_total_when_precision_stops_early():
+    updates = []
+
+    class Recorder:
+        min_interval = 0.0
+
+        def start(self, title):
+            pass
+
+        def update(self, update):
+            updates.append((update.completed, update.total))
+
+        def finish(self):
+            pass
+
+    (window,) = run_hybrid_experiments(
+        _config(), [Mode.WINDOW], 0, seed=3, target_half_width=0.05, max_runs=600,
+        min_runs=20, progress=Recorder(),
+    )
+    assert window.runs < 600
+    assert updates[-1] == (600, 600)
+
+
+def test_simulate_batch_threads_the_estimator():
+    spec = SimulationSpec(
+        modes=["window"], runs=40, seed=5, num_legit=30, num_replay=10, p_loss=0.2, p_reorder=0.0
+    )
+    hybrid = spec.model_copy(update={"estimator": "hybrid"})
+
+    record = simulate_batch(hybrid).results[0]
+    assert record.metadata["estimator"]["lar"]["path"] == "analytic"
+    assert record.avg_legit_rate == pytest.approx(0.8)
+    assert "estimator" not in simulate_batch(spec).results[0].metadata
+
+    assert result_cache_key(hybrid) != result_cache_key(spec)
+    with pytest.raises(ValueError, match="instrumentation"):
+        simulate_batch(hybrid, instrument=True)
+    with pytest.raises(ValueError, match="workers must be 1"):
+        SimulationSpec(modes=["window"], estimator="hybrid", workers=2)
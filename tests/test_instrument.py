@@ -0,0 +1,105 @@
+import dataclasses
+
+import pytest
+
+from replay.cli import app as cli_app
+from replay.contracts import SimulationSpec
+from replay.core import (
+    INSTRUMENT_KEYS,
+    AttackMode,
+    DeterministicRNG,
+    Mode,
+    SimulationConfig,
+    compile_run_plan,
+    run_many_experiments,
+    simulate_one_run,
+)
+from replay.services import ResultStore, simulate_batch
+
+_VOLATILE = ("total_time", "time_per_run")
+
+
+def _config(**overrides):
+    fields = {
+        "mode": Mode.WINDOW,
+        "num_legit": 30,
+        "num_replay": 20,
+        "p_loss": 0.1,
+        "p_reorder": 0.1,
+        "attack_mode": AttackMode.INLINE,
+    }
+    fields.update(overrides)
+    return SimulationConfig(**fields)
+
+
+def _without_instrumentation(result):
+    return dataclasses.replace(
+        result,
+        metadata={k: v for k, v in result.metadata.items() if k not in INSTRUMENT_KEYS},
+    )
+
+
+def test_instrumented_run_is_unchanged_and_counts_hot_path_operations():
+    config = _config()
+    plan = compile_run_plan(config)
+    plain = simulate_one_run(config, rng=DeterministicRNG(4), plan=plan)
+    instrumented = simulate_one_run(config, rng=DeterministicRNG(4), plan=plan, instrument=True)
+
+    assert _without_instrumentation(instrumented) == plain
+    metadata = instrumented.metadata
+    assert set(INSTRUMENT_KEYS) <= set(metadata)
+    assert metadata["ops.tag_calls"] == config.num_legit
+    assert metadata["ops.heap_pushes"] == metadata["ops.heap_pops"] > 0
+    assert metadata["ops.verifies"] == metadata["ops.frames_processed"]
+    assert metadata["stage_calls.run"] == 1
+    assert metadata["stage_ns.run"] >= max(metadata["stage_ns.receiver"], metadata["stage_ns.mac"])
+    assert metadata["stage_ns.mac"] > 0
+
+    # the plan's sender/receiver are restored, so later runs are untouched
+    assert "process" not in vars(plan.receiver)
+    assert plan.sender.authenticator is plan.receiver.authenticator is plan.authenticator
+    assert simulate_one_run(config, rng=DeterministicRNG(4), plan=plan) == plain
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_aggregate_metadata_sums_counters_across_runs_and_workers(workers):
+    stats = run_many_experiments(
+        _config(), [Mode.WINDOW, Mode.NO_DEFENSE], runs=6, seed=3,
+        show_progress=False, workers=workers, instrument=True,
+    )
+    window, no_def = (entry.metadata["instrumentation"] for entry in stats)
+
+    assert window["runs"] == 6
+    assert window["stages"]["run"]["calls"] == 6
+    assert window["ops"]["tag_calls"] == 6 * 30
+    assert window["stages"]["run"]["share"] == 1.0
+    assert no_def["ops"]["verifies"] == 0
+    assert window["tag_cache"]["hits"] + window["tag_cache"]["misses"] > 0
+    serial = run_many_experiments(
+        _config(), [Mode.WINDOW], runs=6, seed=3, show_progress=False, instrument=True
+    )[0].metadata["instrumentation"]
+    assert serial["ops"] == window["ops"]
+
+
+def test_batches_are_uninstrumented_by_default_and_bypass_the_cache_when_instrumented(tmp_path):
+    spec = SimulationSpec(modes=["window"], runs=3, seed=2, num_legit=10)
+    assert "instrumentation" not in simulate_batch(spec).results[0].metadata
+
+    store = ResultStore(tmp_path)
+    batch = simulate_batch(spec, result_cache=store, instrument=True)
+    assert batch.metadata["result_cache_bypassed"] is True
+    assert batch.results[0].metadata["instrumentation"]["runs"] == 3
+    assert len(store) == 0
+
+    with pytest.raises(ValueError, match="unpaired"):
+        simulate_batch(spec.model_copy(update={"paired": True}), instrument=True)
+
+
+def test_cli_run_instrument_prints_a_stage_summary(capsys):
+    argv = ["sim", "run", "--modes", "window", "--runs", "2", "--seed", "1", "--num-legit", "6",
+            "--instrument"]
+
+    assert cli_app.main(argv) == 0
+    err = capsys.readouterr().err
+    assert "[window] 2 instrumented runs" in err
+    assert "receiver" in err and "per run:" in err
@@ -1,17 +1,19 @@
 from replay.core.kernel.acceptance import SwDecision, classify
 
+# mask 为整数位图：bit d ↔ counter H-d（0b00001 = 仅 H 已收）
+
 
 def test_accept_forward():
-    assert classify(13, 10, [1, 0, 0, 0, 0], 5) is SwDecision.ACCEPT_FORWARD
+    assert classify(13, 10, 0b00001, 5) is SwDecision.ACCEPT_FORWARD
 
 
 def test_accept_in_window():
-    assert classify(11, 12, [1, 0, 0, 0, 0], 5) is SwDecision.ACCEPT_IN_WINDOW
+    assert classify(11, 12, 0b00001, 5) is SwDecision.ACCEPT_IN_WINDOW
 
 
 def test_reject_dup():
-    assert classify(11, 12, [1, 1, 0, 0, 0], 5) is SwDecision.REJECT_DUP
+    assert classify(11, 12, 0b00011, 5) is SwDecision.REJECT_DUP
 
 
 def test_reject_old():
-    assert classify(7, 12, [1, 0, 0, 0, 0], 5) is SwDecision.REJECT_OLD
+    assert classify(7, 12, 0b00001, 5) is SwDecision.REJECT_OLD
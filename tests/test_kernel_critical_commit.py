@@ -1,4 +1,5 @@
 from replay.core.kernel.critical_commit import critical_commit, payload_digest, pid_for
+from replay.core.kernel.window_commit import bits_to_mask, mask_to_bits
 
 
 def test_payload_digest_is_16_bytes_and_stable():
@@ -25,5 +26,5 @@ def test_pid_fits_signed_64bit_for_mac_encoding():
 
 def test_critical_commit_uses_same_window_commit():
     # critical commit 的窗口更新与 normal accept 完全一致（同 window_commit）
-    new_h, mask = critical_commit(n=12, h=10, mask=[1, 0, 0, 0, 0], w=5)
-    assert (new_h, mask) == (12, [1, 0, 1, 0, 0])
+    new_h, mask = critical_commit(n=12, h=10, mask=bits_to_mask([1, 0, 0, 0, 0]), w=5)
+    assert (new_h, mask_to_bits(mask, 5)) == (12, [1, 0, 1, 0, 0])
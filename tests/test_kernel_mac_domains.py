@@ -1,7 +1,14 @@
+import hashlib
+import hmac
+
 from replay.core.kernel.mac_domains import (
+    DOMAIN_NORMAL_REQ,
+    DOMAIN_RESYNC_CONFIRM,
+    _encode,
     crit_confirm_tag,
     crit_prepare_tag,
     hmac96,
+    keyed_mac,
     normal_req_tag,
     resync_confirm_tag,
 )
@@ -41,3 +48,22 @@ def test_all_four_domains_distinct():
 def test_resync_tag_changes_with_new_h():
     assert resync_confirm_tag(KEY, 1, 0, 0, 1, 10, 200, "nr", 5, 0) \
         != resync_confirm_tag(KEY, 1, 0, 0, 1, 10, 999, "nr", 5, 0)
+
+
+def test_domain_tags_match_uncached_hmac96():
+    # 预编码域前缀 + keyed 上下文必须与逐次 hmac.new 完全等价
+    assert normal_req_tag(KEY, 1, 0, 0, 7, "OPEN", b"p", 0) == hmac96(
+        KEY, DOMAIN_NORMAL_REQ, 1, 0, 0, 7, "OPEN", b"p", 0
+    )
+    assert resync_confirm_tag(KEY, 1, 0, 0, 1, 10, 200, "nr", 5, 0) == hmac96(
+        KEY, DOMAIN_RESYNC_CONFIRM, 1, 0, 0, 1, 10, 200, "nr", 5, 0
+    )
+
+
+def test_keyed_mac_equals_fresh_hmac_and_does_not_leak_state():
+    msg = _encode(b"D", 3)
+    fresh = hmac.new(KEY.encode(), msg, hashlib.sha256).hexdigest()
+    ctx = keyed_mac(KEY)
+    assert ctx.hexdigest(msg) == fresh
+    assert ctx.hexdigest(msg) == fresh  # 共享上下文每次 copy，不累积
+    assert hmac96(KEY, b"D", 3) == fresh[:24]
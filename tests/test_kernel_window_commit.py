@@ -1,26 +1,75 @@
-from replay.core.kernel.window_commit import window_commit
+import random
+
+from replay.core.kernel.acceptance import SwDecision, classify
+from replay.core.kernel.window_commit import bits_to_mask, mask_to_bits, window_commit
+
+
+def _commit(n, h, bits, w):
+    new_h, new_mask = window_commit(n, h, bits_to_mask(bits), w)
+    return new_h, mask_to_bits(new_mask, w)
 
 
 def test_forward_jump_updates_bitmap_exactly():
     # W=5, H=10, 仅顶位已置（counter 10 已收）
-    new_h, new_mask = window_commit(12, 10, [1, 0, 0, 0, 0], 5)
+    new_h, new_mask = _commit(12, 10, [1, 0, 0, 0, 0], 5)
     assert new_h == 12
     # 新顶 counter12 -> offset0；旧 counter10 -> offset (12-10)=2
     assert new_mask == [1, 0, 1, 0, 0]
 
 
 def test_in_window_accept_marks_only_target_bit():
-    new_h, new_mask = window_commit(11, 12, [1, 0, 1, 0, 0], 5)
+    new_h, new_mask = _commit(11, 12, [1, 0, 1, 0, 0], 5)
     assert new_h == 12                      # H 不前移
     assert new_mask == [1, 1, 1, 0, 0]      # 仅 offset(12-11)=1 置位
 
 
 def test_forward_jump_beyond_window_resets():
-    new_h, new_mask = window_commit(100, 10, [1, 1, 1, 1, 1], 5)
+    new_h, new_mask = _commit(100, 10, [1, 1, 1, 1, 1], 5)
     assert new_h == 100
     assert new_mask == [1, 0, 0, 0, 0]      # jump>=W，旧位全部移出
 
 
 def test_duplicate_or_old_leaves_state_unchanged():
-    assert window_commit(11, 12, [1, 1, 1, 0, 0], 5) == (12, [1, 1, 1, 0, 0])  # dup
-    assert window_commit(2, 12, [1, 0, 0, 0, 0], 5) == (12, [1, 0, 0, 0, 0])   # old
+    assert _commit(11, 12, [1, 1, 1, 0, 0], 5) == (12, [1, 1, 1, 0, 0])  # dup
+    assert _commit(2, 12, [1, 0, 0, 0, 0], 5) == (12, [1, 0, 0, 0, 0])   # old
+
+
+def test_huge_forward_jump_does_not_allocate_shift():
+    new_h, new_mask = window_commit(2**62, 10, 0b11111, 4096)
+    assert (new_h, new_mask) == (2**62, 1)
+
+
+def _ref_commit(n, h, bits, w):
+    # 旧 list 版实现，作位图语义对照
+    if n > h:
+        jump = n - h
+        out = [0] * w
+        out[0] = 1
+        for d in range(w):
+            if jump + d < w:
+                out[jump + d] = bits[d]
+        return n, out
+    if h - w + 1 <= n <= h and bits[h - n] == 0:
+        out = list(bits)
+        out[h - n] = 1
+        return h, out
+    return h, list(bits)
+
+
+def test_bitset_matches_list_reference_for_large_windows():
+    rng = random.Random(3)
+    for w in (1, 7, 64, 256, 4096):
+        h, mask, bits = w, 1, [1] + [0] * (w - 1)
+        for _ in range(400):
+            n = max(0, h + rng.randint(-w - 3, w // 2 + 3))
+            ref_decision = (
+                SwDecision.ACCEPT_FORWARD if n > h
+                else SwDecision.REJECT_OLD if n <= h - w
+                else SwDecision.REJECT_DUP if bits[h - n] else SwDecision.ACCEPT_IN_WINDOW
+            )
+            assert classify(n, h, mask, w) is ref_decision
+            if ref_decision in (SwDecision.ACCEPT_FORWARD, SwDecision.ACCEPT_IN_WINDOW):
+                new_h, mask = window_commit(n, h, mask, w)
+                h, bits = _ref_commit(n, h, bits, w)
+                assert new_h == h
+                assert mask_to_bits(mask, w) == bits
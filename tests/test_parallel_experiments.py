@@ -0,0 +1,157 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from replay.core import Mode, SimulationConfig, run_many_experiments, run_paired_experiments
+from replay.core.types import AttackMode
+
+_BASELINE = json.loads(Path("tests/fixtures/engine_baseline.json").read_text())
+# wall-clock timing legitimately differs between serial and pooled runs
+_TIMING_KEYS = {"total_time", "time_per_run"}
+MODES = [Mode.NO_DEFENSE, Mode.ROLLING_MAC, Mode.WINDOW, Mode.CHALLENGE, Mode.OSCORE_LIKE]
+
+
+def _base(attack_mode: AttackMode) -> SimulationConfig:
+    return SimulationConfig(
+        mode=Mode.NO_DEFENSE,
+        attack_mode=attack_mode,
+        num_legit=20,
+        num_replay=30,
+        p_loss=0.1,
+        p_reorder=0.1,
+        window_size=5,
+        g_hard=16,
+        command_set=["UNLOCK", "LOCK", "PING"],
+        command_risk={"UNLOCK": 1.0},
+        risk_high=0.8,
+    )
+
+
+def _comparable(stats_list) -> list[dict]:
+    return [
+        {k: v for k, v in s.as_dict().items() if k not in _TIMING_KEYS} for s in stats_list
+    ]
+
+
+@pytest.mark.parametrize("attack_mode", [AttackMode.POST_RUN, AttackMode.INLINE])
+def test_workers_match_serial_aggregates_exactly(attack_mode):
+    cfg = _base(attack_mode)
+    serial = run_many_experiments(cfg, MODES, runs=11, seed=7, show_progress=False)
+    parallel = run_many_experiments(cfg, MODES, runs=11, seed=7, show_progress=False, workers=3)
+    assert _comparable(parallel) == _comparable(serial)
+
+
+def test_workers_hold_engine_baseline():
+    got = run_many_experiments(
+        _base(AttackMode.POST_RUN),
+        MODES,
+        runs=_BASELINE["runs"],
+        seed=_BASELINE["seed"],
+        show_progress=False,
+        workers=2,
+    )
+    expected = _BASELINE["cases"]["normal/post"]
+    for stats in got:
+        assert stats.legit_accepted == expected[str(stats.mode)]["legit_accepted"]
+        assert stats.attack_accepted == expected[str(stats.mode)]["attack_accepted"]
+
+
+def test_workers_must_be_positive():
+    with pytest.raises(ValueError, match="workers"):
+        run_many_experiments(_base(AttackMode.POST_RUN), [Mode.WINDOW], runs=1, workers=0)
+
+
+@pytest.mark.parametrize("attack_mode", [AttackMode.POST_RUN, AttackMode.INLINE])
+def test_paired_workers_match_serial_including_trace_metadata(attack_mode):
+    cfg = _base(attack_mode)
+    modes = [*MODES, Mode.SW_RESYNC, Mode.HSW_CR]
+    serial = run_paired_experiments(cfg, modes, runs=9, seed=11, show_progress=False)
+    parallel = run_paired_experiments(
+        cfg, modes, runs=9, seed=11, show_progress=False, workers=2
+    )
+    assert _comparable(parallel) == _comparable(serial)
+    assert parallel[0].metadata["trace_digests"] == serial[0].metadata["trace_digests"]
+
+
+def test_paired_workers_hold_engine_baseline():
+    got = run_paired_experiments(
+        _base(AttackMode.INLINE),
+        MODES,
+        runs=_BASELINE["runs"],
+        seed=_BASELINE["seed"],
+        show_progress=False,
+        workers=2,
+    )
+    expected = _BASELINE["cases"]["paired/inline"]
+    for stats in got:
+        assert stats.attack_accepted == expected[str(stats.mode)]["attack_accepted"]
+        assert stats.attack_total == expected[str(stats.mode)]["attack_total"]
+
+
+def test_precompute_is_skipped_when_it_would_evict_itself():
+    from replay.core import TagTable
+    from replay.core.experiment import _batch_tag_table
+
+    config = _base(AttackMode.POST_RUN)
+    warm = _batch_tag_table(config, None, precompute=True)
+    assert len(warm) == 20 * 3
+    small = _batch_tag_table(config, TagTable(max_entries=59), precompute=True)
+    assert len(small) == 0
+
+
+def test_pool_workers_receive_the_tag_table_once():
+    from replay.core import TagTable
+    from replay.core.experiment import _process_pool, _worker_tag_table
+
+    table = TagTable()
+    table.precompute(key="k", tag_bits=64, tokens=range(1, 5), commands=["PING"])
+    with _process_pool(1, table) as executor:
+        installed = executor.submit(_worker_tag_table, None).result()
+    assert installed.export() == table.export()
+    assert _worker_tag_table(None) is None  # the parent process is untouched
+
+
+class _Abort(Exception):
+    pass
+
+
+class _AbortingReporter:
+    min_interval = 0.0
+
+    def start(self, title):
+        pass
+
+    def update(self, update):
+        raise _Abort
+
+    def finish(self):
+        pass
+
+
+@pytest.mark.parametrize("paired", [False, True])
+def test_reporter_abort_cancels_queued_shards(monkeypatch, paired):
+    from replay.core import experiment
+
+    shutdowns = []
+    real_pool = experiment._process_pool
+
+    def recording_pool(workers, table):
+        executor = real_pool(workers, table)
+        real_shutdown = executor.shutdown
+
+        def shutdown(wait=True, *, cancel_futures=False):
+            shutdowns.append(cancel_futures)
+            real_shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        executor.shutdown = shutdown
+        return executor
+
+    monkeypatch.setattr(experiment, "_process_pool", recording_pool)
+    run = run_paired_experiments if paired else run_many_experiments
+    with pytest.raises(_Abort):
+        run(
+            _base(AttackMode.POST_RUN), MODES[:2], 64, seed=1, workers=2,
+            progress=_AbortingReporter(),
+        )
+    assert shutdowns[0] is True
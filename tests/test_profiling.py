@@ -0,0 +1,129 @@
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from replay.api import JobManager, create_app
+from replay.cli import app as cli_app
+from replay.contracts import SimulationSpec
+from replay.services import profile_batch, profile_call, simulate_batch
+
+_VOLATILE = ("total_time", "time_per_run")
+
+
+def _stable(results):
+    payloads = [record.model_dump(mode="json") for record in results]
+    for payload in payloads:
+        for key in _VOLATILE:
+            payload["metadata"].pop(key, None)
+    return payloads
+
+
+def _spec(**overrides):
+    fields = {"modes": ["no_def", "window"], "runs": 4, "seed": 7, "num_legit": 12}
+    fields.update(overrides)
+    return SimulationSpec(**fields)
+
+
+def test_cpu_profile_leaves_results_unchanged_and_writes_pstats(tmp_path):
+    spec = _spec()
+    output = tmp_path / "batch.pstats"
+    batch = profile_batch(spec, "cpu", output=output, top=5)
+
+    assert _stable(batch.results) == _stable(simulate_batch(spec).results)
+    summary = batch.metadata["profile"]
+    assert (summary["kind"], summary["output"], summary["workers"]) == ("cpu", str(output), 1)
+    assert len(summary["top"]) == 5
+    assert summary["top"][0]["tottime"] >= summary["top"][-1]["tottime"]
+    stats = pstats.Stats(str(output))
+    assert stats.total_calls == summary["total_calls"]
+    assert any(function == "_simulate_run" for _, _, function in stats.stats)
+
+
+def test_mem_profile_reports_allocation_sites_and_dumps_a_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPLAY_PROFILE_DIR", str(tmp_path))
+    spec = _spec(modes=["window"])
+    batch = profile_batch(spec, "mem", top=3)
+
+    assert _stable(batch.results) == _stable(simulate_batch(spec).results)
+    summary = batch.metadata["profile"]
+    assert summary["peak_bytes"] > 0
+    assert len(summary["top"]) == 3 and all(row["size_bytes"] > 0 for row in summary["top"])
+    assert summary["output"].startswith(str(tmp_path))
+    assert tracemalloc.Snapshot.load(summary["output"]).traces
+    assert not tracemalloc.is_tracing()
+
+
+def test_default_profile_outputs_are_kept_within_the_byte_budget(tmp_path, monkeypatch):
+    profiles = tmp_path / "profiles"
+    monkeypatch.setenv("REPLAY_PROFILE_DIR", str(profiles))
+    _, kept = profile_call("cpu", lambda: sum(range(1000)))
+    assert Path(kept["output"]).is_file()
+
+    monkeypatch.setenv("REPLAY_PROFILE_MAX_BYTES", "1")
+    explicit = tmp_path / "explicit.pstats"
+    profile_call("cpu", lambda: sum(range(1000)), output=explicit)
+    _, dropped = profile_call("cpu", lambda: sum(range(1000)))
+
+    assert explicit.is_file()
+    assert not Path(kept["output"]).exists() and not Path(dropped["output"]).exists()
+
+
+def test_failed_profile_calls_leave_no_default_output(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPLAY_PROFILE_DIR", str(tmp_path))
+
+    def boom():
+        raise KeyError("boom")
+
+    for kind in ("cpu", "mem"):
+        with pytest.raises(KeyError):
+            profile_call(kind, boom)
+    tracemalloc.start()
+    try:
+        with pytest.raises(RuntimeError, match="already tracing"):
+            profile_call("mem", lambda: None)
+    finally:
+        tracemalloc.stop()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_call_validates_arguments(tmp_path):
+    with pytest.raises(ValueError, match="profile kind"):
+        profile_call("disk", lambda: None, output=tmp_path / "x")
+    with pytest.raises(ValueError, match="top"):
+        profile_call("cpu", lambda: None, output=tmp_path / "x", top=0)
+
+
+def test_cli_profile_writes_the_file_and_excludes_instrument(tmp_path, capsys):
+    output = tmp_path / "run.pstats"
+    argv = ["sim", "run", "--modes", "window", "--runs", "2", "--seed", "1", "--num-legit", "6"]
+
+    assert cli_app.main([*argv, "--profile", "cpu", "--profile-output", str(output)]) == 0
+    assert output.is_file()
+    assert "cpu profile" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        cli_app.main([*argv, "--profile", "cpu", "--instrument"])
+
+
+def test_api_simulation_job_accepts_a_profile_option(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPLAY_PROFILE_DIR", str(tmp_path))
+    payload = _spec(modes=["window"]).model_dump(mode="json")
+    with TestClient(create_app(job_manager=JobManager())) as client:
+        assert client.post(
+            "/api/v1/jobs/simulations?profile=cpu&profile_top=0", json=payload
+        ).status_code == 422
+        job_id = client.post(
+            "/api/v1/jobs/simulations?profile=cpu&profile_top=3", json=payload
+        ).json()["job_id"]
+        deadline = time.monotonic() + 60
+        while (status := client.get(f"/api/v1/jobs/{job_id}").json())["state"] != "succeeded":
+            assert status["state"] in {"queued", "running"} and time.monotonic() < deadline
+            time.sleep(0.02)
+
+    profile = status["result"]["metadata"]["profile"]
+    assert profile["kind"] == "cpu" and len(profile["top"]) == 3
+    assert profile["output"].startswith(str(tmp_path))
@@ -0,0 +1,102 @@
+import io
+import logging
+import queue
+
+from replay.core import (
+    ConsoleProgress,
+    LoggingProgress,
+    Mode,
+    ProgressTracker,
+    ProgressUpdate,
+    QueueProgress,
+    SimulationConfig,
+    run_many_experiments,
+    run_paired_experiments,
+)
+
+
+def _cfg():
+    return SimulationConfig(mode=Mode.WINDOW, num_legit=6, num_replay=6, p_loss=0.1)
+
+
+def _drain(q):
+    events = []
+    while not q.empty():
+        events.append(q.get_nowait())
+    return events
+
+
+class _Recorder:
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self.updates = []
+
+    def update(self, update):
+        self.updates.append(update)
+
+
+def test_tracker_throttles_but_always_sends_the_final_update():
+    recorder = _Recorder(min_interval=3600.0)
+    tracker = ProgressTracker(recorder, "window", 50)
+    for _ in range(50):
+        tracker.advance()
+
+    assert [(u.completed, u.total, u.finished) for u in recorder.updates] == [(50, 50, True)]
+    assert recorder.updates[0].rate > 0
+
+
+def test_queue_reporter_sees_every_mode_of_a_batch():
+    q = queue.Queue()
+    run_many_experiments(
+        _cfg(), [Mode.NO_DEFENSE, Mode.WINDOW], runs=12, seed=1,
+        progress=QueueProgress(q, min_interval=0.0),
+    )
+    events = _drain(q)
+
+    assert events[0] == ("start", "STARTING MONTE CARLO SIMULATION")
+    assert events[-1] == ("finish", None)
+    updates = [payload for kind, payload in events if kind == "update"]
+    assert len(updates) == 24
+    finals = [(u.label, u.completed) for u in updates if u.finished]
+    assert finals == [("no_def", 12), ("window", 12)]
+
+
+def test_parallel_and_paired_batches_report_completed_counts():
+    q = queue.Queue()
+    run_many_experiments(
+        _cfg(), [Mode.WINDOW], runs=16, seed=2, workers=2,
+        progress=QueueProgress(q, min_interval=0.0),
+    )
+    run_paired_experiments(
+        _cfg(), [Mode.NO_DEFENSE, Mode.WINDOW], runs=5, seed=2,
+        progress=QueueProgress(q, min_interval=0.0),
+    )
+    updates = [payload for kind, payload in _drain(q) if kind == "update"]
+
+    assert [u.completed for u in updates if u.label == "window"][-1] == 16
+    assert [u.completed for u in updates if u.label == "paired"] == [1, 2, 3, 4, 5]
+
+
+def test_console_reporter_draws_a_bar_with_throughput():
+    out = io.StringIO()
+    run_many_experiments(_cfg(), [Mode.WINDOW], runs=5, seed=3, progress=ConsoleProgress(out))
+    text = out.getvalue()
+
+    assert "STARTING MONTE CARLO SIMULATION" in text
+    assert "window: [" in text and "5/5 runs" in text and "runs/s)" in text
+    assert text.endswith("\n")
+
+
+def test_logging_reporter_and_quiet_default(caplog, capsys):
+    with caplog.at_level(logging.INFO, logger="replay.progress"):
+        run_paired_experiments(
+            _cfg(), [Mode.WINDOW], runs=3, seed=4, progress=LoggingProgress(min_interval=0.0)
+        )
+    assert "paired: 3/3 runs" in caplog.text
+
+    run_many_experiments(_cfg(), [Mode.WINDOW], runs=3, seed=4, show_progress=False)
+    assert capsys.readouterr().out == ""
+
+
+def test_update_rate_handles_zero_elapsed():
+    assert ProgressUpdate("x", 0, 1, 0.0).rate == 0.0
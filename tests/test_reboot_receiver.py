@@ -38,7 +38,7 @@ def test_reboot_bumps_epoch_and_enters_locked_safe():
 def test_reboot_clears_pending_tables():
     rcv = _receiver()
     rcv.state.last_counter = 50
-    rcv.state.received_mask = [1, 0, 0, 0, 0, 0, 0, 0]
+    rcv.state.received_mask = 1
     rcv.state.resync_pending = ResyncPending(
         nonce_r="r", trigger_counter=5, epoch=0, h_at_challenge=4, ttl_ticks=16, expire_tick=20,
     )
@@ -54,7 +54,7 @@ def test_reboot_clears_pending_tables():
     rcv.state.crit_nonce_seq = 5
     rcv.reboot()
     assert rcv.state.last_counter == -1
-    assert rcv.state.received_mask == []
+    assert rcv.state.received_mask == 0
     assert rcv.state.resync_pending is None
     assert rcv.state.pending_critical == {}
     assert rcv.state.committed_critical == set()
@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from replay.contracts import LabValidationSpec, SimulationSpec, SweepSpec
+from replay.contracts import LabValidationSpec, SimulationSpec, SweepPoint, SweepSpec
 from replay.services import (
     compare_sim_vs_hardware,
     load_lab_validation_artifact,
@@ -89,3 +89,44 @@ def test_run_sweep_supports_mac_tag_bits():
 
     assert len(points) == 6
     assert [point.result.mac_tag_bits for point in points] == [32, 48, 64, 80, 96, 128]
+
+
+def _stable(point):
+    payload = point.model_dump(mode="json")
+    for key in ("total_time", "time_per_run"):
+        payload["result"]["metadata"].pop(key, None)
+    return payload
+
+
+def test_run_sweep_grid_matches_per_point_batches_and_reuses_cells():
+    simulation = SimulationSpec(modes=["no_def", "window"], runs=4, seed=7, num_legit=10)
+    spec = SweepSpec(sweep_type="window", values=[3, 5, 3], simulation=simulation)
+    cache: dict = {}
+
+    points = run_sweep(spec, workers=2, result_cache=cache)
+
+    assert [(p.sweep_value, p.result.mode) for p in points] == [
+        (3, "no_def"), (3, "window"), (5, "no_def"), (5, "window"), (3, "no_def"), (3, "window"),
+    ]
+    # the repeated window=3 point reuses both of its cells: 2 values x 2 modes
+    assert len(cache) == 4
+    expected = [
+        SweepPoint(sweep_type="window", sweep_value=value, result=result)
+        for value in (3, 5, 3)
+        for result in simulate_batch(simulation.model_copy(update={"window_size": value})).results
+    ]
+    assert [_stable(p) for p in points] == [_stable(p) for p in expected]
+
+    again = run_sweep(spec, result_cache=cache)
+    assert [_stable(p) for p in again] == [_stable(p) for p in points]
+
+
+def test_run_sweep_never_caches_unseeded_cells():
+    cache: dict = {}
+    spec = SweepSpec(
+        sweep_type="p_loss",
+        values=[0.1, 0.1],
+        simulation=SimulationSpec(modes=["no_def"], runs=2),
+    )
+    assert len(run_sweep(spec, result_cache=cache)) == 2
+    assert cache == {}
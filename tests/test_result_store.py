@@ -0,0 +1,133 @@
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from replay.api import create_app
+from replay.cli import app as cli_app
+from replay.contracts import SimulationSpec, SweepSpec
+from replay.services import ResultStore, result_cache_key, run_sweep, simulate_batch
+from replay.services import simulation as simulation_module
+
+_VOLATILE = ("total_time", "time_per_run")
+
+
+def _stable(batch):
+    results = []
+    for record in batch.results:
+        payload = record.model_dump(mode="json")
+        for key in _VOLATILE:
+            payload["metadata"].pop(key, None)
+        results.append(payload)
+    return results
+
+
+def _spec(**overrides):
+    fields = {"modes": ["no_def", "window"], "runs": 4, "seed": 11, "num_legit": 10}
+    fields.update(overrides)
+    return SimulationSpec(**fields)
+
+
+def test_store_roundtrip_and_corrupt_files_read_as_missing(tmp_path):
+    store = ResultStore(tmp_path)
+    record = simulate_batch(_spec(modes=["window"])).results[0]
+
+    store["abc"] = record
+    assert store["abc"] == record
+    assert list(store) == ["abc"] and len(store) == 1 and "abc" in store
+
+    store.path_for("abc").write_text("{not json", encoding="utf-8")
+    assert store.get("abc") is None
+    assert (store.hits, store.misses) == (1, 1)
+    del store["abc"]
+    assert len(store) == 0
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    record = simulate_batch(_spec(modes=["window"])).results[0]
+    store = ResultStore(tmp_path)
+    for index, key in enumerate(["a", "b", "c"]):
+        store[key] = record
+        os.utime(store.path_for(key), (1000 + index, 1000 + index))
+    store["a"]  # touch: "b" is now the least recently used
+    size = store.path_for("a").stat().st_size
+
+    assert store.evict(max_bytes=2 * size) == 1
+    assert sorted(store) == ["a", "c"]
+    with pytest.raises(ValueError, match="max_bytes"):
+        ResultStore(tmp_path, max_bytes=-1)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{}, {"paired": True}, {"target_ci_half_width": 0.2, "max_runs": 60}],
+    ids=["live", "paired", "target_ci"],
+)
+def test_batch_hits_cache_per_mode_with_identical_results(tmp_path, overrides):
+    store = ResultStore(tmp_path)
+    spec = _spec(**overrides)
+    uncached = simulate_batch(spec)
+
+    first = simulate_batch(spec, result_cache=store)
+    second = simulate_batch(spec, result_cache=store)
+
+    assert first.metadata["result_cache_misses"] == 2
+    assert (second.metadata["result_cache_hits"], second.metadata["result_cache_misses"]) == (2, 0)
+    assert _stable(first) == _stable(uncached) == _stable(second)
+
+    # a batch adding one mode only simulates that mode
+    wider_spec = _spec(modes=["no_def", "window", "challenge"], **overrides)
+    wider = simulate_batch(wider_spec, result_cache=store)
+    assert (wider.metadata["result_cache_hits"], wider.metadata["result_cache_misses"]) == (2, 1)
+    assert _stable(wider) == _stable(simulate_batch(wider_spec))
+
+
+def test_unseeded_batches_bypass_the_cache(tmp_path):
+    store = ResultStore(tmp_path)
+    batch = simulate_batch(_spec(seed=None), result_cache=store)
+
+    assert batch.metadata["result_cache_bypassed"] is True
+    assert len(store) == 0
+
+
+def test_key_ignores_workers_and_tracks_engine_version(monkeypatch):
+    spec = _spec()
+    key = result_cache_key(spec)
+    assert result_cache_key(spec.model_copy(update={"workers": 4})) == key
+
+    monkeypatch.setattr(simulation_module, "ENGINE_VERSION", simulation_module.ENGINE_VERSION + 1)
+    assert result_cache_key(spec) != key
+
+
+def test_sweep_cells_and_batches_share_entries(tmp_path):
+    store = ResultStore(tmp_path)
+    simulation = _spec()
+    run_sweep(SweepSpec(sweep_type="window", values=[5], simulation=simulation),
+              result_cache=store)
+
+    batch = simulate_batch(simulation.model_copy(update={"window_size": 5}), result_cache=store)
+    assert batch.metadata["result_cache_hits"] == 2
+    assert [record.metadata["total_runs"] for record in batch.results] == [8, 8]
+
+
+def test_api_serves_repeat_requests_from_the_store(tmp_path):
+    payload = _spec().model_dump(mode="json")
+    with TestClient(create_app(result_cache=ResultStore(tmp_path))) as client:
+        first = client.post("/api/v1/simulations", json=payload).json()
+        second = client.post("/api/v1/simulations", json=payload).json()
+
+    assert first["metadata"]["result_cache_misses"] == 2
+    assert second["metadata"]["result_cache_hits"] == 2
+    assert second["results"] == first["results"]
+
+
+def test_cli_cache_commands_target_the_result_store(tmp_path, capsys):
+    simulate_batch(_spec(), result_cache=ResultStore(tmp_path))
+
+    assert cli_app.main(["cache", "info", "--kind", "results", "--dir", str(tmp_path)]) == 0
+    info = json.loads(capsys.readouterr().out)
+    assert (info["kind"], info["entries"]) == ("results", 2)
+
+    assert cli_app.main(["cache", "clear", "--kind", "results", "--dir", str(tmp_path)]) == 0
+    assert json.loads(capsys.readouterr().out)["removed"] == 2
@@ -1,6 +1,7 @@
 import random
 
 from replay.core.kernel.mac_domains import resync_confirm_tag
+from replay.core.kernel.window_commit import mask_to_bits
 from sim.receiver import Receiver
 from sim.security import compute_mac
 from sim.types import Frame, Mode
@@ -45,7 +46,7 @@ def test_resync_seals_skipped_window_counters():  # H2
     r = _pending_recv(200)
     r.process_resync_confirm(_valid_confirm(r, 200), now_tick=10)
     assert r.state.last_counter == 200
-    assert r.state.received_mask == [1] * W
+    assert mask_to_bits(r.state.received_mask, W) == [1] * W
     assert r.state.resync_pending is None
 
 
@@ -96,4 +97,4 @@ def test_confirm_with_new_h_below_trigger_rejected():
     assert res.reason == "resync_counter_mismatch"
     assert r.state.resync_pending is not None                   # 保持 PENDING
     assert r.state.last_counter == 10                           # 窗口未回退
-    assert r.state.received_mask == [1, 0, 0, 0, 0]
+    assert mask_to_bits(r.state.received_mask, W) == [1, 0, 0, 0, 0]
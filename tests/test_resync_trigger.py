@@ -20,7 +20,7 @@ def test_trigger_enters_pending_without_window_mutation():
     r = _recv()
     r.process(_frame(10))                      # H=10
     before_h = r.state.last_counter
-    before_mask = list(r.state.received_mask)
+    before_mask = r.state.received_mask
     res = r.process(_frame(100))               # jump=90 > g_hard -> resync_required
     assert not res.accepted and res.reason == "resync_required"
     assert r.state.last_counter == before_h           # H1：状态未变
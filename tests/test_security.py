@@ -1,6 +1,9 @@
+import hashlib
+import hmac
+
 import pytest
 
-from replay.core.security import compute_mac_bits
+from replay.core.security import TagTable, compute_mac, compute_mac_bits
 
 
 def test_compute_mac_bits_length():
@@ -9,3 +12,41 @@ def test_compute_mac_bits_length():
     assert len(tag) == 20
     with pytest.raises(ValueError):
         compute_mac_bits(5, "CMD", key="k", tag_bits=81)
+
+
+def test_tag_table_matches_uncached_tags_and_counts_hits():
+    table = TagTable()
+    first = table.tag(5, "CMD", key="k", tag_bits=80)
+    again = table.tag(5, "CMD", key="k", tag_bits=80)
+    assert first == again == compute_mac_bits(5, "CMD", key="k", tag_bits=80)
+    assert (table.hits, table.misses) == (1, 1)
+    # tag_bits 与 key 都参与键：不同截断/不同密钥不串用
+    assert table.tag(5, "CMD", key="k", tag_bits=40) == first[:10]
+    assert table.tag(5, "CMD", key="k2", tag_bits=80) != first
+    assert table.misses == 3
+
+
+def test_tag_table_is_bounded_lru():
+    table = TagTable(max_entries=2)
+    table.tag(1, "A", key="k", tag_bits=80)
+    table.tag(2, "A", key="k", tag_bits=80)
+    table.tag(1, "A", key="k", tag_bits=80)  # 1 变为最近使用
+    table.tag(3, "A", key="k", tag_bits=80)  # 淘汰 2
+    assert len(table) == 2 and table.evictions == 1
+    table.tag(1, "A", key="k", tag_bits=80)
+    assert table.hits == 2
+
+
+def test_tag_table_precompute_and_export_seed_a_warm_table():
+    table = TagTable()
+    table.precompute(key="k", tag_bits=80, tokens=range(1, 4), commands=["A", "B"])
+    assert len(table) == 6 and (table.hits, table.misses) == (0, 0)
+    warm = TagTable(entries=table.export())
+    assert warm.tag(2, "B", key="k", tag_bits=80) == compute_mac_bits(2, "B", key="k", tag_bits=80)
+    assert (warm.hits, warm.misses) == (1, 0)
+
+
+def test_compute_mac_matches_plain_hmac():
+    expected = hmac.new(b"k", b"7|OPEN", hashlib.sha256).hexdigest()
+    assert compute_mac(7, "OPEN", key="k", mac_length=0) == expected
+    assert compute_mac_bits(7, "OPEN", key="k", tag_bits=80) == expected[:20]
@@ -1,5 +1,6 @@
 import random
 
+from replay.core.kernel.window_commit import mask_to_bits
 from sim.receiver import Receiver
 from sim.security import compute_mac
 from sim.sender import Sender
@@ -33,7 +34,7 @@ def test_sender_confirm_uses_tx_counter_as_new_h_and_receiver_commits():
     res = r.process_resync_confirm(confirm, now_tick=10)
     assert res.reason == "resync_committed"                  # 两侧 tag 输入对齐 -> 通过
     assert r.state.last_counter == 200
-    assert r.state.received_mask == [1] * W
+    assert mask_to_bits(r.state.received_mask, W) == [1] * W
 
 
 def test_sender_confirm_does_not_borrow_old_h_as_new_h():
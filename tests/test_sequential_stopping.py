@@ -0,0 +1,109 @@
+import pytest
+
+from replay.core import (
+    Mode,
+    SimulationConfig,
+    run_modes_until_precision,
+    run_until_precision,
+)
+
+MODES = [Mode.NO_DEFENSE, Mode.WINDOW]
+
+
+def _cfg() -> SimulationConfig:
+    return SimulationConfig(
+        mode=Mode.WINDOW, num_legit=12, num_replay=12, p_loss=0.2, p_reorder=0.2
+    )
+
+
+def _key(stats):
+    return [(s.mode, s.runs, s.avg_attack_rate, s.std_attack_rate, s.attack_total) for s in stats]
+
+
+def test_multi_mode_driver_matches_single_mode_stopping():
+    singles = [
+        run_until_precision(
+            _cfg(), mode=mode, target_half_width=0.03, max_runs=400, seed=11, min_runs=10
+        )[0]
+        for mode in MODES
+    ]
+    batched = run_modes_until_precision(
+        _cfg(), MODES, target_half_width=0.03, max_runs=400, seed=11, min_runs=10, batch_size=17
+    )
+    assert _key(batched) == _key(singles)
+    # each mode stops on its own: window's ASR is near 0, so it converges first
+    assert batched[1].runs < batched[0].runs < 400
+
+
+def test_parallel_batches_give_identical_aggregates():
+    kwargs = dict(target_half_width=0.05, max_runs=300, seed=4, min_runs=10)
+    serial = run_modes_until_precision(_cfg(), MODES, **kwargs)
+    parallel = run_modes_until_precision(_cfg(), MODES, workers=2, batch_size=24, **kwargs)
+    assert _key(parallel) == _key(serial)
+
+
+def test_paired_stopping_is_batch_invariant_and_flagged():
+    kwargs = dict(target_half_width=0.06, max_runs=200, seed=2, min_runs=10, paired=True)
+    a = run_modes_until_precision(_cfg(), MODES, batch_size=5, **kwargs)
+    b = run_modes_until_precision(_cfg(), MODES, workers=2, batch_size=40, **kwargs)
+    assert _key(a) == _key(b)
+    assert all(s.metadata["paired"] is True for s in a)
+    assert all(s.metadata["stopping"] == "sequential" for s in a)
+    # each mode lists the traces it ran on: a prefix of the shared sequence
+    no_def, window = a
+    assert len(window.metadata["trace_digests"]) == window.runs
+    assert no_def.metadata["trace_digests"][: window.runs] == window.metadata["trace_digests"]
+    assert a[0].metadata["trace_digests"] == b[0].metadata["trace_digests"]
+
+
+class _Recorder:
+    min_interval = 0.0
+
+    def __init__(self, stop_after=None):
+        self.updates = []
+        self.stop_after = stop_after
+
+    def start(self, title):
+        pass
+
+    def update(self, update):
+        self.updates.append((update.label, update.completed, update.total))
+        if self.stop_after is not None and len(self.updates) >= self.stop_after:
+            raise KeyboardInterrupt
+
+    def finish(self):
+        pass
+
+
+def test_progress_is_reported_per_round_and_can_abort():
+    recorder = _Recorder()
+    stats = run_modes_until_precision(
+        _cfg(), MODES, target_half_width=0.05, max_runs=300, seed=4, min_runs=10,
+        batch_size=20, progress=recorder,
+    )
+    assert max(s.runs for s in stats) < 300
+    assert recorder.updates[0] == ("precision", 20, 300)
+    assert recorder.updates[-1] == ("precision", 300, 300)
+    assert all("total_time" in s.metadata for s in stats)
+
+    aborting = _Recorder(stop_after=1)
+    with pytest.raises(KeyboardInterrupt):
+        run_modes_until_precision(
+            _cfg(), MODES, target_half_width=1e-6, max_runs=300, seed=4, batch_size=20,
+            progress=aborting,
+        )
+    assert len(aborting.updates) == 1
+
+
+def test_max_runs_caps_unconverged_modes():
+    (stats,) = run_modes_until_precision(
+        _cfg(), [Mode.WINDOW], target_half_width=1e-6, max_runs=25, seed=1, batch_size=10
+    )
+    assert stats.runs == 25
+
+
+def test_invalid_batch_size_is_rejected():
+    with pytest.raises(ValueError, match="batch_size"):
+        run_modes_until_precision(
+            _cfg(), MODES, target_half_width=0.1, max_runs=10, seed=1, batch_size=0
+        )
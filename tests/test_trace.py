@@ -1,6 +1,13 @@
+import hashlib
+import json
+import pickle
+import weakref
+
 from replay.core import Mode, SimulationConfig
+from replay.core import trace as trace_module
+from replay.core.columns import BitColumn, CommandColumn, IntColumn
 from replay.core.experiment import run_paired_experiments, simulate_one_run_with_trace
-from replay.core.trace import generate_trace
+from replay.core.trace import ScenarioTrace, generate_trace
 
 
 def test_generated_trace_is_deterministic_under_seed():
@@ -62,3 +69,66 @@ def test_trace_replay_controls_legitimate_drop_count():
     assert result.legit_sent == 10
     assert result.legit_accepted == 10 - trace.legit_drop_count
     assert result.metadata["trace_digest"] == trace.digest()
+
+
+def test_columns_index_slice_and_compare_like_lists():
+    bits = [True, False, True, True, False, False, True, False, True, True]
+    col = BitColumn.from_bools(bits)
+    assert col == bits and col[3] is True and col[-1] is True
+    view = col[3:9]
+    assert view == bits[3:9] and view._buf is col._buf  # zero-copy view
+    assert view.count_true() == sum(bits[3:9]) and col.count_true() == sum(bits)
+    assert json.loads(view.json_bytes()) == bits[3:9]
+
+    ints = IntColumn.from_ints([0, 7, 255, 3])
+    assert ints == [0, 7, 255, 3] and ints[1:3] == [7, 255]
+    commands = CommandColumn.from_commands(["LOCK", "UNLOCK", "LOCK"])
+    assert commands.vocab == ("LOCK", "UNLOCK") and commands[2] == "LOCK"
+    assert pickle.loads(pickle.dumps(col)) == col
+
+
+def test_trace_coerces_lists_and_keeps_legacy_digest():
+    cfg = SimulationConfig(
+        mode=Mode.WINDOW,
+        num_legit=12,
+        num_replay=6,
+        p_loss=0.3,
+        p_reorder=0.4,
+        attacker_inject_strength="weak",
+    )
+    trace = generate_trace(cfg, seed=3)
+    data = trace.to_lists()
+    legacy = hashlib.sha256(
+        json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()[:12]
+    assert trace.digest() == legacy
+
+    rebuilt = ScenarioTrace(**data)
+    assert isinstance(rebuilt.legit_dropped, BitColumn)
+    assert rebuilt == trace
+    assert rebuilt.digest(mode="raw") == trace.digest(mode="raw") != trace.digest()
+    assert pickle.loads(pickle.dumps(trace)) == trace
+
+
+def test_paired_runs_stream_one_trace_at_a_time(monkeypatch):
+    cfg = SimulationConfig(mode=Mode.WINDOW, num_legit=6, num_replay=4, p_loss=0.2)
+    baseline = run_paired_experiments(
+        cfg, modes=[Mode.WINDOW, Mode.NO_DEFENSE], runs=12, seed=3, show_progress=False
+    )
+    alive: list[weakref.ref] = []
+    peak = 0
+
+    def tracking_generate(config, seed):
+        nonlocal peak
+        trace = generate_trace(config, seed)
+        alive.append(weakref.ref(trace))
+        peak = max(peak, sum(ref() is not None for ref in alive))
+        return trace
+
+    monkeypatch.setattr(trace_module, "generate_trace", tracking_generate)
+    streamed = run_paired_experiments(
+        cfg, modes=[Mode.WINDOW, Mode.NO_DEFENSE], runs=12, seed=3, show_progress=False
+    )
+    assert len(alive) == 12
+    assert peak <= 2  # the new trace plus, at most, the one being released
+    assert [s.as_dict() for s in streamed] == [s.as_dict() for s in baseline]
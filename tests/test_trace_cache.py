@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+from replay.cli import app as cli_app
+from replay.core import Mode, SimulationConfig, TraceCache, run_paired_experiments
+from replay.core.trace import generate_trace
+from replay.core.trace_cache import read_trace_file, trace_key, write_trace_file
+
+
+def _cfg(**kw) -> SimulationConfig:
+    base = dict(
+        mode=Mode.WINDOW,
+        num_legit=30,
+        num_replay=10,
+        p_loss=0.2,
+        p_reorder=0.3,
+        attacker_inject_strength="weak",
+    )
+    base.update(kw)
+    return SimulationConfig(**base)
+
+
+def test_trace_file_roundtrip_is_mmap_backed_and_identical(tmp_path):
+    trace = generate_trace(_cfg(), seed=4)
+    path = tmp_path / "t.trace"
+    write_trace_file(path, trace)
+
+    loaded = read_trace_file(path)
+    assert loaded == trace
+    assert isinstance(loaded.legit_dropped._buf, memoryview)
+    assert loaded.digest() == trace.digest()
+    assert loaded.digest(mode="raw") == trace.digest(mode="raw")
+    assert loaded.legit_drop_count == trace.legit_drop_count
+
+
+def test_trace_key_ignores_receiver_side_fields():
+    cfg = _cfg()
+    assert trace_key(cfg, 1) == trace_key(_cfg(mode=Mode.NO_DEFENSE, window_size=16), 1)
+    assert trace_key(cfg, 1) != trace_key(cfg, 2)
+    assert trace_key(cfg, 1) != trace_key(_cfg(p_loss=0.3), 1)
+
+
+def test_cache_hits_on_second_lookup_and_rejects_corrupt_files(tmp_path):
+    cache = TraceCache(tmp_path)
+    first = cache.get(_cfg(), 9)
+    second = cache.get(_cfg(window_size=8), 9)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first == second
+
+    cache.path_for(trace_key(_cfg(), 9)).write_bytes(b"garbage")
+    assert cache.get(_cfg(), 9) == first
+    assert cache.misses == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = TraceCache(tmp_path)
+    for seed in range(3):
+        cache.get(_cfg(), seed)
+    paths = [cache.path_for(trace_key(_cfg(), seed)) for seed in range(3)]
+    for age, path in enumerate(paths):
+        os.utime(path, (1000 + age, 1000 + age))
+    cache.get(_cfg(), 0)  # hit: seed 0 becomes most recently used
+
+    size = paths[0].stat().st_size
+    assert cache.evict(max_bytes=2 * size) == 1
+    assert not paths[1].exists() and paths[0].exists() and paths[2].exists()
+    assert cache.clear() == 2 and cache.entries() == []
+
+
+def test_paired_results_unchanged_with_cache(tmp_path):
+    cfg = _cfg()
+    modes = [Mode.WINDOW, Mode.SW_RESYNC]
+    plain = run_paired_experiments(cfg, modes, runs=8, seed=2, show_progress=False)
+    cache = TraceCache(tmp_path)
+    for _ in range(2):
+        cached = run_paired_experiments(
+            cfg, modes, runs=8, seed=2, show_progress=False, trace_cache=cache
+        )
+        assert [s.as_dict() for s in cached] == [s.as_dict() for s in plain]
+    assert (cache.misses, cache.hits) == (8, 8)
+
+
+def test_negative_budget_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="max_bytes"):
+        TraceCache(tmp_path, max_bytes=-1)
+
+
+def test_cli_cache_info_and_clear(tmp_path, capsys):
+    TraceCache(tmp_path).get(_cfg(), 1)
+
+    assert cli_app.main(["cache", "info", "--dir", str(tmp_path)]) == 0
+    info = json.loads(capsys.readouterr().out)
+    assert info["entries"] == 1 and info["size_bytes"] > 0
+
+    assert cli_app.main(["cache", "clear", "--dir", str(tmp_path)]) == 0
+    cleared = json.loads(capsys.readouterr().out)
+    assert (cleared["removed"], cleared["entries"]) == (1, 0)
@@ -237,6 +237,7 @@ const DEFAULT_SPEC: SimulationSpec = {
   auth_profile: 'hmac',
   policy_source: 'legacy',
   profile: 'standard',
+  estimator: 'mc',
 };
 
 export function SimulatorPanel() {
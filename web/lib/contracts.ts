@@ -13,7 +13,7 @@ export type Mode =
   | 'oscore_like';
 export type AttackMode = 'post' | 'inline';
 export type ChannelModel = 'iid' | 'gilbert_elliott' | 'trace';
-export type AuthProfile = 'hmac' | 'ascon';
+export type AuthProfile = 'hmac' | 'ascon' | 'symbolic';
 export type AttackerPosition = 'ind' | 'tx' | 'rx';
 export type AttackerStrength = 'strong' | 'weak';
 export type AttackerStrategy =
@@ -21,6 +21,7 @@ export type AttackerStrategy =
   | 'adaptive_lostframe'
   | 'adaptive_resync'
   | 'adaptive_critical';
+export type Estimator = 'mc' | 'hybrid';
 
 export interface SimulationSpec {
   schema_version: typeof SCHEMA_VERSION;
@@ -50,6 +51,7 @@ export interface SimulationSpec {
   target_ci_half_width?: number | null;
   max_runs: number;
   paired: boolean;
+  workers: number;
   channel_model: ChannelModel;
   burst_p_good_to_bad: number;
   burst_p_bad_to_good: number;
@@ -61,6 +63,7 @@ export interface SimulationSpec {
   auth_profile: AuthProfile;
   policy_source: 'legacy' | 'default_table';
   profile: 'strict' | 'standard' | 'permissive';
+  estimator: Estimator;
 }
 
 export interface SimulationSpecPublic {
@@ -90,6 +93,7 @@ export interface SimulationSpecPublic {
   target_ci_half_width?: number | null;
   max_runs: number;
   paired: boolean;
+  workers: number;
   channel_model: ChannelModel;
   burst_p_good_to_bad: number;
   burst_p_bad_to_good: number;
@@ -101,6 +105,7 @@ export interface SimulationSpecPublic {
   auth_profile: AuthProfile;
   policy_source: 'legacy' | 'default_table';
   profile: 'strict' | 'standard' | 'permissive';
+  estimator: Estimator;
 }
 
 export interface SimulationResultRecord {
@@ -163,6 +168,23 @@ export interface SweepSpec {
   fixed_p_reorder?: number | null;
 }
 
+export type JobState = 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled';
+
+export interface JobStatus {
+  schema_version: typeof SCHEMA_VERSION;
+  job_id: string;
+  kind: 'simulation' | 'sweep';
+  state: JobState;
+  submitted_at: string;
+  started_at?: string | null;
+  finished_at?: string | null;
+  completed: number;
+  total: number;
+  cancel_requested: boolean;
+  result?: Record<string, unknown> | null;
+  error?: string | null;
+}
+
 export interface ExperimentArtifact {
   schema_version: typeof SCHEMA_VERSION;
   artifact_id: string;
@@ -463,6 +485,13 @@ export const jsonSchemas = {
         "title": "Paired",
         "type": "boolean"
       },
+      "workers": {
+        "default": 1,
+        "maximum": 64,
+        "minimum": 1,
+        "title": "Workers",
+        "type": "integer"
+      },
       "channel_model": {
         "default": "iid",
         "enum": [
@@ -542,7 +571,8 @@ export const jsonSchemas = {
         "default": "hmac",
         "enum": [
           "hmac",
-          "ascon"
+          "ascon",
+          "symbolic"
         ],
         "title": "Auth Profile",
         "type": "string"
@@ -565,6 +595,15 @@ export const jsonSchemas = {
         ],
         "title": "Profile",
         "type": "string"
+      },
+      "estimator": {
+        "default": "mc",
+        "enum": [
+          "mc",
+          "hybrid"
+        ],
+        "title": "Estimator",
+        "type": "string"
       }
     },
     "title": "SimulationSpec",
@@ -773,6 +812,11 @@ export const jsonSchemas = {
         "title": "Paired",
         "type": "boolean"
       },
+      "workers": {
+        "default": 1,
+        "title": "Workers",
+        "type": "integer"
+      },
       "channel_model": {
         "title": "Channel Model",
         "type": "string"
@@ -849,6 +893,15 @@ export const jsonSchemas = {
         ],
         "title": "Profile",
         "type": "string"
+      },
+      "estimator": {
+        "default": "mc",
+        "enum": [
+          "mc",
+          "hybrid"
+        ],
+        "title": "Estimator",
+        "type": "string"
       }
     },
     "required": [
@@ -1289,6 +1342,11 @@ export const jsonSchemas = {
             "title": "Paired",
             "type": "boolean"
           },
+          "workers": {
+            "default": 1,
+            "title": "Workers",
+            "type": "integer"
+          },
           "channel_model": {
             "title": "Channel Model",
             "type": "string"
@@ -1365,6 +1423,15 @@ export const jsonSchemas = {
             ],
             "title": "Profile",
             "type": "string"
+          },
+          "estimator": {
+            "default": "mc",
+            "enum": [
+              "mc",
+              "hybrid"
+            ],
+            "title": "Estimator",
+            "type": "string"
           }
         },
         "required": [
@@ -1681,6 +1748,13 @@ export const jsonSchemas = {
             "title": "Paired",
             "type": "boolean"
           },
+          "workers": {
+            "default": 1,
+            "maximum": 64,
+            "minimum": 1,
+            "title": "Workers",
+            "type": "integer"
+          },
           "channel_model": {
             "default": "iid",
             "enum": [
@@ -1760,7 +1834,8 @@ export const jsonSchemas = {
             "default": "hmac",
             "enum": [
               "hmac",
-              "ascon"
+              "ascon",
+              "symbolic"
             ],
             "title": "Auth Profile",
             "type": "string"
@@ -1783,6 +1858,15 @@ export const jsonSchemas = {
             ],
             "title": "Profile",
             "type": "string"
+          },
+          "estimator": {
+            "default": "mc",
+            "enum": [
+              "mc",
+              "hybrid"
+            ],
+            "title": "Estimator",
+            "type": "string"
           }
         },
         "title": "SimulationSpec",
@@ -1856,6 +1940,118 @@ export const jsonSchemas = {
     "title": "SweepSpec",
     "type": "object"
   },
+  "JobStatus": {
+    "description": "State of an asynchronous simulation/sweep job; ``result`` is set once it succeeds.",
+    "properties": {
+      "schema_version": {
+        "const": "2026-03-16",
+        "default": "2026-03-16",
+        "title": "Schema Version",
+        "type": "string"
+      },
+      "job_id": {
+        "title": "Job Id",
+        "type": "string"
+      },
+      "kind": {
+        "enum": [
+          "simulation",
+          "sweep"
+        ],
+        "title": "Kind",
+        "type": "string"
+      },
+      "state": {
+        "default": "queued",
+        "enum": [
+          "queued",
+          "running",
+          "succeeded",
+          "failed",
+          "cancelled"
+        ],
+        "title": "State",
+        "type": "string"
+      },
+      "submitted_at": {
+        "format": "date-time",
+        "title": "Submitted At",
+        "type": "string"
+      },
+      "started_at": {
+        "anyOf": [
+          {
+            "format": "date-time",
+            "type": "string"
+          },
+          {
+            "type": "null"
+          }
+        ],
+        "default": null,
+        "title": "Started At"
+      },
+      "finished_at": {
+        "anyOf": [
+          {
+            "format": "date-time",
+            "type": "string"
+          },
+          {
+            "type": "null"
+          }
+        ],
+        "default": null,
+        "title": "Finished At"
+      },
+      "completed": {
+        "default": 0,
+        "title": "Completed",
+        "type": "integer"
+      },
+      "total": {
+        "default": 0,
+        "title": "Total",
+        "type": "integer"
+      },
+      "cancel_requested": {
+        "default": false,
+        "title": "Cancel Requested",
+        "type": "boolean"
+      },
+      "result": {
+        "anyOf": [
+          {
+            "additionalProperties": true,
+            "type": "object"
+          },
+          {
+            "type": "null"
+          }
+        ],
+        "default": null,
+        "title": "Result"
+      },
+      "error": {
+        "anyOf": [
+          {
+            "type": "string"
+          },
+          {
+            "type": "null"
+          }
+        ],
+        "default": null,
+        "title": "Error"
+      }
+    },
+    "required": [
+      "job_id",
+      "kind"
+    ],
+    "title": "JobStatus",
+    "type": "object"
+  },
   "ExperimentArtifact": {
     "properties": {
       "schema_version": {
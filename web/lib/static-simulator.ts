@@ -374,6 +374,7 @@ function publicSpec(spec: SimulationSpec): SimulationSpecPublic {
     auth_profile: spec.auth_profile,
     policy_source: spec.policy_source,
     profile: spec.profile,
+    estimator: spec.estimator,
   };
 }
 